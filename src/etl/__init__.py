@@ -1,5 +1,6 @@
 # Public API
 from etl.edl import ExtractDeleteAndLoad
+from etl.watermarks import WatermarkStore
 
-__all__ = ["ExtractDeleteAndLoad"]
+__all__ = ["ExtractDeleteAndLoad", "WatermarkStore"]
 
@@ -1,10 +1,18 @@
 # Import modules
 import logging
+import threading
+
+# Import submodules
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # Import third-party modules
+import pandas as pd
 import sqlalchemy  # noqa: F401  (re-exported for caller convenience)
 
 # Import custom modules
+from etl_tools.cache import QueryResultCache
+from etl_tools.execution import iter_from_workers
 from etl_tools.sql import (
     SQLALCHEMY_DTYPES,
     resolve_sqlalchemy_dtype,
@@ -13,6 +21,7 @@ from etl_tools.sql import (
     sql_read_data,
     sql_upload_data,
 )
+from etl.watermarks import WatermarkStore
 
 
 # Module-level logger
@@ -34,6 +43,38 @@ _ALLOWED_CONN_TYPES: frozenset[str] = frozenset(
     }
 )
 
+def _kwarg_spellings(*names: str) -> frozenset[str]:
+    """Return both spellings (``name`` and ``f"{name}s"``) that
+    :meth:`ExtractDeleteAndLoad._kwargs_or_config` accepts for each name."""
+    return frozenset(spelling for name in names for spelling in (name, f"{name}s"))
+
+
+# Keyword arguments :meth:`ExtractDeleteAndLoad._read_key` and
+# :meth:`ExtractDeleteAndLoad._upload_key` consume themselves (everything else
+# is forwarded to ``sql_read_data``/``sql_upload_data`` and from there to the
+# engine factory)
+_SHARED_KEY_KWARGS: frozenset[str] = _kwarg_spellings(
+    "custom_conn_str", "connect_arg"
+) | {"mode", "name", "max_n_try", "log_file_path"}
+_READ_KEY_KWARGS: frozenset[str] = (
+    _SHARED_KEY_KWARGS
+    | _kwarg_spellings("chunksize", "partition_column", "num_partition", "cache_ttl")
+    | {"arrow"}
+)
+_UPLOAD_KEY_KWARGS: frozenset[str] = (
+    _SHARED_KEY_KWARGS
+    | _kwarg_spellings("chunksize", "method", "batch_row", "executor", "upsert_key")
+    | {"dtypes_dict", "n_jobs", "create_schema"}
+)
+
+# Keyword arguments :meth:`ExtractDeleteAndLoad.transfer` forwards to the read
+# side and to the upload side (options in both sets reach both sides;
+# ``chunksize`` applies to the upload, the read uses ``read_chunksize``)
+_TRANSFER_READ_KWARGS: frozenset[str] = (
+    _READ_KEY_KWARGS - _kwarg_spellings("chunksize")
+) | {"lower_bound", "upper_bound"}
+_TRANSFER_UPLOAD_KWARGS: frozenset[str] = _UPLOAD_KEY_KWARGS | {"spark_mode"}
+
 
 def _render_stmt(stmt: str, extra_vars: dict | None) -> str:
     """Safely render a SQL template using ``str.format`` (no ``eval``).
@@ -106,6 +147,10 @@ class ExtractDeleteAndLoad(object):
                     * ``<process_name>_chunksizes_dict``
                     * ``<process_name>_methods_dict``
 
+                plus ``download_watermark_columns_dict`` (and optionally
+                ``download_watermark_initial_values_dict``) for incremental
+                extraction, see :meth:`read_data`.
+
             conn_dict (dict | None): Mapping ``<conn_type>_<conn_name> -> conn info``.
             sqlalchemy_dict (dict | None): User-supplied alias-to-type mapping
                 for SQLAlchemy types. Values may be either a type class/callable,
@@ -158,6 +203,13 @@ class ExtractDeleteAndLoad(object):
                 )
         self.sqlalchemy_dtypes = merged_dtypes
 
+        # Incremental extraction state (see read_data / commit_watermarks)
+        self._watermark_store: WatermarkStore | None = None
+        self._pending_watermarks: dict = {}
+        self._watermarks_lock = threading.Lock()
+        self._query_cache: QueryResultCache | None = None
+        self._query_cache_lock = threading.Lock()
+
         # Process metadata
         processes_list = ["download", "delete", "truncate", "upload"]
         self.conn_info_dict: dict = {key: {} for key in processes_list}
@@ -207,14 +259,123 @@ class ExtractDeleteAndLoad(object):
 
     def _kwargs_or_config(self, process: str, key: str, name: str,
                           default, kwargs: dict):
-        """Resolve a per-call kwarg, falling back to per-key config, then default."""
+        """Resolve a per-call kwarg, falling back to per-key config, then default.
+
+        The kwarg may be given as ``name`` or in its plural form (e.g.
+        ``batch_rows`` for ``upload_batch_rows_dict``).
+        """
         cfg_key = f"{process}_{name}s_dict"
         if name in kwargs:
             return kwargs[name]
+        if f"{name}s" in kwargs:
+            return kwargs[f"{name}s"]
         if cfg_key in self.configs_dict and key in self.configs_dict[cfg_key]:
             return self.configs_dict[cfg_key][key]
         return default
 
+    def _get_watermark_store(self) -> WatermarkStore:
+        """Lazily open the watermark store configured by the top-level
+        ``watermark_store_path`` / ``watermark_namespace`` values."""
+        with self._watermarks_lock:
+            if self._watermark_store is None:
+                self._watermark_store = WatermarkStore(
+                    self.configs_dict.get(
+                        "watermark_store_path", "state/watermarks.db"
+                    ),
+                    namespace=self.configs_dict.get("watermark_namespace", ""),
+                )
+        return self._watermark_store
+
+    def _get_query_cache(self) -> QueryResultCache:
+        """Lazily open the download result cache configured by the top-level
+        ``query_cache_dir`` / ``query_cache_max_bytes`` values. Entries live
+        as long as the longest ``download_cache_ttls_dict`` TTL.
+
+        Cached results are written unencrypted, so ``query_cache_dir`` has
+        no default and must be given explicitly.
+        """
+        with self._query_cache_lock:
+            if self._query_cache is None:
+                cache_dir = self.configs_dict.get("query_cache_dir")
+                if not cache_dir:
+                    raise ValueError(
+                        "download_cache_ttls_dict is set but query_cache_dir is "
+                        "not: the query result cache needs an explicit "
+                        "directory (results are stored unencrypted)."
+                    )
+                ttls = (self.configs_dict.get("download_cache_ttls_dict") or {}).values()
+                self._query_cache = QueryResultCache(
+                    cache_dir,
+                    ttl=max(list(ttls) or [3600]),
+                    max_bytes=self.configs_dict.get(
+                        "query_cache_max_bytes", 10 * 1024**3
+                    ),
+                )
+        return self._query_cache
+
+    def _watermark_column(self, key: str) -> str | None:
+        """Return the cursor column of a key, or ``None`` (full extraction)."""
+        return (self.configs_dict.get("download_watermark_columns_dict") or {}).get(
+            key
+        )
+
+    def _watermark_vars(self, key: str, raw_stmt: str) -> dict:
+        """Return ``{"watermark": <last committed value>}`` for an
+        incremental key (``{}`` otherwise)."""
+        column = self._watermark_column(key)
+        if not column:
+            return {}
+        if "{watermark}" not in raw_stmt:
+            logger.warning(
+                f"Watermark column configured for {key} but its download "
+                "statement has no '{watermark}' placeholder"
+            )
+        value = self._get_watermark_store().get(key)
+        if value is None:
+            initial_values = (
+                self.configs_dict.get("download_watermark_initial_values_dict")
+                or {}
+            )
+            if key not in initial_values:
+                raise ValueError(
+                    f"No watermark stored for '{key}' and no "
+                    "download_watermark_initial_values_dict entry to start from."
+                )
+            value = initial_values[key]
+        logger.info(f"     Watermark {key}.{column} > {value}")
+        return {"watermark": value}
+
+    @staticmethod
+    def _max_cursor(df, column: str):
+        """Maximum non-null value of ``column`` (matched case-insensitively,
+        since some drivers upper-case names), or ``None``."""
+        matches = [col for col in df.columns if str(col).lower() == column.lower()]
+        if not matches:
+            raise KeyError(f"Watermark column '{column}' not in downloaded data")
+        values = df[matches[0]].dropna()
+        return None if values.empty else values.max()
+
+    def _stage_watermark(self, key: str, column: str, value) -> None:
+        """Remember a key's new watermark until :meth:`commit_watermarks`."""
+        if value is None:
+            return
+        with self._watermarks_lock:
+            self._pending_watermarks[key] = (column, value)
+
+    def _watermarked_chunks(self, key: str, column: str, chunks):
+        """Pass chunks through, staging the running maximum of ``column`` once
+        the iterator is exhausted (an abandoned read stages nothing)."""
+        best = None
+        try:
+            for chunk in chunks:
+                value = self._max_cursor(chunk, column)
+                if value is not None and (best is None or value > best):
+                    best = value
+                yield chunk
+        finally:
+            chunks.close()
+        self._stage_watermark(key, column, best)
+
     def _build_dtypes_dict(self, key: str) -> dict:
         """Translate a column->dtype-spec dict to SQLAlchemy dtype instances."""
         col_dict = self.configs_dict["upload_python_to_sql_dtypes_dict"][key]
@@ -228,181 +389,520 @@ class ExtractDeleteAndLoad(object):
     # ------------------------------------------------------------------ #
 
     def delete_data(self, **kwargs):
-        """Delete data from each configured ``delete`` connection."""
+        """Delete data from each configured ``delete`` connection.
+
+        Keys run concurrently when ``max_concurrent_keys`` is greater than
+        ``1`` (see :meth:`_map_keys`).
+        """
         self._require_process("delete")
-        for key in self.configs_dict["delete_connections_dict"].keys():
-            logger.info(f"Deleting data for {key}...")
-            extra_vars = self._get_extra_vars("delete", key)
-            conn_type = self.conn_type_dict["delete"][key]
-            conn_dict = self.conn_info_dict["delete"][key]
-            raw_stmt = self.configs_dict["delete_sql_stmts_dict"][key]
-            stmt = _render_stmt(raw_stmt, extra_vars)
-            logger.info(f"     Delete query: {stmt}")
-            try:
-                sql_exec_stmt(
-                    stmt,
-                    conn_dict,
-                    mode=kwargs.get("mode", conn_type),
-                    **{k: v for k, v in kwargs.items() if k != "mode"},
-                )
-            except Exception as e:
-                logger.error(f"Error deleting data: {type(e).__name__} - {e}")
-                raise
+        kwargs, workers = self._split_concurrency_kwargs(kwargs)
+        self._map_keys(
+            "delete",
+            self.configs_dict["delete_connections_dict"].keys(),
+            lambda key: self._exec_key("delete", key, kwargs),
+            **workers,
+        )
 
     def truncate_data(self, **kwargs):
-        """Truncate data from each configured ``truncate`` connection."""
+        """Truncate data from each configured ``truncate`` connection.
+
+        Keys run concurrently when ``max_concurrent_keys`` is greater than
+        ``1`` (see :meth:`_map_keys`).
+        """
         self._require_process("truncate")
-        for key in self.configs_dict["truncate_connections_dict"].keys():
-            logger.info(f"Truncating data for {key}...")
-            extra_vars = self._get_extra_vars("truncate", key)
-            conn_type = self.conn_type_dict["truncate"][key]
-            conn_dict = self.conn_info_dict["truncate"][key]
-            raw_stmt = self.configs_dict["truncate_sql_stmts_dict"][key]
-            stmt = _render_stmt(raw_stmt, extra_vars)
-            logger.info(f"     Truncate query: {stmt}")
-            try:
-                sql_exec_stmt(
-                    stmt,
-                    conn_dict,
-                    mode=kwargs.get("mode", conn_type),
-                    **{k: v for k, v in kwargs.items() if k != "mode"},
-                )
-            except Exception as e:
-                logger.error(f"Error truncating data: {type(e).__name__} - {e}")
-                raise
+        kwargs, workers = self._split_concurrency_kwargs(kwargs)
+        self._map_keys(
+            "truncate",
+            self.configs_dict["truncate_connections_dict"].keys(),
+            lambda key: self._exec_key("truncate", key, kwargs),
+            **workers,
+        )
 
     def read_data(self, **kwargs):
         """Read data from each configured ``download`` connection.
 
         Results are stored in ``self.raw_data`` keyed by the configuration key.
+
+        When a chunk size is configured for a key (``chunksize`` kwarg or
+        ``download_chunksizes_dict``), ``self.raw_data[key]`` holds a lazy
+        iterator of DataFrames with at most that many rows each instead of a
+        single DataFrame. The query runs when the iterator is consumed, so
+        the full result set never has to fit in memory.
+
+        Keys listed in ``download_watermark_columns_dict`` are read
+        incrementally: ``{watermark}`` in their statement renders to the last
+        committed maximum of the configured cursor column (or to
+        ``download_watermark_initial_values_dict[key]`` on the first run),
+        e.g. ``WHERE updated_at > '{watermark}'``. The new maximum is only
+        persisted by :meth:`commit_watermarks`, so call it once the data has
+        been written; :meth:`transfer` commits per key automatically.
+
+        Keys run concurrently when ``max_concurrent_keys`` is greater than
+        ``1`` (see :meth:`_map_keys`).
         """
         self._require_process("download")
-        self.raw_data: dict = {}
-        for key in self.configs_dict["download_connections_dict"].keys():
-            logger.info(f"Downloading data for {key}...")
-            extra_vars = self._get_extra_vars("download", key)
-            conn_type = self.conn_type_dict["download"][key]
-            conn_dict = self.conn_info_dict["download"][key]
-            raw_stmt = self.configs_dict["download_sql_stmts_dict"][key]
-            stmt = _render_stmt(raw_stmt, extra_vars)
-            logger.info(f"     Download query: {stmt}")
-
-            ## Resolve per-call kwargs with sensible config-based defaults
-            custom_conn_str = self._kwargs_or_config(
-                "download", key, "custom_conn_str", None, kwargs
-            )
-            connect_args = self._kwargs_or_config(
-                "download", key, "connect_arg", {}, kwargs
-            )
-            name = (
-                kwargs.get("name")
-                or (self.configs_dict.get("download_tables_dict") or {}).get(key, key)
-            )
-            max_n_try = kwargs.get(
-                "max_n_try", self.configs_dict.get("max_n_try", 3)
-            )
-            log_file_path = kwargs.get(
-                "log_file_path", self.configs_dict.get("log_file_path", "logs")
-            )
+        kwargs, workers = self._split_concurrency_kwargs(kwargs)
+        self.raw_data: dict = self._map_keys(
+            "download",
+            self.configs_dict["download_connections_dict"].keys(),
+            lambda key: self._read_key(key, kwargs),
+            **workers,
+        )
 
-            data = sql_read_data(
-                stmt,
-                conn_dict,
-                custom_conn_str=custom_conn_str,
-                mode=kwargs.get("mode", conn_type),
-                connect_args=connect_args,
-                name=name,
-                max_n_try=max_n_try,
-                log_file_path=log_file_path,
-                **{
-                    k: v
-                    for k, v in kwargs.items()
-                    if k not in (
-                        "custom_conn_str",
-                        "mode",
-                        "connect_args",
-                        "name",
-                        "max_n_try",
-                        "log_file_path",
-                    )
-                },
-            )
-            self.raw_data[key] = data.copy()
+    def commit_watermarks(self, keys=None) -> dict:
+        """Persist the watermarks staged by the last :meth:`read_data`.
+
+        Parameters:
+            keys (list[str] | None): Keys to commit (all staged keys if
+                ``None``).
+
+        Returns:
+            dict: Mapping ``key -> committed watermark``.
+        """
+        with self._watermarks_lock:
+            keys = list(self._pending_watermarks) if keys is None else list(keys)
+            staged = {
+                key: self._pending_watermarks.pop(key)
+                for key in keys
+                if key in self._pending_watermarks
+            }
+        store = self._get_watermark_store() if staged else None
+        return {
+            key: store.set(key, column, value)
+            for key, (column, value) in staged.items()
+        }
+
+    def reset_watermark(self, key: str) -> None:
+        """Forget a key's watermark so its next read is a full extraction."""
+        with self._watermarks_lock:
+            self._pending_watermarks.pop(key, None)
+        self._get_watermark_store().delete(key)
 
     def upload_data(self, data_to_upload: dict, **kwargs):
         """Upload data to each configured ``upload`` connection.
 
+        Keys run concurrently when ``max_concurrent_keys`` is greater than
+        ``1`` (see :meth:`_map_keys`).
+
         Parameters:
-            data_to_upload (dict): Mapping ``key -> pandas.DataFrame``.
+            data_to_upload (dict): Mapping ``key -> pandas.DataFrame`` or
+                ``key -> iterable of DataFrame chunks`` (as stored in
+                ``self.raw_data`` by a chunked :meth:`read_data`). Chunks are
+                uploaded one at a time.
         """
         self._require_process("upload")
-        for key in self.configs_dict["upload_connections_dict"].keys():
-            logger.info(f"Uploading data for {key}...")
-            upload_df = data_to_upload[key]
-            conn_type = self.conn_type_dict["upload"][key]
-            conn_dict = self.conn_info_dict["upload"][key]
-            logger.info(
-                f"     {conn_type.capitalize()} table: "
-                f"{self.configs_dict['upload_tables_dict'][key]}"
-            )
+        kwargs, workers = self._split_concurrency_kwargs(kwargs)
+        self._map_keys(
+            "upload",
+            self.configs_dict["upload_connections_dict"].keys(),
+            lambda key: self._upload_chunks(key, data_to_upload[key], kwargs),
+            **workers,
+        )
+
+    def transfer(self, **kwargs):
+        """Pipe each ``download`` key straight into the ``upload`` target
+        configured under the same key.
+
+        The source is read in chunks by a producer thread and handed to the
+        uploader through a bounded queue, so network reads from the source
+        overlap with writes to the sink and at most ``queue_size`` chunks are
+        held in memory per key. Nothing is stored in ``self.raw_data``.
 
-            ## Build SQLAlchemy dtype dictionary safely
-            col_dict = self.configs_dict["upload_python_to_sql_dtypes_dict"][key]
-            dtypes_dict = self._build_dtypes_dict(key)
-            ## Enforce column ordering defined by the dtype dictionary
-            upload_df = upload_df[list(col_dict.keys())]
+        Parameters:
+            **kwargs: Same keyword arguments as :meth:`read_data` and
+                :meth:`upload_data` (``chunksize`` applies to the upload).
+                Read-only options (e.g. ``arrow``, ``partition_column``) only
+                reach the read, upload-only options (e.g. ``method``,
+                ``n_jobs``) only reach the upload, and connection options
+                reach both; anything else raises ``TypeError``. Plus:
+
+                * ``read_chunksize`` (int): Rows per source chunk. Defaults to
+                  ``download_chunksizes_dict[key]``, then the top-level
+                  ``transfer_chunksize`` config value, then ``100000``.
+                * ``queue_size`` (int): Maximum number of chunks buffered
+                  between reader and uploader. Defaults to the top-level
+                  ``transfer_queue_size`` config value, then ``4``.
+
+        Returns:
+            dict: Mapping ``key -> number of rows uploaded``.
+        """
+        self._require_process("download")
+        self._require_process("upload")
+        kwargs, workers = self._split_concurrency_kwargs(kwargs)
+        upload_keys = self.configs_dict.get("upload_connections_dict") or {}
+        keys = [
+            key
+            for key in self.configs_dict["download_connections_dict"].keys()
+            if key in upload_keys
+        ]
+        return self._map_keys(
+            "transfer",
+            keys,
+            lambda key: self._transfer_key(key, kwargs),
+            server_processes=("download", "upload"),
+            **workers,
+        )
 
-            ## Resolve per-call kwargs with sensible config-based defaults
-            custom_conn_str = self._kwargs_or_config(
-                "upload", key, "custom_conn_str", None, kwargs
-            )
-            connect_args = self._kwargs_or_config(
-                "upload", key, "connect_arg", {}, kwargs
-            )
-            chunksize = self._kwargs_or_config(
-                "upload", key, "chunksize", 100, kwargs
+    # ------------------------------------------------------------------ #
+    # Key scheduling
+    # ------------------------------------------------------------------ #
+
+    def _split_concurrency_kwargs(self, kwargs: dict) -> tuple[dict, dict]:
+        """Separate key-scheduling options from the per-key kwargs.
+
+        ``max_concurrent_keys`` and ``max_connections_per_server`` fall back
+        to the top-level config values of the same name.
+        """
+        workers = {
+            "max_concurrent_keys": kwargs.get(
+                "max_concurrent_keys",
+                self.configs_dict.get("max_concurrent_keys", 1),
+            ),
+            "max_connections_per_server": kwargs.get(
+                "max_connections_per_server",
+                self.configs_dict.get("max_connections_per_server"),
+            ),
+        }
+        rest = {k: v for k, v in kwargs.items() if k not in workers}
+        return rest, workers
+
+    def _server_id(self, process: str, key: str) -> tuple:
+        """Identify the server a key talks to, for per-server limits."""
+        conn_dict = self.conn_info_dict[process][key]
+        return (
+            self.conn_type_dict[process][key],
+            conn_dict.get("server")
+            or conn_dict.get("instance_connection_name")
+            or conn_dict.get("custom_conn_str")
+            or conn_dict.get("database"),
+        )
+
+    def _map_keys(
+        self,
+        process: str,
+        keys,
+        func,
+        max_concurrent_keys: int = 1,
+        max_connections_per_server: int | None = None,
+        server_processes: tuple | None = None,
+    ) -> dict:
+        """Run ``func(key)`` for every key and return ``{key: result}``.
+
+        With ``max_concurrent_keys <= 1`` keys run sequentially in config
+        order. Otherwise they are dispatched to a thread pool (key work is
+        I/O bound). Keys are only submitted once every server they use (see
+        :meth:`_server_id`, for each of ``server_processes``, which defaults
+        to ``(process,)``) runs fewer than ``max_connections_per_server``
+        keys, so a key waiting on a busy server never holds a worker while
+        keys for other servers could run. The first failure stops further
+        keys from starting and is re-raised once running keys finish.
+        """
+        keys = list(keys)
+        if not max_concurrent_keys or max_concurrent_keys <= 1 or len(keys) <= 1:
+            return {key: func(key) for key in keys}
+
+        ## Servers each key holds a connection to while it runs
+        servers = {
+            key: {self._server_id(p, key) for p in server_processes or (process,)}
+            for key in keys
+        }
+        limit = int(max_connections_per_server or 0)
+        n_workers = min(int(max_concurrent_keys), len(keys))
+        active: Counter = Counter()
+        waiting = list(keys)
+        running: dict = {}
+        results: dict = {}
+
+        logger.info(
+            f"Running {len(keys)} {process} key(s) with up to "
+            f"{n_workers} worker(s) "
+            f"(max {max_connections_per_server or 'unlimited'} per server)..."
+        )
+        with ThreadPoolExecutor(
+            max_workers=n_workers, thread_name_prefix=f"edl-{process}"
+        ) as executor:
+            while waiting or running:
+                ### Start waiting keys, in config order, whose servers have room
+                for key in list(waiting):
+                    if len(running) >= n_workers:
+                        break
+                    if limit and any(active[srv] >= limit for srv in servers[key]):
+                        continue
+                    waiting.remove(key)
+                    active.update(servers[key])
+                    running[executor.submit(func, key)] = key
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    active.subtract(servers[key])
+                    ### Raising here leaves the remaining keys unsubmitted
+                    results[key] = future.result()
+        return {key: results[key] for key in keys}
+
+    # ------------------------------------------------------------------ #
+    # Per-key workers
+    # ------------------------------------------------------------------ #
+
+    def _exec_key(self, process: str, key: str, kwargs: dict):
+        """Run the ``delete``/``truncate`` statement for a single key."""
+        action = "Deleting" if process == "delete" else "Truncating"
+        logger.info(f"{action} data for {key}...")
+        extra_vars = self._get_extra_vars(process, key)
+        conn_type = self.conn_type_dict[process][key]
+        conn_dict = self.conn_info_dict[process][key]
+        raw_stmt = self.configs_dict[f"{process}_sql_stmts_dict"][key]
+        stmt = _render_stmt(raw_stmt, extra_vars)
+        logger.info(f"     {process.capitalize()} query: {stmt}")
+        try:
+            return sql_exec_stmt(
+                stmt,
+                conn_dict,
+                mode=kwargs.get("mode", conn_type),
+                **{k: v for k, v in kwargs.items() if k != "mode"},
             )
-            method = self._kwargs_or_config(
-                "upload", key, "method", "multi", kwargs
+        except Exception as e:
+            logger.error(
+                f"Error {action.lower()} data: {type(e).__name__} - {e}"
             )
-            name = kwargs.get("name", self.configs_dict["upload_tables_dict"][key])
-            max_n_try = kwargs.get(
-                "max_n_try", self.configs_dict.get("max_n_try", 3)
+            raise
+
+    def _read_key(self, key: str, kwargs: dict):
+        """Run the ``download`` statement for a single key."""
+        logger.info(f"Downloading data for {key}...")
+        extra_vars = self._get_extra_vars("download", key)
+        conn_type = self.conn_type_dict["download"][key]
+        conn_dict = self.conn_info_dict["download"][key]
+        raw_stmt = self.configs_dict["download_sql_stmts_dict"][key]
+        extra_vars = {**extra_vars, **self._watermark_vars(key, raw_stmt)}
+        stmt = _render_stmt(raw_stmt, extra_vars)
+        logger.info(f"     Download query: {stmt}")
+
+        ## Resolve per-call kwargs with sensible config-based defaults
+        custom_conn_str = self._kwargs_or_config(
+            "download", key, "custom_conn_str", None, kwargs
+        )
+        connect_args = self._kwargs_or_config(
+            "download", key, "connect_arg", {}, kwargs
+        )
+        name = (
+            kwargs.get("name")
+            or (self.configs_dict.get("download_tables_dict") or {}).get(key, key)
+        )
+        max_n_try = kwargs.get(
+            "max_n_try", self.configs_dict.get("max_n_try", 3)
+        )
+        log_file_path = kwargs.get(
+            "log_file_path", self.configs_dict.get("log_file_path", "logs")
+        )
+        ## Keys always hold DataFrames (watermarks and uploads index their
+        ## columns), so Arrow tables are read as Arrow-backed DataFrames
+        arrow = "pandas" if kwargs.get("arrow") == "table" else kwargs.get("arrow")
+        chunksize = self._kwargs_or_config(
+            "download", key, "chunksize", None, kwargs
+        )
+        partition_column = self._kwargs_or_config(
+            "download", key, "partition_column", None, kwargs
+        )
+        num_partitions = self._kwargs_or_config(
+            "download", key, "num_partition", None, kwargs
+        )
+        cache_ttl = self._kwargs_or_config(
+            "download", key, "cache_ttl", None, kwargs
+        )
+
+        ## ``sql_read_data`` returns a fresh object, so no defensive copy is
+        ## needed (it would double peak memory)
+        data = sql_read_data(
+            stmt,
+            conn_dict,
+            custom_conn_str=custom_conn_str,
+            mode=kwargs.get("mode", conn_type),
+            connect_args=connect_args,
+            name=name,
+            max_n_try=max_n_try,
+            log_file_path=log_file_path,
+            chunksize=chunksize,
+            partition_column=partition_column,
+            num_partitions=num_partitions,
+            cache=self._get_query_cache() if cache_ttl is not None else None,
+            cache_ttl=cache_ttl,
+            arrow=arrow,
+            **{
+                k: v
+                for k, v in kwargs.items()
+                if k not in _READ_KEY_KWARGS
+            },
+        )
+
+        ## Stage the new watermark of incremental keys
+        column = self._watermark_column(key)
+        if not column:
+            return data
+        if chunksize:
+            return self._watermarked_chunks(key, column, data)
+        self._stage_watermark(key, column, self._max_cursor(data, column))
+        return data
+
+    def _upload_key(self, key: str, upload_df, kwargs: dict,
+                    create_schema: bool = True):
+        """Upload a DataFrame to the ``upload`` target of a single key.
+
+        A ``create_schema`` kwarg can only disable the schema DDL; chunked
+        callers turn it off themselves after the first chunk.
+        """
+        logger.info(f"Uploading data for {key}...")
+        create_schema = create_schema and kwargs.get("create_schema", True)
+        conn_type = self.conn_type_dict["upload"][key]
+        conn_dict = self.conn_info_dict["upload"][key]
+        logger.info(
+            f"     {conn_type.capitalize()} table: "
+            f"{self.configs_dict['upload_tables_dict'][key]}"
+        )
+
+        ## Build SQLAlchemy dtype dictionary safely
+        col_dict = self.configs_dict["upload_python_to_sql_dtypes_dict"][key]
+        dtypes_dict = self._build_dtypes_dict(key)
+        ## Enforce column ordering defined by the dtype dictionary
+        upload_df = upload_df[list(col_dict.keys())]
+
+        ## Resolve per-call kwargs with sensible config-based defaults
+        custom_conn_str = self._kwargs_or_config(
+            "upload", key, "custom_conn_str", None, kwargs
+        )
+        connect_args = self._kwargs_or_config(
+            "upload", key, "connect_arg", {}, kwargs
+        )
+        chunksize = self._kwargs_or_config(
+            "upload", key, "chunksize", 100, kwargs
+        )
+        method = self._kwargs_or_config(
+            "upload", key, "method", "multi", kwargs
+        )
+        batch_rows = self._kwargs_or_config(
+            "upload", key, "batch_row", None, kwargs
+        )
+        executor = self._kwargs_or_config(
+            "upload", key, "executor", "process", kwargs
+        )
+        upsert_keys = self._kwargs_or_config(
+            "upload", key, "upsert_key", None, kwargs
+        )
+        name = kwargs.get("name", self.configs_dict["upload_tables_dict"][key])
+        max_n_try = kwargs.get(
+            "max_n_try", self.configs_dict.get("max_n_try", 3)
+        )
+        n_jobs = kwargs.get("n_jobs", self.configs_dict.get("n_parallel", -1))
+        log_file_path = kwargs.get(
+            "log_file_path", self.configs_dict.get("log_file_path", "logs")
+        )
+
+        return sql_upload_data(
+            upload_df,
+            self.configs_dict["upload_schemas_dict"][key],
+            self.configs_dict["upload_tables_dict"][key],
+            conn_dict,
+            custom_conn_str=custom_conn_str,
+            mode=kwargs.get("mode", conn_type),
+            connect_args=connect_args,
+            name=name,
+            chunksize=chunksize,
+            method=method,
+            dtypes_dict=kwargs.get("dtypes_dict", dtypes_dict),
+            max_n_try=max_n_try,
+            n_jobs=n_jobs,
+            log_file_path=log_file_path,
+            create_schema=create_schema,
+            batch_rows=batch_rows,
+            executor=executor,
+            upsert_keys=upsert_keys,
+            **{
+                k: v
+                for k, v in kwargs.items()
+                if k not in _UPLOAD_KEY_KWARGS
+            },
+        )
+
+    def _upload_chunks(self, key: str, data, kwargs: dict) -> int:
+        """Upload a DataFrame, or each chunk of an iterable of DataFrames,
+        to the ``upload`` target of a single key."""
+        if isinstance(data, pd.DataFrame):
+            return self._upload_key(key, data, kwargs) or 0
+        rows_uploaded = 0
+        for n_chunks, chunk in enumerate(data):
+            ### Schema creation only needs to happen once per key
+            rows_uploaded += (
+                self._upload_key(key, chunk, kwargs, create_schema=(n_chunks == 0))
+                or 0
             )
-            n_jobs = kwargs.get("n_jobs", self.configs_dict.get("n_parallel", -1))
-            log_file_path = kwargs.get(
-                "log_file_path", self.configs_dict.get("log_file_path", "logs")
+        return rows_uploaded
+
+    def _transfer_key(self, key: str, kwargs: dict) -> int:
+        """Stream one key from source to sink (see :meth:`transfer`)."""
+        read_chunksize = (
+            kwargs.get("read_chunksize")
+            or (self.configs_dict.get("download_chunksizes_dict") or {}).get(key)
+            or self.configs_dict.get("transfer_chunksize", 100000)
+        )
+        queue_size = kwargs.get(
+            "queue_size", self.configs_dict.get("transfer_queue_size", 4)
+        )
+        ## Each side only gets the options it understands (anything else
+        ## would end up in the other side's engine factory)
+        unknown = set(kwargs) - (
+            _TRANSFER_READ_KWARGS
+            | _TRANSFER_UPLOAD_KWARGS
+            | {"read_chunksize", "queue_size"}
+        )
+        if unknown:
+            raise TypeError(
+                f"Invalid transfer argument(s): {', '.join(sorted(unknown))}"
             )
+        upload_kwargs = {
+            k: v for k, v in kwargs.items() if k in _TRANSFER_UPLOAD_KWARGS
+        }
+        read_kwargs = {
+            **{k: v for k, v in kwargs.items() if k in _TRANSFER_READ_KWARGS},
+            "chunksize": read_chunksize,
+        }
 
-            sql_upload_data(
-                upload_df,
-                self.configs_dict["upload_schemas_dict"][key],
-                self.configs_dict["upload_tables_dict"][key],
-                conn_dict,
-                custom_conn_str=custom_conn_str,
-                mode=kwargs.get("mode", conn_type),
-                connect_args=connect_args,
-                name=name,
-                chunksize=chunksize,
-                method=method,
-                dtypes_dict=kwargs.get("dtypes_dict", dtypes_dict),
-                max_n_try=max_n_try,
-                n_jobs=n_jobs,
-                log_file_path=log_file_path,
-                **{
-                    k: v
-                    for k, v in kwargs.items()
-                    if k not in (
-                        "custom_conn_str",
-                        "mode",
-                        "connect_args",
-                        "name",
-                        "chunksize",
-                        "method",
-                        "dtypes_dict",
-                        "max_n_try",
-                        "n_jobs",
-                        "log_file_path",
+        chunks = self._read_key(key, read_kwargs)
+
+        def _produce(_):
+            try:
+                yield from chunks
+            except BaseException as e:
+                logger.error(
+                    f"Error reading data for {key}: {type(e).__name__} - {e}"
+                )
+                raise
+            finally:
+                chunks.close()
+
+        ## Read ahead in a worker thread, at most queue_size chunks buffered
+        buffered_chunks = iter_from_workers(
+            _produce,
+            [key],
+            1,
+            max_queue_size=queue_size,
+            name=f"transfer-reader-{key}",
+        )
+        rows_uploaded = 0
+        n_chunks = 0
+        try:
+            for chunk in buffered_chunks:
+                ### Schema creation only needs to happen once per key
+                rows_uploaded += (
+                    self._upload_key(
+                        key, chunk, upload_kwargs, create_schema=(n_chunks == 0)
                     )
-                },
-            )
+                    or 0
+                )
+                n_chunks += 1
+        finally:
+            buffered_chunks.close()
+        ## Everything read has been written, so the watermark can move on
+        self.commit_watermarks([key])
+        logger.info(
+            f"Transferred {key} -> {n_chunks} chunk(s), {rows_uploaded} row(s)"
+        )
+        return rows_uploaded
@@ -0,0 +1,138 @@
+# Import modules
+import contextlib
+import datetime as dt
+import logging
+import os
+import sqlite3
+import threading
+
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+
+def _encode_watermark(value) -> tuple[str, str]:
+    """Return ``(text, type_name)`` for a cursor value.
+
+    ``text`` is what ``{watermark}`` renders to in download statements:
+    datetimes as ``YYYY-MM-DD HH:MM:SS[.ffffff]``, numbers and strings as-is.
+    """
+    # Unwrap numpy scalars (pandas Timestamps are datetimes already)
+    if hasattr(value, "item") and not isinstance(value, dt.datetime):
+        value = value.item()
+    if isinstance(value, dt.datetime):
+        return value.isoformat(sep=" "), "datetime"
+    if isinstance(value, dt.date):
+        return value.isoformat(), "date"
+    if isinstance(value, bool):
+        return str(int(value)), "int"
+    if isinstance(value, (int, float)):
+        return repr(value), type(value).__name__
+    return str(value), "str"
+
+
+class WatermarkStore(object):
+    """
+    SQLite-backed store of incremental-extraction watermarks.
+
+    Each ``(namespace, key)`` holds the last committed maximum of the key's
+    cursor column. A connection is opened per operation, so one store can be
+    shared by concurrent key workers and by separate processes.
+    """
+
+    def __init__(self, path: str = "state/watermarks.db", namespace: str = ""):
+        """
+        Class constructor.
+
+        Parameters:
+            path (str): SQLite database file (parent directory is created).
+            namespace (str): Prefix isolating pipelines that reuse key names.
+        """
+        self.path = path
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, "
+                "column_name TEXT NOT NULL, value TEXT NOT NULL, "
+                "value_type TEXT NOT NULL, updated_at TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Helper: open a connection that waits on concurrent writers,
+        commit (or roll back) the operation and close it."""
+        with contextlib.closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def get(self, key: str) -> str | None:
+        """
+        Get the committed watermark of a key.
+
+        Parameters:
+            key (str): Configuration key.
+
+        Returns:
+            str | None: Rendered watermark, or ``None`` when never committed.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM watermarks WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, column_name: str, value) -> str:
+        """
+        Commit a new watermark for a key.
+
+        Parameters:
+            key (str): Configuration key.
+            column_name (str): Cursor column the value was taken from.
+            value: Maximum cursor value loaded (datetime, number or string).
+
+        Returns:
+            str: The rendered value stored.
+        """
+        text, value_type = _encode_watermark(value)
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO watermarks "
+                "(namespace, key, column_name, value, value_type, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.namespace,
+                    key,
+                    column_name,
+                    text,
+                    value_type,
+                    dt.datetime.now().isoformat(sep=" "),
+                ),
+            )
+        logger.info(f"Watermark {key}.{column_name} -> {text}")
+        return text
+
+    def delete(self, key: str) -> None:
+        """
+        Forget a key's watermark (next read is a full extraction).
+
+        Parameters:
+            key (str): Configuration key.
+
+        Returns:
+            None
+        """
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "DELETE FROM watermarks WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
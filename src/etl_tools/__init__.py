@@ -1,13 +1,19 @@
 # Public API
+from etl_tools.cache import QueryResultCache
 from etl_tools.execution import (
     execute_script,
+    get_executor,
+    iter_from_workers,
     mk_err_logs,
     mk_exec_logs,
     mk_texec_logs,
     parallel_execute,
+    shutdown_executors,
 )
 from etl_tools.sql import (
     SQLALCHEMY_DTYPES,
+    EngineRegistry,
+    engine_registry,
     resolve_sqlalchemy_dtype,
     resolve_sqlalchemy_path,
     sql_copy_data,
@@ -16,7 +22,9 @@ from etl_tools.sql import (
     sql_upload_data,
 )
 from etl_tools.gcp import (
+    bigquery_read_data,
     bigquery_to_gcs,
+    bigquery_upload_data,
     cloud_sql_to_gcs,
     gcs_delete_files,
     gcs_download_file,
@@ -25,35 +33,55 @@ from etl_tools.gcp import (
     gcs_upload_file,
 )
 from etl_tools.aws import (
+    clear_aws_clients,
     dynamodb_read_data,
     dynamodb_upload_data,
+    get_aws_client,
+    get_aws_session,
+    s3_download_fileobj,
+    s3_iter_objects,
     s3_list_objects,
+    s3_upload_fileobj,
 )
 from etl_tools.api import API_request
 
 __all__ = [
+    "QueryResultCache",
     "execute_script",
+    "get_executor",
+    "iter_from_workers",
     "mk_err_logs",
     "mk_exec_logs",
     "mk_texec_logs",
     "parallel_execute",
+    "shutdown_executors",
     "SQLALCHEMY_DTYPES",
+    "EngineRegistry",
+    "engine_registry",
     "resolve_sqlalchemy_dtype",
     "resolve_sqlalchemy_path",
     "sql_copy_data",
     "sql_exec_stmt",
     "sql_read_data",
     "sql_upload_data",
+    "bigquery_read_data",
     "bigquery_to_gcs",
+    "bigquery_upload_data",
     "cloud_sql_to_gcs",
     "gcs_delete_files",
     "gcs_download_file",
     "gcs_to_bigquery",
     "gcs_to_cloud_sql",
     "gcs_upload_file",
+    "clear_aws_clients",
     "dynamodb_read_data",
     "dynamodb_upload_data",
+    "get_aws_client",
+    "get_aws_session",
+    "s3_download_fileobj",
+    "s3_iter_objects",
     "s3_list_objects",
+    "s3_upload_fileobj",
     "API_request",
 ]
 
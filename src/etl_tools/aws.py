@@ -1,72 +1,452 @@
 # Import modules
 import datetime as dt  # noqa: F401  (kept for backwards compatibility of public surface)
+import functools
 import json
 import logging
+import os
 import pickle
+import random
+import tempfile
+import threading
+import time
+
+# Import submodules
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from decimal import Decimal
+from io import BytesIO
 
 # Import third-party modules
 import awswrangler as aws
 import boto3
 import numpy as np
 import pandas as pd
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
+# Import custom modules
+from etl_tools.execution import iter_from_workers
+
 
 # Module-level logger
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# Session/Client Cache
+# ============================================================================
+
+# Connection pool size of cached clients (botocore's default of 10 is below
+# the concurrency of the parallel transfer helpers)
+AWS_MAX_POOL_CONNECTIONS = 50
+
+# Sessions and clients by (region, credentials[, service, pool size])
+_sessions = {}
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _get_session(aws_access_key_id, aws_secret_access_key, region_name):
+    """Helper: cached boto3 session (call with ``_clients_lock`` held)."""
+    session_key = (region_name, aws_access_key_id, aws_secret_access_key)
+    if session_key not in _sessions:
+        _sessions[session_key] = boto3.Session(
+            region_name=region_name,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+        )
+    return _sessions[session_key]
+
+
+def get_aws_session(aws_access_key_id, aws_secret_access_key, region_name="us-east-1"):
+    """
+    Get a new boto3 session of a region and set of credentials. boto3
+    sessions are not thread-safe, so each caller (e.g. awswrangler, which
+    creates clients from it in its own threads) gets its own instead of the
+    one cached for ``get_aws_client``; share clients, not sessions.
+
+    Parameters:
+        aws_access_key_id: str. AWS access key ID.
+        aws_secret_access_key: str. AWS secret access key.
+        region_name: str. AWS region name.
+
+    Returns:
+        session: boto3.Session. New session.
+    """
+    return boto3.Session(
+        region_name=region_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+    )
+
+
+def get_aws_client(
+    service_name,
+    aws_access_key_id,
+    aws_secret_access_key,
+    region_name="us-east-1",
+    max_pool_connections=None,
+):
+    """
+    Get a shared, thread-safe boto3 client. Clients are created once per
+    (service, region, credentials, pool size), so credential and endpoint
+    resolution and HTTPS connections are reused across helper calls.
+
+    Parameters:
+        service_name: str. AWS service (e.g. "s3", "dynamodb").
+        aws_access_key_id: str. AWS access key ID.
+        aws_secret_access_key: str. AWS secret access key.
+        region_name: str. AWS region name.
+        max_pool_connections: int. HTTP connection pool size (AWS_MAX_POOL_CONNECTIONS if None).
+
+    Returns:
+        client: botocore.client.BaseClient. Cached client.
+    """
+    max_pool_connections = max_pool_connections or AWS_MAX_POOL_CONNECTIONS
+    client_key = (
+        service_name,
+        region_name,
+        aws_access_key_id,
+        aws_secret_access_key,
+        max_pool_connections,
+    )
+    client = _clients.get(client_key)
+    if client is None:
+        ## Sessions are not thread-safe: create clients under the lock
+        with _clients_lock:
+            client = _clients.get(client_key)
+            if client is None:
+                session = _get_session(
+                    aws_access_key_id, aws_secret_access_key, region_name
+                )
+                client = session.client(
+                    service_name,
+                    config=Config(max_pool_connections=max_pool_connections),
+                )
+                _clients[client_key] = client
+
+    return client
+
+
+def clear_aws_clients():
+    """
+    Drop every cached session and client (e.g. after rotating
+    credentials). The next helper call creates new ones.
+    """
+    with _clients_lock:
+        _clients.clear()
+        _sessions.clear()
+
+
+def _reset_after_fork():
+    """Helper: forget the parent's clients in a forked child (connections
+    must not be shared across processes)."""
+    global _clients_lock
+    _clients.clear()
+    _sessions.clear()
+    _clients_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 # ============================================================================
 # S3 Functions
 # ============================================================================
 
+# Objects larger than this are transferred in parallel parts (multipart PUTs,
+# ranged GETs); it is also the in-memory size past which temporary buffers
+# spill to disk
+S3_MULTIPART_THRESHOLD = 64 * 1024**2
+# Default part size and number of concurrent part transfers
+S3_PART_SIZE = 16 * 1024**2
+S3_MAX_CONCURRENCY = 10
 
-def s3_list_objects(
+
+def _s3_transfer_config(part_size=None, max_concurrency=None):
+    """
+    Build the boto3 transfer configuration for multipart/ranged transfers.
+
+    Parameters:
+        part_size: int. Part size in bytes (S3_PART_SIZE if None, minimum 5 MiB).
+        max_concurrency: int. Concurrent part transfers (S3_MAX_CONCURRENCY if None).
+
+    Returns:
+        config: boto3.s3.transfer.TransferConfig. Transfer configuration.
+    """
+    return TransferConfig(
+        multipart_threshold=S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=max(part_size or S3_PART_SIZE, 5 * 1024**2),
+        max_concurrency=max_concurrency or S3_MAX_CONCURRENCY,
+        use_threads=True,
+    )
+
+
+def _get_transfer_client(
+    aws_access_key, aws_secret_access_key, region_name, max_concurrency=None
+):
+    """Helper: shared S3 client whose connection pool is at least as large as
+    the transfer concurrency (otherwise parts wait for free connections)."""
+    return get_aws_client(
+        "s3",
+        aws_access_key,
+        aws_secret_access_key,
+        region_name,
+        max_pool_connections=max(
+            max_concurrency or S3_MAX_CONCURRENCY, AWS_MAX_POOL_CONNECTIONS
+        ),
+    )
+
+
+def s3_upload_fileobj(
+    fileobj,
     s3_bucket_name,
     s3_path,
     aws_access_key,
     aws_secret_access_key,
     region_name="us-east-1",
+    part_size=None,
+    max_concurrency=None,
 ):
     """
-    Function to list objects from S3 bucket.
+    Function to stream a file-like object to S3 bucket. Objects above
+    S3_MULTIPART_THRESHOLD are uploaded as parallel multipart parts, so they
+    are not limited to 5 GB and are never fully held in memory.
 
     Parameters:
+        fileobj: file-like. Binary readable object (e.g. open file, BytesIO).
         s3_bucket_name: str. Name of the S3 bucket without "s3://" prefix.
         s3_path: str. Path to the file in the S3 bucket (relative to root).
         aws_access_key: str. Name of the environment variable with the AWS access key.
         aws_secret_access_key: str. Name of the environment variable with the AWS secret access key.
         region_name: str. Name of the AWS region to use.
+        part_size: int. Multipart part size in bytes.
+        max_concurrency: int. Number of parts uploaded concurrently.
+    """
 
-    Returns:
-        objects_list: list. List of objects in the S3 bucket.
+    ## Get shared S3 client with a pool that fits the concurrent parts
+    s3 = _get_transfer_client(
+        aws_access_key, aws_secret_access_key, region_name, max_concurrency
+    )
+    ## Upload object
+    try:
+        s3.upload_fileobj(
+            fileobj,
+            s3_bucket_name,
+            s3_path,
+            Config=_s3_transfer_config(part_size, max_concurrency),
+        )
+    except (BotoCoreError, ClientError) as e:
+        logger.error(
+            f"S3 upload failed for s3://{s3_bucket_name}/{s3_path} -> "
+            f"{type(e).__name__}: {e}"
+        )
+        raise
+
+
+def s3_download_fileobj(
+    s3_bucket_name,
+    s3_path,
+    fileobj,
+    aws_access_key,
+    aws_secret_access_key,
+    region_name="us-east-1",
+    part_size=None,
+    max_concurrency=None,
+):
+    """
+    Function to stream an S3 object into a file-like object. Objects above
+    S3_MULTIPART_THRESHOLD are fetched with parallel ranged GETs.
+
+    Parameters:
+        s3_bucket_name: str. Name of the S3 bucket without "s3://" prefix.
+        s3_path: str. Path to the file in the S3 bucket (relative to root).
+        fileobj: file-like. Binary writable object (e.g. open file, BytesIO).
+        aws_access_key: str. Name of the environment variable with the AWS access key.
+        aws_secret_access_key: str. Name of the environment variable with the AWS secret access key.
+        region_name: str. Name of the AWS region to use.
+        part_size: int. Size in bytes of each ranged GET.
+        max_concurrency: int. Number of ranges downloaded concurrently.
     """
 
-    ## Create S3 session
-    my_session = boto3.Session(
+    ## Get shared S3 client with a pool that fits the concurrent ranges
+    s3 = _get_transfer_client(
+        aws_access_key, aws_secret_access_key, region_name, max_concurrency
+    )
+    ## Download object
+    try:
+        s3.download_fileobj(
+            s3_bucket_name,
+            s3_path,
+            fileobj,
+            Config=_s3_transfer_config(part_size, max_concurrency),
+        )
+    except (BotoCoreError, ClientError) as e:
+        logger.error(
+            f"S3 download failed for s3://{s3_bucket_name}/{s3_path} -> "
+            f"{type(e).__name__}: {e}"
+        )
+        raise
+
+
+def _s3_download_tempfile(
+    s3_bucket_name,
+    s3_path,
+    aws_access_key,
+    aws_secret_access_key,
+    region_name="us-east-1",
+    part_size=None,
+    max_concurrency=None,
+):
+    """Helper: download an object (parallel ranged GETs) into an anonymous
+    temporary file, so large objects never have to fit in memory. Returns
+    the file rewound to the start.
+
+    ``SpooledTemporaryFile`` is not used: before Python 3.11 it lacks
+    ``readable``/``seekable``, which readers such as pickle and pyarrow
+    probe for."""
+    tmp_file = tempfile.TemporaryFile()
+    s3_download_fileobj(
+        s3_bucket_name,
+        s3_path,
+        tmp_file,
+        aws_access_key,
+        aws_secret_access_key,
         region_name=region_name,
-        aws_access_key_id=aws_access_key,
-        aws_secret_access_key=aws_secret_access_key,
+        part_size=part_size,
+        max_concurrency=max_concurrency,
     )
-    ## Set up S3 resource
-    s3 = my_session.client("s3")
-    ## Get objects list
-    objects_list = [
-        obj_dict["Key"]
-        for obj_dict in s3.list_objects_v2(Bucket=s3_bucket_name, Prefix=s3_path)[
-            "Contents"
-        ]
-    ]
-    ## Check if limit of 1000 objects was reached
-    if len(objects_list) == 1000:
-        ### Get paginator
-        paginator = s3.get_paginator("list_objects_v2")
-        ### Get pages
-        pages = paginator.paginate(Bucket=s3_bucket_name, Prefix=s3_path)
-        ### Iterate over pages
-        objects_list = np.hstack(
-            [[obj_dict["Key"] for obj_dict in page["Contents"]] for page in pages]
+    tmp_file.seek(0)
+    return tmp_file
+
+
+def _s3_list_pages(s3, s3_bucket_name, prefix, delimiter=None, page_size=1000):
+    """Helper: lazily iterate the ``list_objects_v2`` pages of a prefix."""
+    paginate_kwargs = {
+        "Bucket": s3_bucket_name,
+        "Prefix": prefix,
+        "PaginationConfig": {"PageSize": page_size},
+    }
+    if delimiter:
+        paginate_kwargs["Delimiter"] = delimiter
+    return s3.get_paginator("list_objects_v2").paginate(**paginate_kwargs)
+
+
+def s3_iter_objects(
+    s3_bucket_name,
+    s3_path,
+    aws_access_key,
+    aws_secret_access_key,
+    region_name="us-east-1",
+    metadata=False,
+    delimiter=None,
+    max_workers=None,
+    max_queue_size=8,
+):
+    """
+    Function to lazily iterate over the objects under an S3 prefix. Pages of
+    up to 1000 objects are fetched as the generator is consumed, so memory
+    stays constant whatever the number of objects.
+
+    With a delimiter (e.g. "/"), the prefix is first listed one level deep
+    and the sub-prefixes found ("directories") are then listed concurrently
+    by max_workers threads; objects are then yielded in no particular order.
+
+    Parameters:
+        s3_bucket_name: str. Name of the S3 bucket without "s3://" prefix.
+        s3_path: str. Prefix to list (relative to root).
+        aws_access_key: str. Name of the environment variable with the AWS access key.
+        aws_secret_access_key: str. Name of the environment variable with the AWS secret access key.
+        region_name: str. Name of the AWS region to use.
+        metadata: bool. Yield the object dicts (Key, Size, LastModified, ETag, ...) instead of keys.
+        delimiter: str. Delimiter used to shard the listing across sub-prefixes (None lists sequentially).
+        max_workers: int. Concurrent sub-prefix listings (S3_MAX_CONCURRENCY if None).
+        max_queue_size: int. Pages buffered between the listing threads and the consumer.
+
+    Returns:
+        objects: generator. Object keys (or dicts when metadata is True).
+    """
+
+    ## Get shared S3 client
+    s3 = get_aws_client("s3", aws_access_key, aws_secret_access_key, region_name)
+    max_workers = max_workers or S3_MAX_CONCURRENCY
+
+    def _page_objects(page):
+        return [obj if metadata else obj["Key"] for obj in page.get("Contents", [])]
+
+    try:
+        ## Sequential listing
+        if not delimiter:
+            for page in _s3_list_pages(s3, s3_bucket_name, s3_path):
+                yield from _page_objects(page)
+            return
+        ## Sharded listing: objects at the first level, then sub-prefixes
+        sub_prefixes = []
+        for page in _s3_list_pages(s3, s3_bucket_name, s3_path, delimiter=delimiter):
+            yield from _page_objects(page)
+            sub_prefixes.extend(
+                common_prefix["Prefix"]
+                for common_prefix in page.get("CommonPrefixes", [])
+            )
+        if not sub_prefixes:
+            return
+        for page in iter_from_workers(
+            functools.partial(_s3_list_pages, s3, s3_bucket_name),
+            sub_prefixes,
+            max_workers,
+            max_queue_size,
+            name="s3-list",
+        ):
+            yield from _page_objects(page)
+    except (BotoCoreError, ClientError) as e:
+        logger.error(
+            f"S3 listing failed for s3://{s3_bucket_name}/{s3_path} -> "
+            f"{type(e).__name__}: {e}"
+        )
+        raise
+
+
+def s3_list_objects(
+    s3_bucket_name,
+    s3_path,
+    aws_access_key,
+    aws_secret_access_key,
+    region_name="us-east-1",
+    delimiter=None,
+    max_workers=None,
+):
+    """
+    Function to list objects from S3 bucket (see s3_iter_objects for a lazy
+    variant).
+
+    Parameters:
+        s3_bucket_name: str. Name of the S3 bucket without "s3://" prefix.
+        s3_path: str. Path to the file in the S3 bucket (relative to root).
+        aws_access_key: str. Name of the environment variable with the AWS access key.
+        aws_secret_access_key: str. Name of the environment variable with the AWS secret access key.
+        region_name: str. Name of the AWS region to use.
+        delimiter: str. Delimiter used to shard the listing across sub-prefixes (None lists sequentially).
+        max_workers: int. Concurrent sub-prefix listings.
+
+    Returns:
+        objects_list: list. Keys of the objects under the prefix (empty if none).
+    """
+
+    ## Get objects list (every page, empty prefixes included)
+    objects_list = list(
+        s3_iter_objects(
+            s3_bucket_name,
+            s3_path,
+            aws_access_key,
+            aws_secret_access_key,
+            region_name=region_name,
+            delimiter=delimiter,
+            max_workers=max_workers,
         )
+    )
 
     return objects_list
 
@@ -92,14 +472,8 @@ def s3_get_object(
         content_object: dict. The S3 object response.
     """
 
-    ## Create S3 session
-    my_session = boto3.Session(
-        region_name=region_name,
-        aws_access_key_id=aws_access_key,
-        aws_secret_access_key=aws_secret_access_key,
-    )
-    ## Set up S3 resource
-    s3 = my_session.client("s3")
+    ## Get shared S3 client
+    s3 = get_aws_client("s3", aws_access_key, aws_secret_access_key, region_name)
     ## Set up S3 object
     content_object = s3.get_object(Bucket=s3_bucket_name, Key=s3_path)
 
@@ -113,29 +487,85 @@ def s3_put_object(
     aws_access_key,
     aws_secret_access_key,
     region_name="us-east-1",
+    part_size=None,
+    max_concurrency=None,
 ):
     """
-    Function to put object on S3 bucket.
+    Function to put object on S3 bucket (multipart above
+    S3_MULTIPART_THRESHOLD, see s3_upload_fileobj).
 
     Parameters:
-        s3_body_content: bytes. Content to be uploaded to S3.
+        s3_body_content: bytes or file-like. Content to be uploaded to S3.
         s3_bucket_name: str. Name of the S3 bucket without "s3://" prefix.
         s3_path: str. Path to the file in the S3 bucket (relative to root).
         aws_access_key: str. Name of the environment variable with the AWS access key.
         aws_secret_access_key: str. Name of the environment variable with the AWS secret access key.
         region_name: str. Name of the AWS region to use.
+        part_size: int. Multipart part size in bytes.
+        max_concurrency: int. Number of parts uploaded concurrently.
     """
 
-    ## Create S3 session
-    my_session = boto3.Session(
+    ## Wrap raw content so it can be streamed in parts
+    if isinstance(s3_body_content, str):
+        s3_body_content = s3_body_content.encode("utf-8")
+    if isinstance(s3_body_content, (bytes, bytearray, memoryview)):
+        s3_body_content = BytesIO(s3_body_content)
+    ## Upload object
+    s3_upload_fileobj(
+        s3_body_content,
+        s3_bucket_name,
+        s3_path,
+        aws_access_key,
+        aws_secret_access_key,
         region_name=region_name,
-        aws_access_key_id=aws_access_key,
-        aws_secret_access_key=aws_secret_access_key,
+        part_size=part_size,
+        max_concurrency=max_concurrency,
     )
-    ## Set up S3 resource
-    s3 = my_session.client("s3")
-    ## Set up S3 object
-    s3.put_object(Body=s3_body_content, Bucket=s3_bucket_name, Key=s3_path)
+
+
+def s3_delete_objects(
+    s3_bucket_name,
+    s3_paths,
+    aws_access_key,
+    aws_secret_access_key,
+    region_name="us-east-1",
+):
+    """
+    Function to delete objects from S3 bucket.
+
+    Parameters:
+        s3_bucket_name: str. Name of the S3 bucket without "s3://" prefix.
+        s3_paths: list. Paths of the objects in the S3 bucket (relative to root).
+        aws_access_key: str. Name of the environment variable with the AWS access key.
+        aws_secret_access_key: str. Name of the environment variable with the AWS secret access key.
+        region_name: str. Name of the AWS region to use.
+
+    Returns:
+        n_deleted: int. Number of objects deleted.
+    """
+
+    ## Get shared S3 client
+    s3 = get_aws_client("s3", aws_access_key, aws_secret_access_key, region_name)
+    ## Delete objects (at most 1000 keys per request)
+    s3_paths = list(s3_paths)
+    n_deleted = 0
+    for i in range(0, len(s3_paths), 1000):
+        response = s3.delete_objects(
+            Bucket=s3_bucket_name,
+            Delete={
+                "Objects": [{"Key": path} for path in s3_paths[i:i + 1000]],
+                "Quiet": True,
+            },
+        )
+        errors = response.get("Errors", [])
+        for error in errors:
+            logger.warning(
+                f"Could not delete s3://{s3_bucket_name}/{error.get('Key')} -> "
+                f"{error.get('Code')}: {error.get('Message')}"
+            )
+        n_deleted += len(s3_paths[i:i + 1000]) - len(errors)
+
+    return n_deleted
 
 
 def s3_read_file(
@@ -163,20 +593,26 @@ def s3_read_file(
         file_content: BytesIO or str. Content of the file.
     """
 
-    # Get content object
-    content_object = s3_get_object(
-        s3_bucket_name,
-        s3_path,
-        aws_access_key,
-        aws_secret_access_key,
-        region_name=region_name,
-    )
     if file_type == "csv":
-        ### Get and decode content
+        ### Get streaming body (consumed incrementally by the caller)
+        content_object = s3_get_object(
+            s3_bucket_name,
+            s3_path,
+            aws_access_key,
+            aws_secret_access_key,
+            region_name=region_name,
+        )
         file_content = content_object.get("Body")
     elif file_type == "plain":
-        ### Get and decode content
-        file_content = content_object.get("Body").read().decode(encoding)
+        ### Download (parallel ranged GETs) and decode content
+        with _s3_download_tempfile(
+            s3_bucket_name,
+            s3_path,
+            aws_access_key,
+            aws_secret_access_key,
+            region_name=region_name,
+        ) as tmp_file:
+            file_content = tmp_file.read().decode(encoding)
 
     return file_content
 
@@ -314,17 +750,21 @@ def s3_write_parquet(
         region_name: str. Name of the AWS region to use.
     """
 
-    # Set and encode data
-    s3_body_content = data.to_parquet()
-    ## Upload content to S3
-    s3_put_object(
-        s3_body_content,
-        s3_bucket_name,
-        s3_path,
-        aws_access_key,
-        aws_secret_access_key,
-        region_name=region_name,
-    )
+    # Serialize to an anonymous temporary file (pyarrow needs a file with
+    # readable/seekable/writable, which SpooledTemporaryFile lacks before
+    # Python 3.11)
+    with tempfile.TemporaryFile() as tmp_file:
+        data.to_parquet(tmp_file)
+        tmp_file.seek(0)
+        ## Upload content to S3 (multipart when large)
+        s3_upload_fileobj(
+            tmp_file,
+            s3_bucket_name,
+            s3_path,
+            aws_access_key,
+            aws_secret_access_key,
+            region_name=region_name,
+        )
 
 
 def s3_read_pkl(
@@ -347,20 +787,16 @@ def s3_read_pkl(
     Returns:
         pickle_object: object. Unpickled Python object.
     """
-    # Download from S3
-    pkl_file = (
-        s3_get_object(
-            s3_bucket_name,
-            s3_pickle_path,
-            aws_access_key,
-            aws_secret_access_key,
-            region_name=region_name,
-        )
-        .get("Body")
-        .read()
-    )
-    ## Load threshold for center
-    pickle_object = pickle.loads(pkl_file)
+    # Download from S3 (parallel ranged GETs)
+    with _s3_download_tempfile(
+        s3_bucket_name,
+        s3_pickle_path,
+        aws_access_key,
+        aws_secret_access_key,
+        region_name=region_name,
+    ) as pkl_file:
+        ## Load object
+        pickle_object = pickle.load(pkl_file)
 
     return pickle_object
 
@@ -389,18 +825,14 @@ def s3_upload_csv(
         encoding: str. Encoding to use.
     """
 
-    # Create S3 session
-    my_session = boto3.Session(
-        region_name=region_name,
-        aws_access_key_id=aws_access_key,
-        aws_secret_access_key=aws_secret_access_key,
-    )
+    # Get a session of its own (awswrangler uses it from its threads)
+    my_session = get_aws_session(aws_access_key, aws_secret_access_key, region_name)
     ## Upload data to S3 bucket
     aws.s3.to_csv(
         data,
         path=s3_file_path,
         sep=sep,
-        my_session=my_session,
+        boto3_session=my_session,
         index=index,
         encoding=encoding,
     )
@@ -411,57 +843,329 @@ def s3_upload_csv(
 # ============================================================================
 
 
+# Output modes of dynamodb_read_data
+_DYNAMODB_OUTPUTS = ("list", "pandas", "items", "batches")
+
+# Conversion between Python values and DynamoDB's typed attribute values for
+# the low-level client (both are stateless, so threads share them)
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _dynamodb_scan_request(scan_kwargs):
+    """Helper: translate scan kwargs as the boto3 resource takes them
+    (``boto3.dynamodb.conditions`` filters, plain Python values) into a
+    low-level client Scan request."""
+    request = dict(scan_kwargs)
+    names = dict(request.pop("ExpressionAttributeNames", None) or {})
+    values = dict(request.pop("ExpressionAttributeValues", None) or {})
+    if isinstance(request.get("FilterExpression"), ConditionBase):
+        expression = ConditionExpressionBuilder().build_expression(
+            request["FilterExpression"]
+        )
+        request["FilterExpression"] = expression.condition_expression
+        names.update(expression.attribute_name_placeholders)
+        values.update(expression.attribute_value_placeholders)
+    if names:
+        request["ExpressionAttributeNames"] = names
+    if values:
+        request["ExpressionAttributeValues"] = {
+            placeholder: _serializer.serialize(value)
+            for placeholder, value in values.items()
+        }
+    if "ExclusiveStartKey" in request:
+        request["ExclusiveStartKey"] = {
+            name: _serializer.serialize(value)
+            for name, value in request["ExclusiveStartKey"].items()
+        }
+    return request
+
+
+def _dynamodb_scan_pages(
+    table_name,
+    aws_access_key_id,
+    aws_secret_access_key,
+    region_name,
+    scan_kwargs,
+    segment=0,
+    total_segments=1,
+):
+    """Helper: lazily iterate the item pages of one scan segment (the whole
+    table when ``total_segments`` is 1)."""
+    ## Get client (shared and thread-safe, so segment workers reuse it)
+    dynamodb = get_aws_client(
+        "dynamodb", aws_access_key_id, aws_secret_access_key, region_name
+    )
+    request = _dynamodb_scan_request(scan_kwargs)
+    request["TableName"] = table_name
+    if total_segments > 1:
+        request.update(Segment=segment, TotalSegments=total_segments)
+    while True:  ### Iterate over each scan response
+        ### Scan table
+        scan_response = dynamodb.scan(**request)
+        yield [
+            {name: _deserializer.deserialize(value) for name, value in item.items()}
+            for item in scan_response["Items"]
+        ]
+        if "LastEvaluatedKey" not in scan_response:
+            break
+        ### Typed keys are passed back as returned
+        request["ExclusiveStartKey"] = scan_response["LastEvaluatedKey"]
+
+
+def _iter_dynamodb_pages(
+    table_name,
+    aws_access_key_id,
+    aws_secret_access_key,
+    region_name,
+    scan_kwargs,
+    total_segments,
+    max_workers,
+    max_queue_size,
+):
+    """Helper: yield item pages of a (possibly segmented) scan, logging and
+    re-raising scan errors."""
+    scan_pages = functools.partial(
+        _dynamodb_scan_pages,
+        table_name,
+        aws_access_key_id,
+        aws_secret_access_key,
+        region_name,
+        scan_kwargs,
+        total_segments=total_segments,
+    )
+    try:
+        if total_segments > 1:
+            yield from iter_from_workers(
+                scan_pages,
+                range(total_segments),
+                max_workers or total_segments,
+                max_queue_size,
+                name="dynamodb-scan",
+            )
+        else:
+            yield from scan_pages()
+    except (BotoCoreError, ClientError) as e:
+        logger.error(
+            f"DynamoDB scan failed for table '{table_name}' -> "
+            f"{type(e).__name__}: {e}"
+        )
+        raise
+
+
+def _iter_dynamodb_batches(pages, batch_size=None):
+    """Helper: rebatch item pages into DataFrames of ``batch_size`` rows (one
+    DataFrame per scan page if None)."""
+    items = []
+    for page in pages:
+        if batch_size is None:
+            if page:
+                yield pd.DataFrame(page)
+            continue
+        items.extend(page)
+        ## Walk an offset and drop consumed items once per page (not per batch)
+        start = 0
+        while len(items) - start >= batch_size:
+            yield pd.DataFrame(items[start : start + batch_size])
+            start += batch_size
+        del items[:start]
+    if items:
+        yield pd.DataFrame(items)
+
+
 def dynamodb_read_data(
-    table_name, aws_access_key_id, aws_secret_access_key, region_name, **kwargs
+    table_name,
+    aws_access_key_id,
+    aws_secret_access_key,
+    region_name,
+    total_segments=1,
+    max_workers=None,
+    output="list",
+    batch_size=None,
+    max_queue_size=8,
+    **kwargs,
 ):
     """
     Function to read data from DynamoDB.
 
+    With total_segments > 1 the table is read as a parallel scan: each
+    Segment is scanned by its own worker thread, so throughput scales with
+    the table's provisioned read capacity rather than one scanner.
+
     Parameters:
         table_name: str. Name of the DynamoDB table.
         aws_access_key_id: str. AWS access key ID.
         aws_secret_access_key: str. AWS secret access key.
         region_name: str. AWS region name.
+        total_segments: int. Number of parallel scan segments (1 scans sequentially).
+        max_workers: int. Concurrent segment scanners (one per segment if None).
+        output: str. 'list' (list of items), 'pandas' (DataFrame), 'items' (iterator
+                of items) or 'batches' (iterator of DataFrames). Default 'list'.
+        batch_size: int. Rows per DataFrame in 'batches' mode (one per scan page if None).
+        max_queue_size: int. Scan pages buffered between segment scanners and caller.
         **kwargs: Additional arguments for DynamoDB scan operations.
 
     Returns:
-        data: list. List of items from the DynamoDB table.
+        data: list, pd.DataFrame or iterator. Items from the DynamoDB table
+              (in no particular order when scanned in segments).
     """
+    if output not in _DYNAMODB_OUTPUTS:
+        raise ValueError(
+            f"Invalid output '{output}'. Allowed values are: "
+            + ", ".join(f"'{o}'" for o in _DYNAMODB_OUTPUTS)
+            + "."
+        )
 
-    # Set resource
-    dynamodb = boto3.resource(
-        "dynamodb",
-        aws_access_key_id=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-        region_name=region_name,
-    )
     # Pass kwargs through unchanged. Callers are responsible for constructing
     # any boto3 objects (e.g. ``boto3.dynamodb.conditions.Key`` /
     # ``Attr``) before invoking this function. We no longer ``eval()`` the
     # values, since doing so would allow arbitrary code execution.
     scan_kwargs = dict(kwargs)
-    ## Get table
-    table = dynamodb.Table(table_name)
-    ## Scan table
-    try:
-        scan_response = table.scan(**scan_kwargs)
-        ## Get data from table
-        data = scan_response["Items"]
-        while "LastEvaluatedKey" in scan_response:  ### Iterate over each scan response
-            ### Scan table
-            scan_response = table.scan(
-                ExclusiveStartKey=scan_response["LastEvaluatedKey"], **scan_kwargs
-            )
-            ### Add data
-            data.extend(scan_response["Items"])
-    except (BotoCoreError, ClientError) as e:
-        logger.error(
-            f"DynamoDB scan failed for table '{table_name}' -> "
-            f"{type(e).__name__}: {e}"
+    ## Scan table (lazily)
+    pages = _iter_dynamodb_pages(
+        table_name,
+        aws_access_key_id,
+        aws_secret_access_key,
+        region_name,
+        scan_kwargs,
+        max(1, int(total_segments)),
+        max_workers,
+        max_queue_size,
+    )
+    if output == "items":
+        return (item for page in pages for item in page)
+    if output == "batches":
+        return _iter_dynamodb_batches(pages, batch_size)
+    ## Get data from table
+    data = [item for page in pages for item in page]
+
+    return pd.DataFrame(data) if output == "pandas" else data
+
+
+# BatchWriteItem limit and retry policy for unprocessed items (full-jitter
+# exponential backoff, in seconds)
+DYNAMODB_BATCH_SIZE = 25
+DYNAMODB_MAX_RETRIES = 8
+_DYNAMODB_BASE_BACKOFF = 0.05
+_DYNAMODB_MAX_BACKOFF = 5.0
+
+
+def _dynamodb_float(value, column):
+    """Helper: convert one (non-NaN) float of an object column to
+    ``Decimal``; infinities raise ValueError."""
+    if np.isinf(value):
+        raise ValueError(
+            f"Column '{column}' has a non-finite value ({value}), which "
+            "DynamoDB numbers cannot store."
         )
-        raise
+    return Decimal(str(value))
 
-    return data
+
+def _dynamodb_items(data):
+    """
+    Helper: convert a DataFrame to DynamoDB items column by column.
+
+    Float columns become ``Decimal`` (DynamoDB rejects floats) through one
+    vectorized string conversion per column, and so do floats mixed into
+    object columns; NaN/NA become ``None`` (NULL) and numpy scalars become
+    Python ones. Infinite values raise ValueError instead of being written
+    as NULL.
+    """
+    columns = []
+    for name, column in data.items():
+        if pd.api.types.is_float_dtype(column):
+            values = column.to_numpy(dtype=float, na_value=np.nan)
+            if np.isinf(values).any():
+                raise ValueError(
+                    f"Column '{name}' has non-finite value(s), which DynamoDB "
+                    "numbers cannot store."
+                )
+            finite = np.isfinite(values)
+            converted = np.full(values.shape, None, dtype=object)
+            converted[finite] = [Decimal(text) for text in values[finite].astype(str)]
+            columns.append(converted.tolist())
+        else:
+            values = column.astype(object).where(column.notna(), None).tolist()
+            if pd.api.types.is_object_dtype(column):
+                values = [
+                    _dynamodb_float(value, name) if isinstance(value, float) else value
+                    for value in values
+                ]
+            columns.append(values)
+
+    return [dict(zip(data.columns, row)) for row in zip(*columns)]
+
+
+def _iter_dynamodb_write_batches(data, chunksize, batch_size, overwrite_by_pkeys=None):
+    """Helper: yield lists of at most ``batch_size`` items, converting a
+    DataFrame ``chunksize`` rows at a time. If ``overwrite_by_pkeys`` is given,
+    items sharing those key values within a chunk are collapsed (last wins),
+    since BatchWriteItem rejects duplicate keys in one request; an item
+    missing one of the keys raises ValueError."""
+    if isinstance(data, pd.DataFrame):
+        chunks = (
+            _dynamodb_items(data.iloc[i:i + chunksize])
+            for i in range(0, data.shape[0], chunksize)
+        )
+    else:
+        records = data if isinstance(data, list) else [data]
+        chunks = (records[i:i + chunksize] for i in range(0, len(records), chunksize))
+    for items in chunks:
+        if overwrite_by_pkeys:
+            unique_items = {}
+            for item in items:
+                missing = [pkey for pkey in overwrite_by_pkeys if pkey not in item]
+                if missing:
+                    raise ValueError(
+                        f"Item is missing overwrite_by_pkeys {missing}: {item}"
+                    )
+                unique_items[tuple(item[pkey] for pkey in overwrite_by_pkeys)] = item
+            items = list(unique_items.values())
+        for i in range(0, len(items), batch_size):
+            yield items[i:i + batch_size]
+
+
+def _dynamodb_write_batch(
+    items,
+    table_name,
+    aws_access_key_id,
+    aws_secret_access_key,
+    region_name,
+    max_retries=DYNAMODB_MAX_RETRIES,
+):
+    """Helper: write one BatchWriteItem request, retrying UnprocessedItems
+    with full-jitter exponential backoff. Returns the number of items."""
+    dynamodb = get_aws_client(
+        "dynamodb", aws_access_key_id, aws_secret_access_key, region_name
+    )
+    request_items = {
+        table_name: [
+            {
+                "PutRequest": {
+                    "Item": {
+                        name: _serializer.serialize(value)
+                        for name, value in item.items()
+                    }
+                }
+            }
+            for item in items
+        ]
+    }
+    for attempt in range(max_retries + 1):
+        response = dynamodb.batch_write_item(RequestItems=request_items)
+        request_items = response.get("UnprocessedItems") or {}
+        if not request_items:
+            return len(items)
+        if attempt < max_retries:
+            time.sleep(
+                random.uniform(
+                    0, min(_DYNAMODB_MAX_BACKOFF, _DYNAMODB_BASE_BACKOFF * 2**attempt)
+                )
+            )
+    n_unprocessed = len(request_items.get(table_name, []))
+    raise RuntimeError(
+        f"{n_unprocessed} item(s) still unprocessed after {max_retries} retries"
+    )
 
 
 def dynamodb_upload_data(
@@ -470,51 +1174,84 @@ def dynamodb_upload_data(
     aws_access_key_id,
     aws_secret_access_key,
     region_name,
+    n_threads=1,
+    chunksize=10000,
+    max_retries=DYNAMODB_MAX_RETRIES,
     **kwargs,
 ):
     """
     Function to upload data to DynamoDB.
 
+    Items are written with BatchWriteItem requests of up to 25 items, spread
+    over n_threads threads; items DynamoDB leaves unprocessed (throttling)
+    are retried with jittered exponential backoff. DataFrames are converted
+    chunksize rows at a time, so the whole frame is never duplicated as dicts.
+
     Parameters:
         data: pd.DataFrame or list. Data to upload.
         table_name: str. Name of the DynamoDB table.
         aws_access_key_id: str. AWS access key ID.
         aws_secret_access_key: str. AWS secret access key.
         region_name: str. AWS region name.
-        **kwargs: Additional arguments for DynamoDB operations.
+        n_threads: int. Concurrent BatchWriteItem writers. Default 1.
+        chunksize: int. DataFrame rows converted to items at a time.
+        max_retries: int. Retries of unprocessed items per request.
+        **kwargs: Additional arguments for DynamoDB operations ('batch_size', at
+                  most 25, and 'overwrite_by_pkeys', the table's key attributes
+                  to deduplicate items by; default None, no deduplication).
+
+    Returns:
+        n_written: int. Number of items written.
     """
 
-    # Set resource
-    dynamodb = boto3.resource(
-        "dynamodb",
+    ## Get batch size (default 25, maximum for DynamoDB)
+    batch_size = min(
+        int(kwargs.get("batch_size", DYNAMODB_BATCH_SIZE)), DYNAMODB_BATCH_SIZE
+    )
+    batches = _iter_dynamodb_write_batches(
+        data,
+        max(1, int(chunksize)),
+        batch_size,
+        kwargs.get("overwrite_by_pkeys"),
+    )
+    write_batch = functools.partial(
+        _dynamodb_write_batch,
+        table_name=table_name,
         aws_access_key_id=aws_access_key_id,
         aws_secret_access_key=aws_secret_access_key,
         region_name=region_name,
+        max_retries=max_retries,
     )
-    ## Get table
-    table = dynamodb.Table(table_name)
-
-    ## Convert DataFrame to list of dictionaries if needed
-    if isinstance(data, pd.DataFrame):
-        items = data.to_dict(orient="records")
-    else:
-        items = data if isinstance(data, list) else [data]
-
-    ## Get batch size (default 25, maximum for DynamoDB)
-    batch_size = kwargs.get("batch_size", 25)
 
     ## Upload data in batches
+    n_written = 0
+    pending = set()
     try:
-        with table.batch_writer(
-            batch_size=batch_size,
-            overwrite_by_pkeys=kwargs.get("overwrite_by_pkeys", ["id"]),
-        ) as batch:
-            ### Upload each item
-            for item in items:
-                batch.put_item(Item=item)
-    except (BotoCoreError, ClientError) as e:
+        if n_threads <= 1:
+            for batch in batches:
+                n_written += write_batch(batch)
+        else:
+            ### Keep a bounded number of requests in flight (the frame is
+            ### consumed as writers free up). Submissions span the whole
+            ### upload, so the pool is owned here rather than shared
+            with ThreadPoolExecutor(
+                max_workers=n_threads, thread_name_prefix="dynamodb-write"
+            ) as executor:
+                for batch in batches:
+                    if len(pending) >= 2 * n_threads:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        n_written += sum(future.result() for future in done)
+                    pending.add(executor.submit(write_batch, batch))
+                done, pending = wait(pending)
+                n_written += sum(future.result() for future in done)
+    except (BotoCoreError, ClientError, RuntimeError, ValueError) as e:
         logger.error(
             f"DynamoDB upload failed for table '{table_name}' -> "
             f"{type(e).__name__}: {e}"
         )
         raise
+    finally:
+        for future in pending:
+            future.cancel()
+
+    return n_written
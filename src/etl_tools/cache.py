@@ -0,0 +1,150 @@
+# Import modules
+import logging
+import os
+import threading
+import time
+import uuid
+
+# Import third-party modules
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+
+class QueryResultCache(object):
+    """
+    On-disk cache of query results stored as Parquet files.
+
+    Entries expire ``ttl`` seconds after being written, and once the cache
+    grows past ``max_bytes`` the least recently read entries are evicted.
+    Files are written atomically, so several processes (e.g. pipelines of the
+    same DAG) can share one directory.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: float = 3600,
+        max_bytes: int = 10 * 1024**3,
+    ):
+        """
+        Class constructor.
+
+        Parameters:
+            directory (str): Cache directory (created if missing). Results
+                are stored unencrypted, so there is no default location.
+            ttl (float): Entry lifetime in seconds (entries older than this
+                are deleted on eviction; reads may ask for a shorter one).
+            max_bytes (int): Size budget for the whole directory.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Helper: Parquet file of a cache key."""
+        return os.path.join(self.directory, f"{key}.parquet")
+
+    def get(self, key: str, ttl: float | None = None):
+        """
+        Get a cached result.
+
+        Parameters:
+            key (str): Cache key (see ``etl_tools.sql._cache_key``).
+            ttl (float | None): Maximum age in seconds (instance default if
+                ``None``; larger values are capped by eviction).
+
+        Returns:
+            pyarrow.Table | None: Cached result, or ``None`` on a miss.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        path = self._path(key)
+        try:
+            written = os.stat(path).st_mtime
+        except FileNotFoundError:
+            return None
+        if time.time() - written > ttl:
+            return None
+        try:
+            table = pq.read_table(path)
+        except (FileNotFoundError, pa.ArrowException) as e:
+            logger.warning(f"Unreadable cache entry {path} -> {type(e).__name__}: {e}")
+            return None
+        # The access time drives LRU eviction (set explicitly, since many
+        # filesystems are mounted noatime)
+        try:
+            os.utime(path, (time.time(), written))
+        except FileNotFoundError:
+            pass
+        return table
+
+    def put(self, key: str, table: pa.Table) -> None:
+        """
+        Store a result and evict entries over the size budget.
+
+        Parameters:
+            key (str): Cache key.
+            table (pyarrow.Table): Result to store.
+
+        Returns:
+            None
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        Delete expired entries, then least recently read ones until the
+        directory fits in ``max_bytes``.
+
+        Returns:
+            int: Number of entries deleted.
+        """
+        with self._lock:
+            now = time.time()
+            entries = []
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(".parquet"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_atime, stat.st_mtime, stat.st_size, entry.path))
+
+            n_deleted = 0
+            total = sum(size for _, _, size, _ in entries)
+            for atime, mtime, size, path in sorted(entries):
+                if now - mtime <= self.ttl and total <= self.max_bytes:
+                    continue
+                try:
+                    os.remove(path)
+                    n_deleted += 1
+                    total -= size
+                except FileNotFoundError:
+                    pass
+        if n_deleted:
+            logger.debug(f"Evicted {n_deleted} query cache entries")
+        return n_deleted
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".parquet"):
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
@@ -1,13 +1,17 @@
 # Import modules
+import atexit
 import datetime as dt
 import functools
 import logging
 import os
+import queue
 import subprocess
 import sys
+import threading
 
 # Import submodules
-from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
 
 # Import third-party modules
 from colorama import Fore
@@ -52,18 +56,225 @@ def _emit_log(
         logger.info("\n".join(header_lines + body_lines))
 
 
+# ============================================================================
+# Worker pools
+# ============================================================================
+
+# Executor classes by type
+_EXECUTOR_CLASSES = {
+    "process": ProcessPoolExecutor,
+    "thread": ThreadPoolExecutor,
+}
+
+# Maximum number of cached executors (least recently used ones are shut down)
+EXECUTOR_CACHE_SIZE = 8
+
+# Long-lived executors keyed by (executor_type, max_workers, initializer,
+# initargs, nesting depth), created lazily on first use, in LRU order
+_executors = OrderedDict()
+_executors_lock = threading.Lock()
+# Running parallel_execute calls per pool, and evicted pools waiting for
+# their last call to return before being shut down
+_executor_leases = {}
+_retired_executors = set()
+
+# Nesting depth of the current thread (0 outside cached pools)
+_worker_local = threading.local()
+
+
+def _init_worker(depth: int, initializer, initargs: tuple) -> None:
+    """Helper: record a worker's nesting depth, then run the user initializer."""
+    _worker_local.depth = depth
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _acquire_executor(
+    executor_type: str,
+    max_workers: int | None,
+    initializer,
+    initargs: tuple,
+    lease: bool = False,
+):
+    """Helper: get or create a cached pool, optionally leasing it.
+
+    A leased pool is never shut down by LRU eviction while in use: it is
+    retired instead and shut down by the :func:`_release_executor` call that
+    drops its last lease.
+    """
+    # Validate parameters
+    executor_type = executor_type.lower()
+    if executor_type not in _EXECUTOR_CLASSES:
+        raise ValueError(
+            f"Invalid executor_type '{executor_type}'. Allowed values are: "
+            f"{', '.join(repr(k) for k in _EXECUTOR_CLASSES)}."
+        )
+
+    # Get or create executor
+    depth = getattr(_worker_local, "depth", 0)
+    key = (executor_type, max_workers, initializer, tuple(initargs), depth)
+    evicted = []
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            logger.debug(
+                f"Creating {executor_type} pool (max_workers={max_workers}, "
+                f"depth={depth})"
+            )
+            executor = _EXECUTOR_CLASSES[executor_type](
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(depth + 1, initializer, tuple(initargs)),
+            )
+            _executors[key] = executor
+        else:
+            _executors.move_to_end(key)
+        if lease:
+            _executor_leases[executor] = _executor_leases.get(executor, 0) + 1
+        while len(_executors) > EXECUTOR_CACHE_SIZE:
+            old_executor = _executors.popitem(last=False)[1]
+            if _executor_leases.get(old_executor):
+                _retired_executors.add(old_executor)
+            else:
+                evicted.append(old_executor)
+
+    ## Shut evicted pools down outside the lock
+    for old_executor in evicted:
+        logger.debug("Shutting down least recently used worker pool")
+        old_executor.shutdown(wait=False)
+
+    return executor
+
+
+def _release_executor(executor) -> None:
+    """Helper: drop a lease taken by :func:`_acquire_executor` and shut the
+    pool down if it was evicted while leased."""
+    with _executors_lock:
+        n_leases = _executor_leases.pop(executor, 1) - 1
+        if n_leases > 0:
+            _executor_leases[executor] = n_leases
+            return
+        if executor not in _retired_executors:
+            return
+        _retired_executors.discard(executor)
+    logger.debug("Shutting down retired worker pool")
+    executor.shutdown(wait=False)
+
+
+def get_executor(
+    executor_type: str = "process",
+    max_workers: int | None = None,
+    initializer=None,
+    initargs: tuple = (),
+):
+    """
+    Get (or lazily create) a long-lived worker pool.
+
+    Pools are reused across calls so process spawn and module import costs
+    are paid once per configuration rather than once per call.
+
+    Nesting rule: a worker of a cached pool never gets its own pool back.
+    Calls made from inside a pool worker are served by a separate pool one
+    level deeper, so a task that fans out and waits on sub-tasks cannot
+    deadlock by filling every worker of its own pool.
+
+    At most :data:`EXECUTOR_CACHE_SIZE` pools are kept; the least recently
+    used one is shut down (without waiting) when a new one is created, so
+    already submitted work still runs but later submissions to it fail. Pools
+    in use by :func:`parallel_execute` are only shut down once those calls
+    return. Code that keeps submitting over a long time should own its
+    executor instead.
+
+    Parameters:
+        executor_type (str): ``'process'`` or ``'thread'``.
+        max_workers (int | None): Pool size (executor default when ``None``).
+        initializer (callable | None): Run once in each worker on start-up.
+        initargs (tuple): Arguments for ``initializer`` (must be hashable).
+
+    Returns:
+        concurrent.futures.Executor: The shared executor.
+    """
+    return _acquire_executor(executor_type, max_workers, initializer, initargs)
+
+
+def _discard_executor(executor) -> None:
+    """Helper: drop a (broken) executor from the cache and shut it down."""
+    with _executors_lock:
+        for key, cached in list(_executors.items()):
+            if cached is executor:
+                del _executors[key]
+        _retired_executors.discard(executor)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """
+    Shut down every cached worker pool.
+
+    Registered with ``atexit``; may also be called explicitly (e.g. between
+    jobs) to release workers. Pools are recreated on next use.
+
+    Parameters:
+        wait (bool): Block until running tasks finish.
+
+    Returns:
+        None
+    """
+    with _executors_lock:
+        executors = list(_executors.values()) + list(_retired_executors)
+        _executors.clear()
+        _retired_executors.clear()
+    for executor in executors:
+        try:
+            executor.shutdown(wait=wait)
+        except Exception as e:
+            logger.warning(f"Error shutting down worker pool: {e}")
+
+
+def _reset_after_fork() -> None:
+    """Helper: forget the parent's pools in a forked child (never shut them down)."""
+    global _executors_lock
+    _executors.clear()
+    _executor_leases.clear()
+    _retired_executors.clear()
+    _executors_lock = threading.Lock()
+
+
+atexit.register(shutdown_executors)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 # ============================================================================
 # Main functions
 # ============================================================================
 
 
-def parallel_execute(applyFunc, *args, **kwargs):
+def parallel_execute(
+    applyFunc,
+    *args,
+    executor_type: str = "process",
+    max_workers: int | None = None,
+    initializer=None,
+    initargs: tuple = (),
+    map_chunksize: int = 1,
+    **kwargs,
+):
     """
-    Execute a function in parallel using a ``ProcessPoolExecutor``.
+    Execute a function in parallel on a shared, long-lived worker pool.
+
+    Safe to call from inside a task of another ``parallel_execute`` call:
+    nested calls run on a separate pool (see :func:`get_executor`).
 
     Parameters:
         applyFunc: Callable to apply in parallel.
         *args: Iterables. One iterable per positional argument of ``applyFunc``.
+        executor_type (str): ``'process'`` (default) or ``'thread'``.
+        max_workers (int | None): Pool size (executor default when ``None``).
+        initializer (callable | None): Per-worker start-up hook.
+        initargs (tuple): Arguments for ``initializer``.
+        map_chunksize (int): Number of tasks sent to a process worker per
+                             round trip (ignored by thread pools).
         **kwargs: Keyword arguments bound to ``applyFunc`` via ``functools.partial``
                   before parallel execution.
 
@@ -77,12 +288,108 @@ def parallel_execute(applyFunc, *args, **kwargs):
         func = applyFunc
 
     # Run in parallel and materialise results
-    with ProcessPoolExecutor() as executor:
-        results = list(executor.map(func, *args))
+    ## The lease keeps LRU eviction by other threads from shutting the pool
+    ## down before (or while) this call submits its tasks
+    executor = _acquire_executor(
+        executor_type, max_workers, initializer, initargs, lease=True
+    )
+    try:
+        results = list(executor.map(func, *args, chunksize=map_chunksize))
+    except BrokenExecutor:
+        # A dead worker poisons the whole pool; drop it so the next call
+        # starts a fresh one
+        logger.error(f"{Fore.RED}Worker pool broken, discarding it{Fore.RESET}")
+        _discard_executor(executor)
+        raise
+    finally:
+        _release_executor(executor)
 
     return results
 
 
+def iter_from_workers(
+    produce,
+    work_items,
+    max_workers: int,
+    max_queue_size: int = 8,
+    name: str = "worker",
+):
+    """
+    Yield what ``produce(work_item)`` yields for several work items at once.
+
+    Dedicated worker threads take work items (S3 prefixes, scan segments,
+    read streams, ...) from a shared queue and hand their output over
+    through a bounded queue, so at most ``max_queue_size`` items are held in
+    memory whatever the consumer's pace. Output of different work items
+    interleaves. Errors raised by ``produce`` are re-raised in the consumer;
+    closing the generator stops the workers.
+
+    Parameters:
+        produce (callable): Called with one work item, returns an iterable.
+        work_items (iterable): Work items to distribute.
+        max_workers (int): Worker threads (capped by the number of work items).
+        max_queue_size (int): Items buffered between workers and consumer.
+        name (str): Thread name prefix.
+
+    Returns:
+        generator: Produced items, in completion order.
+    """
+    todo = queue.Queue()
+    for work_item in work_items:
+        todo.put(work_item)
+    buffer = queue.Queue(maxsize=max(1, int(max_queue_size)))
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _work():
+        try:
+            while not stop.is_set():
+                try:
+                    work_item = todo.get_nowait()
+                except queue.Empty:
+                    return
+                for item in produce(work_item):
+                    if not _put(("data", item)):
+                        return
+        except BaseException as e:  # handed over to the consumer
+            _put(("error", e))
+        finally:
+            _put(("done", None))
+
+    # Start workers
+    n_workers = max(1, min(int(max_workers), todo.qsize()))
+    workers = [
+        threading.Thread(target=_work, name=f"{name}-{i}", daemon=True)
+        for i in range(n_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    # Hand items over until every worker is done
+    n_done = 0
+    try:
+        while n_done < n_workers:
+            kind, payload = buffer.get()
+            if kind == "done":
+                n_done += 1
+            elif kind == "error":
+                raise payload
+            else:
+                yield payload
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+
 def mk_exec_logs(
     file_path: str,
     file_name: str,
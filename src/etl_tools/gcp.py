@@ -1,19 +1,28 @@
 # Import modules
+import functools
 import json
 import logging
 import os  # noqa: F401  (kept for backwards compatibility of public surface)
+import re
 import time
 
 # Import third-party modules
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from google.api_core import exceptions as gcp_exceptions
-from google.cloud import bigquery, storage
+from google.cloud import bigquery, bigquery_storage, storage
 from googleapiclient import discovery
 from googleapiclient.errors import HttpError
 
 # Import submodules
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+# Import custom modules
+from etl_tools.execution import iter_from_workers
+
 
 # Module-level logger
 logger = logging.getLogger(__name__)
@@ -336,6 +345,13 @@ def gcs_delete_files(
 # BigQuery Functions
 # ============================================================================
 
+# Upper bound on concurrent Storage Read API stream readers per read
+BIGQUERY_MAX_READ_WORKERS = 16
+
+# Queries whose row order must survive the read (same test as
+# google-cloud-bigquery's own Storage API downloads)
+_CONTAINS_ORDER_BY = re.compile(r"ORDER\s+BY", re.IGNORECASE)
+
 
 def bigquery_to_gcs(
     project_id,
@@ -438,6 +454,295 @@ def bigquery_to_gcs(
     return extract_job
 
 
+def _bigquery_read_stream(bqstorage_client, stream_name, read_session):
+    """Download one Storage Read API stream as a ``pyarrow.Table``."""
+    return bqstorage_client.read_rows(stream_name).to_arrow(read_session)
+
+
+def _iter_bigquery_batches(
+    bqstorage_client, read_session, stream_names, max_workers, max_queue_size
+):
+    """
+    Yield ``pyarrow.RecordBatch`` pages from several read streams at once.
+
+    Worker threads read the streams and hand pages over through a bounded
+    queue (``iter_from_workers``), so at most ``max_queue_size`` pages are
+    held in memory. Closing the generator stops the workers.
+    """
+
+    def _read(name):
+        reader = bqstorage_client.read_rows(name)
+        for page in reader.rows(read_session).pages:
+            yield page.to_arrow()
+
+    return iter_from_workers(
+        _read,
+        stream_names,
+        max_workers,
+        max_queue_size=max_queue_size,
+        name="bigquery-read",
+    )
+
+
+def bigquery_read_data(
+    sql_stmt,
+    project_id,
+    location=None,
+    output="table",
+    max_streams=None,
+    max_workers=None,
+    max_queue_size=8,
+    bq_client=None,
+    bqstorage_client=None,
+    preserve_order=None,
+):
+    """
+    Run a query and download its result through the BigQuery Storage Read
+    API, reading several streams in parallel.
+
+    The query runs once: if the read session cannot be opened, or a stream
+    fails (except in 'batches' mode), the finished job's result is read
+    through the REST API instead. Rows of parallel streams interleave, so
+    ordered queries are read through a single stream.
+
+    Parameters:
+        sql_stmt: str. SQL statement.
+        project_id: str. GCP project ID (billed for the query and the read session).
+        location: str. Optional. Query location (auto-detected if None).
+        output: str. 'table' (pyarrow.Table), 'pandas' (DataFrame) or 'batches'
+                (iterator of pyarrow.RecordBatch, constant memory). Default 'table'.
+        max_streams: int. Optional. Maximum read streams (server decides if None).
+        max_workers: int. Optional. Concurrent stream readers (one per stream if None,
+                     at most BIGQUERY_MAX_READ_WORKERS).
+        max_queue_size: int. Pages buffered between readers and caller ('batches' only).
+        bq_client: google.cloud.bigquery.Client. Optional. BigQuery client.
+        bqstorage_client: google.cloud.bigquery_storage.BigQueryReadClient. Optional.
+        preserve_order: bool. Optional. Read a single stream to keep the query's row
+                        order (True if the statement has an ORDER BY when None).
+
+    Returns:
+        result: pyarrow.Table, pandas.DataFrame or iterator of pyarrow.RecordBatch.
+    """
+    if output not in ("table", "pandas", "batches"):
+        raise ValueError(
+            f"Invalid output '{output}'. Allowed values are: 'table', 'pandas', 'batches'."
+        )
+    if bq_client is None:
+        bq_client = bigquery.Client(project=project_id, location=location)
+    if bqstorage_client is None:
+        bqstorage_client = bigquery_storage.BigQueryReadClient()
+    if preserve_order is None:
+        preserve_order = bool(_CONTAINS_ORDER_BY.search(sql_stmt))
+
+    ## Run query (results land in an anonymous destination table)
+    try:
+        query_job = bq_client.query(sql_stmt, location=location)
+        rows = query_job.result()
+    except gcp_exceptions.GoogleAPIError as e:
+        logger.error(f"BigQuery query failed -> {type(e).__name__}: {e}")
+        raise
+
+    ## Open a read session over the destination table
+    destination = query_job.destination
+    stream_names = []
+    if destination is not None:
+        try:
+            read_session = bqstorage_client.create_read_session(
+                parent=f"projects/{project_id}",
+                read_session=bigquery_storage.types.ReadSession(
+                    table=(
+                        f"projects/{destination.project}/datasets/"
+                        f"{destination.dataset_id}/tables/{destination.table_id}"
+                    ),
+                    data_format=bigquery_storage.types.DataFormat.ARROW,
+                ),
+                max_stream_count=1 if preserve_order else (max_streams or 0),
+            )
+            stream_names = [stream.name for stream in read_session.streams]
+        except Exception as e:
+            logger.warning(
+                f"BigQuery read session failed, reading the result through "
+                f"the REST API -> {type(e).__name__}: {e}"
+            )
+    logger.info(
+        f"Reading BigQuery result ({rows.total_rows} rows) with "
+        f"{len(stream_names)} stream(s)..."
+    )
+
+    ## Download streams
+    n_workers = min(
+        max_workers or len(stream_names) or 1, BIGQUERY_MAX_READ_WORKERS
+    )
+    table = None
+    if not stream_names:
+        # Empty results (and statements without a destination) have no
+        # streams; the REST result still carries the schema
+        if output == "batches" and rows.total_rows:
+            return rows.to_arrow_iterable()
+    elif output == "batches":
+        return _iter_bigquery_batches(
+            bqstorage_client, read_session, stream_names, n_workers, max_queue_size
+        )
+    else:
+        # A dedicated pool, shut down after the read, so stream readers never
+        # wait on workers of the (possibly busy) shared pools
+        try:
+            with ThreadPoolExecutor(
+                max_workers=n_workers, thread_name_prefix="bigquery-read"
+            ) as executor:
+                tables = list(
+                    executor.map(
+                        functools.partial(
+                            _bigquery_read_stream,
+                            bqstorage_client,
+                            read_session=read_session,
+                        ),
+                        stream_names,
+                    )
+                )
+            table = pa.concat_tables(tables)
+        except Exception as e:
+            logger.warning(
+                f"BigQuery stream read failed, reading the result through "
+                f"the REST API -> {type(e).__name__}: {e}"
+            )
+    if table is None:
+        table = rows.to_arrow(create_bqstorage_client=False)
+        if output == "batches":
+            return iter(table.to_batches())
+
+    return table.to_pandas() if output == "pandas" else table
+
+
+#: Parquet (Arrow) column types matching each BigQuery load schema type.
+#: NUMERIC is written as DECIMAL(38, 9) and DATETIME as a timestamp without
+#: time zone, so BigQuery does not reject FLOAT or UTC TIMESTAMP columns.
+_PARQUET_TYPES = {
+    "BOOL": pa.bool_(),
+    "BOOLEAN": pa.bool_(),
+    "INT64": pa.int64(),
+    "INTEGER": pa.int64(),
+    "FLOAT64": pa.float64(),
+    "FLOAT": pa.float64(),
+    "NUMERIC": pa.decimal128(38, 9),
+    "BIGNUMERIC": pa.decimal256(76, 38),
+    "DATETIME": pa.timestamp("us"),
+    "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+    "DATE": pa.date32(),
+    "TIME": pa.time64("us"),
+    "STRING": pa.string(),
+    "BYTES": pa.binary(),
+}
+
+
+def _parquet_table(df, schema):
+    """
+    Convert a DataFrame to a pyarrow.Table whose columns have the Parquet
+    types of their BigQuery schema fields (see _PARQUET_TYPES).
+
+    Floats cast to NUMERIC/BIGNUMERIC are rounded to the decimal scale and
+    time zone aware timestamps cast to DATETIME keep their UTC wall time.
+    Sub-microsecond timestamp precision is dropped (BigQuery stores
+    microseconds); any other lossy cast raises pyarrow.ArrowInvalid.
+
+    Parameters:
+        df: pandas.DataFrame. Data to convert.
+        schema: list[google.cloud.bigquery.SchemaField]. Load schema.
+
+    Returns:
+        table: pyarrow.Table. Data with the declared column types.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    field_types = {field.name: field.field_type.upper() for field in schema}
+    for i, name in enumerate(table.column_names):
+        target = _PARQUET_TYPES.get(field_types.get(name))
+        column = table.column(i)
+        if target is None or column.type == target:
+            continue
+        if pa.types.is_decimal(target) and pa.types.is_floating(column.type):
+            column = pc.round(column, target.scale)
+        column = column.cast(target, safe=not pa.types.is_timestamp(target))
+        table = table.set_column(i, pa.field(name, target), column)
+    ## The pandas metadata still describes the original dtypes
+    return table.replace_schema_metadata()
+
+
+def bigquery_upload_data(
+    df,
+    project_id,
+    dataset_id,
+    table_id,
+    schema=None,
+    write_disposition="WRITE_APPEND",
+    location=None,
+    bq_client=None,
+):
+    """
+    Upload a DataFrame to a BigQuery table with a single load job.
+
+    The frame is serialized to Parquet in memory and loaded with
+    load_table_from_file, so no GCS staging or row INSERT quota is involved
+    and the load is atomic.
+
+    Parameters:
+        df: pandas.DataFrame. Data to upload.
+        project_id: str. GCP project ID.
+        dataset_id: str. BigQuery dataset ID.
+        table_id: str. BigQuery table ID.
+        schema: list[google.cloud.bigquery.SchemaField]. Optional. Schema covering
+                every column (taken from the Parquet file if None). Columns are
+                cast to the matching Parquet types before writing (see
+                _parquet_table).
+        write_disposition: str. WRITE_APPEND, WRITE_TRUNCATE or WRITE_EMPTY. Default 'WRITE_APPEND'.
+        location: str. Optional. Dataset location.
+        bq_client: google.cloud.bigquery.Client. Optional. BigQuery client.
+
+    Returns:
+        rows: int. Number of rows loaded.
+    """
+    if bq_client is None:
+        bq_client = bigquery.Client(project=project_id, location=location)
+    table_id = f"{project_id}.{dataset_id}.{table_id}"
+
+    ## Serialize to Parquet in memory, typed as the declared schema
+    buffer = BytesIO()
+    if schema:
+        pq.write_table(_parquet_table(df, schema), buffer)
+    else:
+        df.to_parquet(buffer, engine="pyarrow", index=False)
+    buffer.seek(0)
+
+    ## Create load job config
+    load_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.PARQUET,
+        write_disposition=write_disposition,
+    )
+    if schema:
+        load_config.schema = schema
+
+    ## Create and run load job
+    logger.info(f"Loading {df.shape[0]} rows into {table_id}...")
+    try:
+        load_job = bq_client.load_table_from_file(
+            buffer, table_id, job_config=load_config, location=location
+        )
+        load_job.result()
+    except gcp_exceptions.GoogleAPIError as e:
+        logger.error(
+            f"BigQuery load job failed for table '{table_id}' -> "
+            f"{type(e).__name__}: {e}"
+        )
+        raise
+
+    if load_job.errors:
+        logger.error(
+            f"BigQuery load job for '{table_id}' completed with errors: "
+            f"{load_job.errors}"
+        )
+
+    return load_job.output_rows
+
+
 def gcs_to_bigquery(
     gcs_file_path,
     project_id,
@@ -1,28 +1,55 @@
 # Import modules
 import ast
+import atexit
 import datetime as dt
+import functools
+import gzip
+import hashlib
 import importlib
+import io
+import json
 import logging
 import multiprocessing
 import os
 import sys
+import threading
+import time
 import traceback
+import uuid
 
 # Import third-party modules
 import numpy as np
 import pandas as pd
+import psycopg2
+import pyarrow as pa
 import pyodbc
 import pyspark as ps
 import redshift_connector
 import oracledb
 import sqlalchemy
+from google.cloud import bigquery
 
 # Import submodules
 from sqlalchemy import create_engine
 from sqlalchemy.schema import DDL
+from urllib.parse import quote_plus
+
+# Import optional modules (Arrow-native drivers, see _read_arrow)
+try:
+    import adbc_driver_postgresql.dbapi as adbc_postgresql
+except ImportError:
+    adbc_postgresql = None
 
 # Import custom modules
-from etl_tools.execution import mk_err_logs, mk_texec_logs, parallel_execute
+from etl_tools.aws import s3_delete_objects, s3_put_object
+from etl_tools.cache import QueryResultCache
+from etl_tools.gcp import bigquery_read_data, bigquery_upload_data
+from etl_tools.execution import (
+    iter_from_workers,
+    mk_err_logs,
+    mk_texec_logs,
+    parallel_execute,
+)
 
 
 # Module-level logger
@@ -511,6 +538,50 @@ def create_mysql_engine(conn_dict: dict, **kwargs):
     )
 
 
+def create_postgresql_engine(conn_dict: dict, **kwargs):
+    """
+    Create a PostgreSQL SQLAlchemy engine from a connection dictionary.
+
+    Parameters:
+        conn_dict (dict): Connection info including ``server``, ``database``,
+                          ``username``, ``password`` and optionally ``port``
+                          and ``sslmode``.
+        **kwargs: Extra arguments forwarded to ``create_sqlalchemy_engine``.
+
+    Returns:
+        sqlalchemy.engine.Engine: PostgreSQL engine (``psycopg2`` driver).
+    """
+    port = conn_dict.get(
+        "port", kwargs.get("port") if kwargs.get("port") is not None else 5432
+    )
+    connect_args = (
+        {"sslmode": conn_dict["sslmode"]}
+        if "sslmode" in conn_dict
+        else (kwargs.get("connect_args") or {})
+    )
+
+    default_custom_conn_str = (
+        f"postgresql+psycopg2://{conn_dict['username']}:{conn_dict['password']}"
+        f"@{conn_dict['server']}:{port}/{conn_dict['database']}"
+    )
+    custom_conn_str = conn_dict.get(
+        "custom_conn_str", kwargs.get("custom_conn_str") or default_custom_conn_str
+    )
+
+    new_kwargs = {
+        k: v
+        for k, v in kwargs.items()
+        if k not in ("port", "connect_args", "custom_conn_str")
+    }
+
+    return create_sqlalchemy_engine(
+        conn_dict,
+        custom_conn_str=custom_conn_str,
+        connect_args=connect_args,
+        **new_kwargs,
+    )
+
+
 def create_cloudsql_engine(conn_dict: dict, **kwargs):
     """
     Create a Cloud SQL SQLAlchemy engine from a connection dictionary.
@@ -642,6 +713,21 @@ def create_oracle_conn(conn_dict: dict, **kwargs):
     )
 
 
+def create_postgresql_conn(conn_dict: dict, **kwargs):
+    """Open a raw PostgreSQL connection using ``psycopg2``."""
+    conn_dict.setdefault("port", 5432)
+    if "sslmode" in conn_dict:
+        kwargs.setdefault("sslmode", conn_dict["sslmode"])
+    return psycopg2.connect(
+        host=conn_dict["server"],
+        dbname=conn_dict["database"],
+        port=conn_dict["port"],
+        user=conn_dict["username"],
+        password=conn_dict["password"],
+        **kwargs,
+    )
+
+
 def create_mysql_conn(conn_dict: dict, **kwargs):
     """Open a raw MySQL connection using ``pyodbc``."""
     conn_dict.setdefault("driver", "{MySQL ODBC 8.0 Unicode Driver}")
@@ -679,25 +765,35 @@ def create_pyodbc_conn(conn_dict: dict, **kwargs):
 
 _CONN_FACTORIES = {
     "pyodbc": create_pyodbc_conn,
+    "mssql": create_pyodbc_conn,
     "redshift": create_redshift_conn,
     "sqlalchemy": create_sqlalchemy_conn,
     "oracledb": create_oracle_conn,
     "bigquery": create_bigquery_conn,
     "cloudsql": create_cloudsql_conn,
     "mysql": create_mysql_conn,
+    "postgresql": create_postgresql_conn,
 }
 
 _ENGINE_FACTORIES = {
     "pyodbc": create_sqlalchemy_engine,
+    "mssql": create_sqlalchemy_engine,
     "sqlalchemy": create_sqlalchemy_engine,
     "redshift": create_redshift_engine,
     "oracledb": create_oracle_engine,
     "bigquery": create_bigquery_engine,
     "cloudsql": create_cloudsql_engine,
     "mysql": create_mysql_engine,
+    "postgresql": create_postgresql_engine,
 }
 
 
+#: Connection modes whose factory is a thin ``engine.connect()`` wrapper. For
+#: these, :func:`_make_conn` checks a connection out of the pooled engine held
+#: by :data:`engine_registry` instead of building a fresh engine per call.
+_POOLED_CONN_MODES: frozenset[str] = frozenset({"sqlalchemy", "bigquery", "cloudsql"})
+
+
 def _make_conn(mode: str, conn_dict: dict, **kwargs):
     mode_l = mode.lower()
     if mode_l not in _CONN_FACTORIES:
@@ -706,6 +802,8 @@ def _make_conn(mode: str, conn_dict: dict, **kwargs):
             f"Allowed modes: {sorted(_CONN_FACTORIES)}"
         )
     logger.info(f"Connecting to database (mode={mode_l})...")
+    if mode_l in _POOLED_CONN_MODES:
+        return engine_registry.get(mode_l, conn_dict, **kwargs).connect()
     return _CONN_FACTORIES[mode_l](conn_dict, **kwargs)
 
 
@@ -719,44 +817,395 @@ def _make_engine(mode: str, conn_dict: dict, **kwargs):
     return _ENGINE_FACTORIES[mode_l](conn_dict, **kwargs)
 
 
+# ============================================================================
+# Engine registry
+# ============================================================================
+
+
+def _normalize_conn_key(mode: str, conn_dict: dict | None, kwargs: dict) -> str:
+    """Return a stable digest identifying an engine configuration.
+
+    ``conn_dict`` and the engine kwargs (``custom_conn_str``, ``connect_args``,
+    ...) are serialised with sorted keys so that logically identical
+    dictionaries map to the same engine. Values that are not JSON
+    serialisable (e.g. a Cloud SQL ``Connector``) fall back to ``repr``.
+    The digest is used instead of the raw values so credentials never end up
+    in registry keys or log messages.
+    """
+    payload = json.dumps(
+        {"mode": mode.lower(), "conn_dict": conn_dict or {}, "kwargs": kwargs},
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EngineRegistry(object):
+    """
+    Process-wide, thread-safe cache of SQLAlchemy engines.
+
+    Engines are keyed by ``mode`` + normalised ``conn_dict`` + engine kwargs
+    (see :func:`_normalize_conn_key`), so repeated calls against the same
+    database reuse one engine and its connection pool instead of paying a
+    full TCP/TLS/auth handshake per call. Engines that have not been requested
+    for ``idle_timeout`` seconds are disposed lazily on the next lookup.
+
+    A module-level instance, :data:`engine_registry`, is used by every helper
+    in this module and is closed automatically at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_recycle: int = 1800,
+        idle_timeout: float | None = 600,
+    ):
+        """
+        Class constructor.
+
+        Parameters:
+            pool_size (int): Connections kept open per engine.
+            max_overflow (int): Extra connections allowed above ``pool_size``.
+            pool_recycle (int): Seconds after which pooled connections are
+                                recycled (guards against server-side timeouts).
+            idle_timeout (float | None): Seconds an engine may stay unused
+                                before it is disposed. ``None`` disables
+                                idle eviction.
+        """
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_recycle = pool_recycle
+        self.idle_timeout = idle_timeout
+        self._engines: dict[str, dict] = {}
+        self._lock = threading.RLock()
+
+    def configure(self, **settings) -> None:
+        """Update pool settings (``pool_size``, ``max_overflow``,
+        ``pool_recycle``, ``idle_timeout``).
+
+        Only engines created after the call pick up the new pool settings.
+        """
+        allowed = ("pool_size", "max_overflow", "pool_recycle", "idle_timeout")
+        unknown = set(settings) - set(allowed)
+        if unknown:
+            raise ValueError(
+                f"Unknown engine registry setting(s): {sorted(unknown)}. "
+                f"Allowed settings: {list(allowed)}"
+            )
+        with self._lock:
+            for k, v in settings.items():
+                setattr(self, k, v)
+
+    def _create(self, mode: str, conn_dict: dict, **kwargs):
+        """Build a new pooled engine through :func:`_make_engine`."""
+        pool_kwargs = {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": True,
+        }
+        # Caller-supplied pool settings take precedence
+        pool_kwargs = {k: v for k, v in pool_kwargs.items() if k not in kwargs}
+        try:
+            return _make_engine(mode, conn_dict, **pool_kwargs, **kwargs)
+        except TypeError as e:
+            # Some dialects (e.g. SQLite in-memory, StaticPool) reject
+            # QueuePool-specific arguments
+            logger.info(
+                f"Pool arguments not supported for mode '{mode}' -> {e}. "
+                "Creating engine with dialect defaults..."
+            )
+            return _make_engine(mode, conn_dict, **kwargs)
+
+    def get(self, mode: str, conn_dict: dict, **kwargs):
+        """
+        Return a cached engine for the given configuration, creating it if
+        needed.
+
+        Parameters:
+            mode (str): Engine mode (see :data:`_ENGINE_FACTORIES`).
+            conn_dict (dict): Connection info.
+            **kwargs: Extra arguments forwarded to the engine factory
+                      (``custom_conn_str``, ``connect_args``, ...).
+
+        Returns:
+            sqlalchemy.engine.Engine: Shared, pooled engine.
+        """
+        key = _normalize_conn_key(mode, conn_dict, kwargs)
+        self.evict_idle()
+        with self._lock:
+            entry = self._engines.get(key)
+            if entry is None:
+                logger.info(f"Creating pooled engine (mode={mode.lower()})...")
+                entry = {"engine": self._create(mode, conn_dict, **kwargs)}
+                self._engines[key] = entry
+            entry["last_used"] = time.monotonic()
+            return entry["engine"]
+
+    def evict_idle(self, idle_timeout: float | None = None) -> int:
+        """
+        Dispose engines unused for more than ``idle_timeout`` seconds.
+
+        Parameters:
+            idle_timeout (float | None): Override for :attr:`idle_timeout`.
+
+        Returns:
+            int: Number of engines disposed.
+        """
+        idle_timeout = self.idle_timeout if idle_timeout is None else idle_timeout
+        if idle_timeout is None:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                k
+                for k, entry in self._engines.items()
+                if now - entry["last_used"] > idle_timeout
+            ]
+            entries = [self._engines.pop(k) for k in stale]
+        for entry in entries:
+            entry["engine"].dispose()
+        if entries:
+            logger.info(f"Disposed {len(entries)} idle engine(s)")
+        return len(entries)
+
+    def close_all(self) -> None:
+        """Dispose every cached engine and close their pooled connections."""
+        with self._lock:
+            entries = list(self._engines.values())
+            self._engines.clear()
+        for entry in entries:
+            try:
+                entry["engine"].dispose()
+            except Exception as e:
+                logger.warning(f"Error disposing engine -> {type(e)} - {e}")
+
+    def _reset_after_fork(self) -> None:
+        """Drop inherited engines in a forked child without closing the
+        parent's sockets (see SQLAlchemy's "Using Connection Pools with
+        Multiprocessing")."""
+        for entry in self._engines.values():
+            entry["engine"].dispose(close=False)
+        self._engines = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+
+#: Shared registry used by the read/upload/exec helpers of this module.
+engine_registry = EngineRegistry()
+
+atexit.register(engine_registry.close_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=engine_registry._reset_after_fork)
+
+
 # ============================================================================
 # Data manipulation
 # ============================================================================
 
 
-def to_sql_executemany(data, conn_dict, schema, table_name, mode, **kwargs):
+#: DB-API parameter style of the raw driver behind each connection mode.
+_PARAMSTYLE_BY_MODE: dict[str, str] = {
+    "pyodbc": "qmark",
+    "mssql": "qmark",
+    "mysql": "qmark",
+    "oracledb": "numeric",
+    "redshift": "format",
+    "postgresql": "format",
+}
+
+
+def _insert_stmt(schema, table_name, columns, paramstyle="qmark") -> str:
+    """Build a positional ``INSERT`` statement for the given paramstyle."""
+    columns = [str(col) for col in columns]
+    if paramstyle == "numeric":
+        placeholders = [f":{i + 1}" for i in range(len(columns))]
+    elif paramstyle == "format":
+        placeholders = ["%s"] * len(columns)
+    else:
+        placeholders = ["?"] * len(columns)
+    target = f"{schema}.{table_name}" if schema else table_name
+    return (
+        f"INSERT INTO {target} ({','.join(columns)}) "
+        f"VALUES ({','.join(placeholders)})"
+    )
+
+
+def _column_to_list(col) -> list:
+    """Convert a column to a list of Python objects with missing values as
+    ``None`` (vectorised per column instead of per cell)."""
+    values = col.astype(object)
+    mask = col.isna()
+    if mask.any():
+        values = values.where(~mask, None)
+    return values.tolist()
+
+
+def _iter_row_batches(data, batch_rows: int):
+    """Yield ``data`` as lists of row tuples, ``batch_rows`` rows at a time.
+
+    Only one slice is converted to Python objects at any point, so peak
+    memory is proportional to ``batch_rows`` rather than to the frame size.
+    """
+    batch_rows = max(1, int(batch_rows))
+    for start in range(0, data.shape[0], batch_rows):
+        batch = data.iloc[start:start + batch_rows]
+        columns = [_column_to_list(batch.iloc[:, i]) for i in range(batch.shape[1])]
+        yield list(zip(*columns))
+
+
+def to_sql_executemany(
+    data, conn_dict, schema, table_name, mode, batch_rows=None, **kwargs
+):
     """
     Upload data to a database table using ``cursor.executemany``.
 
+    Placeholders follow the parameter style of the driver behind ``mode``
+    (see :data:`_PARAMSTYLE_BY_MODE`). For ``pyodbc`` connections
+    ``fast_executemany`` is enabled.
+
+    Rows are converted and sent ``batch_rows`` at a time (see
+    :func:`_iter_row_batches`), all within one transaction, so peak memory
+    is proportional to the batch size rather than the frame size.
+
     Parameters:
         data (pd.DataFrame): Data to upload.
         conn_dict (dict): Connection info.
         schema (str): Schema name.
         table_name (str): Target table.
         mode (str): One of the keys in :data:`_CONN_FACTORIES`.
+        batch_rows (int | None): Rows per ``executemany`` call
+                                 (default ``10000``).
         **kwargs: Extra arguments forwarded to the connection factory.
 
     Returns:
         int: Number of rows affected.
     """
+    batch_rows = batch_rows or 10000
     sql_conn = _make_conn(mode, conn_dict, **kwargs)
 
     logger.info("Executing statement...")
-    sql_stmt = (
-        f"INSERT INTO {schema}.{table_name} "
-        f"({','.join(col for col in data.columns)}) "
-        f"VALUES ({','.join(f':{col}' for col in data.columns)})"
+    sql_stmt = _insert_stmt(
+        schema,
+        table_name,
+        data.columns,
+        _PARAMSTYLE_BY_MODE.get(mode.lower(), "qmark"),
     )
-    data_rows = [tuple(x) for x in data.to_numpy()]
+    response_rows_affected = 0
     with sql_conn:
         cursor = sql_conn.cursor()
-        cursor.executemany(sql_stmt, data_rows)
-        response_rows_affected = cursor.rowcount
+        if isinstance(sql_conn, pyodbc.Connection):
+            cursor.fast_executemany = True
+        for data_rows in _iter_row_batches(data, batch_rows):
+            cursor.executemany(sql_stmt, data_rows)
+            ## Some drivers report -1 for executemany
+            response_rows_affected += (
+                cursor.rowcount if cursor.rowcount >= 0 else len(data_rows)
+            )
         sql_conn.commit()
 
     return response_rows_affected
 
 
+def _mssql_input_sizes(dtypes_dict, columns) -> list | None:
+    """Map SQLAlchemy dtype instances to ``pyodbc`` ``setinputsizes`` specs.
+
+    Declaring sizes up front lets ``fast_executemany`` allocate parameter
+    arrays once instead of re-binding (and falling back to slow
+    ``nvarchar(max)`` streaming) when string lengths vary. Returns ``None``
+    unless every column has a mappable type. Unbounded ``String``/``Text``
+    columns also return ``None``: a size of ``0`` would declare them as
+    ``nvarchar(max)``, the slow path this is meant to avoid.
+    """
+    if not dtypes_dict:
+        return None
+    sizes = []
+    for col in columns:
+        sql_type = dtypes_dict.get(col)
+        if isinstance(sql_type, type):
+            sql_type = sql_type()
+        if isinstance(sql_type, sqlalchemy.String):
+            if not sql_type.length:
+                return None
+            sizes.append((pyodbc.SQL_WVARCHAR, sql_type.length, 0))
+        elif isinstance(sql_type, sqlalchemy.Boolean):
+            sizes.append((pyodbc.SQL_BIT, 0, 0))
+        elif isinstance(sql_type, sqlalchemy.BigInteger):
+            sizes.append((pyodbc.SQL_BIGINT, 0, 0))
+        elif isinstance(sql_type, sqlalchemy.Integer):
+            sizes.append((pyodbc.SQL_INTEGER, 0, 0))
+        elif isinstance(sql_type, sqlalchemy.Float):
+            sizes.append((pyodbc.SQL_DOUBLE, 0, 0))
+        elif isinstance(sql_type, sqlalchemy.Numeric):
+            sizes.append(
+                (pyodbc.SQL_DECIMAL, sql_type.precision or 38, sql_type.scale or 0)
+            )
+        elif isinstance(sql_type, sqlalchemy.DateTime):
+            sizes.append((pyodbc.SQL_TYPE_TIMESTAMP, 27, 7))
+        elif isinstance(sql_type, sqlalchemy.Date):
+            sizes.append((pyodbc.SQL_TYPE_DATE, 0, 0))
+        else:
+            return None
+    return sizes
+
+
+def to_sql_mssql_fast(
+    data, engine, schema, table_name, dtypes_dict=None, batch_rows=None
+):
+    """
+    Upload data to SQL Server with ``pyodbc`` ``fast_executemany``.
+
+    Rows are bound with ``?`` placeholders and sent as parameter arrays of
+    ``batch_rows`` rows per ``executemany`` call, all in one transaction on a
+    raw connection checked out of ``engine``'s pool. Input sizes are declared
+    from ``dtypes_dict`` when every column can be mapped (see
+    :func:`_mssql_input_sizes`).
+
+    Parameters:
+        data (pd.DataFrame): Data to upload.
+        engine (sqlalchemy.engine.Engine): ``mssql+pyodbc`` engine.
+        schema (str): Schema name.
+        table_name (str): Target table.
+        dtypes_dict (dict | None): SQLAlchemy dtype dict used for input sizes.
+        batch_rows (int | None): Rows per parameter array (default ``10000``).
+
+    Returns:
+        int: Number of rows inserted.
+
+    Raises:
+        ValueError: If ``engine`` is not a SQL Server ``pyodbc`` engine.
+    """
+    if engine.dialect.name != "mssql" or engine.dialect.driver != "pyodbc":
+        raise ValueError(
+            "'fast_executemany' upload method requires an mssql+pyodbc engine, "
+            f"got '{engine.dialect.name}+{engine.dialect.driver}'."
+        )
+    batch_rows = batch_rows or 10000
+
+    sql_stmt = _insert_stmt(schema, table_name, data.columns, "qmark")
+    input_sizes = _mssql_input_sizes(dtypes_dict, data.columns)
+
+    raw_conn = engine.raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        cursor.fast_executemany = True
+        if input_sizes is not None:
+            cursor.setinputsizes(input_sizes)
+        for rows in _iter_row_batches(data, batch_rows):
+            cursor.executemany(sql_stmt, rows)
+        raw_conn.commit()
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
+
+    return data.shape[0]
+
+
 def to_sql_redshift_spark(data, schema, table_name, conn_dict, mode="append", **kwargs):
     """
     Upload data to Redshift using Spark.
@@ -793,156 +1242,851 @@ def to_sql_redshift_spark(data, schema, table_name, conn_dict, mode="append", **
     return spark_df.count()
 
 
-def parallel_to_sql(
-    df,
-    table_name,
-    schema,
-    mode,
-    conn_dict,
-    custom_conn_str,
-    connect_args,
-    chunksize,
-    method,
-    dtypes_dict,
-    spark_mode="append",
-    **kwargs,
-):
+class _DataFrameCsvStream(object):
     """
-    Upload data to a database table using one of several strategies.
+    Read-only, file-like CSV view over a DataFrame.
+
+    Rows are rendered with ``DataFrame.to_csv`` one slice of ``batch_rows`` at
+    a time as the consumer calls :meth:`read`, so feeding the stream to
+    ``COPY ... FROM STDIN`` never materialises the whole frame as text (and
+    never touches disk).
+    """
+
+    def __init__(self, data, batch_rows: int = 10000, **csv_kwargs):
+        self._data = data
+        self._batch_rows = max(1, int(batch_rows))
+        self._csv_kwargs = csv_kwargs
+        self._pos = 0
+        self._buffer = ""
+        self._offset = 0
+
+    def _fill(self) -> bool:
+        """Render the next slice into the buffer. Returns ``False`` at EOF."""
+        if self._pos >= self._data.shape[0]:
+            return False
+        batch = self._data.iloc[self._pos:self._pos + self._batch_rows]
+        self._buffer = batch.to_csv(header=False, index=False, **self._csv_kwargs)
+        self._offset = 0
+        self._pos += batch.shape[0]
+        return True
+
+    def read(self, size: int = -1) -> str:
+        parts = []
+        remaining = size
+        while size < 0 or remaining > 0:
+            if self._offset >= len(self._buffer) and not self._fill():
+                break
+            if size < 0:
+                piece = self._buffer[self._offset:]
+            else:
+                piece = self._buffer[self._offset:self._offset + remaining]
+                remaining -= len(piece)
+            self._offset += len(piece)
+            parts.append(piece)
+        return "".join(parts)
+
+
+def to_sql_postgres_copy(data, engine, schema, table_name, batch_rows=10000):
+    """
+    Upload data to a PostgreSQL table using ``COPY ... FROM STDIN``.
+
+    The DataFrame is streamed as CSV through :class:`_DataFrameCsvStream`
+    on a raw driver connection checked out of ``engine``'s pool; no temporary
+    file is written. Missing values are sent as ``\\N``.
 
     Parameters:
-        df (pd.DataFrame): Data to upload.
-        table_name (str): Target table.
+        data (pd.DataFrame): Data to upload.
+        engine (sqlalchemy.engine.Engine): PostgreSQL engine (``psycopg2`` or
+                                           ``psycopg`` driver).
         schema (str): Schema name.
-        mode (str): Engine mode (see :data:`_ENGINE_FACTORIES`).
-        conn_dict (dict): Connection info.
-        custom_conn_str (str | None): Optional custom connection string.
-        connect_args (dict): Forwarded to the SQLAlchemy engine.
-        chunksize (int): Pandas ``to_sql`` chunksize.
-        method (str): ``'multi'``, ``'execute_many'``, ``'spark'`` or ``'single'``.
-        dtypes_dict (dict): SQLAlchemy dtype dict for ``to_sql``.
-        spark_mode (str): Mode for Spark Redshift writes.
-        **kwargs: Extra arguments for connection factories.
+        table_name (str): Target table.
+        batch_rows (int): Rows rendered to CSV per slice of the stream.
 
     Returns:
-        int: Rows affected.
+        int: Number of rows copied.
+
+    Raises:
+        ValueError: If ``engine`` is not a PostgreSQL engine.
     """
-    logger.info("Connecting to database...")
-    engine = _make_engine(
-        mode, conn_dict, custom_conn_str=custom_conn_str,
-        connect_args=connect_args, **kwargs,
+    if engine.dialect.name != "postgresql":
+        raise ValueError(
+            f"'copy' upload method requires a PostgreSQL engine, "
+            f"got dialect '{engine.dialect.name}'."
+        )
+
+    preparer = engine.dialect.identifier_preparer
+    target = (
+        f"{preparer.quote_schema(schema)}.{preparer.quote(table_name)}"
+        if schema
+        else preparer.quote(table_name)
     )
+    columns = ", ".join(preparer.quote(str(col)) for col in data.columns)
+    sql_stmt = (
+        f"COPY {target} ({columns}) FROM STDIN "
+        "WITH (FORMAT csv, NULL '\\N')"
+    )
+    stream = _DataFrameCsvStream(data, batch_rows=batch_rows, na_rep="\\N")
 
-    logger.info("Uploading data...")
+    raw_conn = engine.raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        if hasattr(cursor, "copy_expert"):  # psycopg2
+            cursor.copy_expert(sql_stmt, stream)
+        else:  # psycopg 3
+            with cursor.copy(sql_stmt) as copy:
+                while True:
+                    block = stream.read(1 << 20)
+                    if not block:
+                        break
+                    copy.write(block)
+        raw_conn.commit()
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
+
+    return data.shape[0]
+
+
+def _oracle_input_sizes(dtypes_dict, columns) -> list:
+    """Map SQLAlchemy dtype instances to ``oracledb`` ``setinputsizes`` specs.
+
+    Strings are declared with their maximum length so the driver allocates
+    each bind array once per batch; columns without a usable type map to
+    ``None`` (let the driver infer).
+    """
+    dtypes_dict = dtypes_dict or {}
+    sizes = []
+    for col in columns:
+        sql_type = dtypes_dict.get(col)
+        if isinstance(sql_type, type):
+            sql_type = sql_type()
+        if isinstance(sql_type, (sqlalchemy.Text, sqlalchemy.CLOB)):
+            sizes.append(oracledb.DB_TYPE_CLOB)
+        elif isinstance(sql_type, sqlalchemy.String):
+            sizes.append(sql_type.length or oracledb.DB_TYPE_VARCHAR)
+        elif isinstance(sql_type, sqlalchemy.LargeBinary):
+            sizes.append(oracledb.DB_TYPE_BLOB)
+        elif isinstance(sql_type, sqlalchemy.Float):
+            sizes.append(oracledb.DB_TYPE_BINARY_DOUBLE)
+        elif isinstance(sql_type, (sqlalchemy.Integer, sqlalchemy.Numeric)):
+            sizes.append(oracledb.DB_TYPE_NUMBER)
+        elif isinstance(sql_type, sqlalchemy.DateTime):
+            sizes.append(oracledb.DB_TYPE_TIMESTAMP)
+        elif isinstance(sql_type, sqlalchemy.Date):
+            sizes.append(oracledb.DB_TYPE_DATE)
+        else:
+            sizes.append(None)
+    return sizes
+
+
+def to_sql_oracle_array(
+    data, conn_dict, schema, table_name, dtypes_dict=None, batch_rows=None,
+    **kwargs,
+):
+    """
+    Upload data to Oracle with array binding and ``batcherrors``.
 
-    method_l = method.lower()
-    if method_l == "multi":
-        try:
-            logger.info("Trying to upload data with 'multi' method...")
-            return df.to_sql(
-                table_name,
-                engine,
-                schema=schema,
-                if_exists="append",
-                index=False,
-                chunksize=chunksize,
-                method=method,
-                dtype=dtypes_dict,
-            )
-        except Exception as e:
-            logger.warning(f"{type(e)} - {e}")
-            try:
-                logger.info(
-                    "Multi upload failed. Falling back to 'execute_many' method..."
-                )
-                return to_sql_executemany(
-                    df, conn_dict, schema, table_name, mode, **kwargs
-                )
-            except Exception as e2:
-                logger.warning(f"{type(e2)} - {e2}")
-                logger.info(
-                    "Execute-many upload failed. Falling back to 'single' method..."
-                )
-                return df.to_sql(
-                    table_name,
-                    engine,
-                    schema=schema,
-                    if_exists="append",
-                    index=False,
-                    chunksize=chunksize,
-                    dtype=dtypes_dict,
+    Input sizes are declared from ``dtypes_dict`` (see
+    :func:`_oracle_input_sizes`) and rows are bound as arrays of
+    ``batch_rows`` rows per ``executemany`` round trip on a connection from
+    :func:`create_oracle_conn`. With ``batcherrors=True`` rows rejected by the
+    server (constraint violations, conversion errors, ...) are reported with
+    their row offset and logged, while the remaining rows are committed.
+
+    Parameters:
+        data (pd.DataFrame): Data to upload.
+        conn_dict (dict): Oracle connection info.
+        schema (str): Schema name.
+        table_name (str): Target table.
+        dtypes_dict (dict | None): SQLAlchemy dtype dict used for input sizes.
+        batch_rows (int | None): Rows per array bind (default ``50000``).
+        **kwargs: Extra arguments forwarded to :func:`create_oracle_conn`.
+
+    Returns:
+        int: Number of rows inserted (rejected rows excluded).
+    """
+    batch_rows = batch_rows or 50000
+    sql_stmt = _insert_stmt(schema, table_name, data.columns, "numeric")
+    input_sizes = _oracle_input_sizes(dtypes_dict, data.columns)
+
+    rows_inserted = 0
+    rows_rejected = 0
+    offset = 0
+    with create_oracle_conn(conn_dict, **kwargs) as sql_conn:
+        cursor = sql_conn.cursor()
+        for rows in _iter_row_batches(data, batch_rows):
+            cursor.setinputsizes(*input_sizes)
+            cursor.executemany(sql_stmt, rows, batcherrors=True)
+            batch_errors = cursor.getbatcherrors()
+            for error in batch_errors:
+                logger.warning(
+                    f"Row {offset + error.offset} rejected by "
+                    f"{schema}.{table_name} -> {error.message}"
                 )
-    elif method_l == "execute_many":
-        try:
-            logger.info("Trying to upload data with 'execute_many' method...")
-            return to_sql_executemany(
-                df, conn_dict, schema, table_name, mode, **kwargs
-            )
-        except Exception as e:
-            logger.warning(f"{type(e)} - {e}")
-            logger.info(
-                "Execute-many upload failed. Falling back to 'single' method..."
-            )
-            return df.to_sql(
-                table_name,
-                engine,
-                schema=schema,
-                if_exists="append",
-                index=False,
-                chunksize=chunksize,
-                dtype=dtypes_dict,
-            )
-    elif method_l == "spark":
-        try:
-            logger.info("Trying to upload data with 'spark' method...")
-            return to_sql_redshift_spark(
-                df, schema, table_name, conn_dict, mode=spark_mode
-            )
-        except Exception as e:
-            logger.warning(f"{type(e)} - {e}")
-            logger.info("Spark upload failed. Falling back to 'single' method...")
-            return df.to_sql(
-                table_name,
-                engine,
-                schema=schema,
-                if_exists="append",
-                index=False,
-                chunksize=chunksize,
-                dtype=dtypes_dict,
-            )
-    elif method_l == "single":
-        logger.info("Uploading data with 'single' method...")
-        return df.to_sql(
-            table_name,
-            engine,
-            schema=schema,
-            if_exists="append",
-            index=False,
-            chunksize=chunksize,
-            dtype=dtypes_dict,
+            rows_rejected += len(batch_errors)
+            rows_inserted += len(rows) - len(batch_errors)
+            offset += len(rows)
+        sql_conn.commit()
+
+    if rows_rejected:
+        logger.error(
+            f"{rows_rejected} of {offset} row(s) rejected while uploading to "
+            f"{schema}.{table_name}; {rows_inserted} row(s) committed."
+        )
+    return rows_inserted
+
+
+def _upsert_on_conflict(target, stage, columns, keys, set_columns) -> str:
+    """PostgreSQL / SQLite ``INSERT ... ON CONFLICT DO UPDATE``.
+
+    ``WHERE true`` keeps SQLite from parsing ``ON CONFLICT`` as a join
+    constraint of the ``SELECT``.
+    """
+    cols = ", ".join(columns)
+    if set_columns:
+        action = "DO UPDATE SET " + ", ".join(
+            f"{col} = EXCLUDED.{col}" for col in set_columns
         )
     else:
-        logger.error(f"Unknown upload method '{method}'. Aborting...")
-        return 0
+        action = "DO NOTHING"
+    return (
+        f"INSERT INTO {target} ({cols}) SELECT {cols} FROM {stage} WHERE true "
+        f"ON CONFLICT ({', '.join(keys)}) {action}"
+    )
 
 
-def sql_exec_stmt(sql_stmt, conn_dict: dict, mode="pyodbc", **kwargs):
+def _upsert_on_duplicate_key(target, stage, columns, keys, set_columns) -> str:
+    """MySQL ``INSERT ... ON DUPLICATE KEY UPDATE``."""
+    cols = ", ".join(columns)
+    # Without updatable columns a no-op assignment keeps existing rows as-is
+    assignments = [f"{col} = src.{col}" for col in set_columns] or [
+        f"{keys[0]} = {target}.{keys[0]}"
+    ]
+    return (
+        f"INSERT INTO {target} ({cols}) SELECT {cols} FROM {stage} AS src "
+        f"ON DUPLICATE KEY UPDATE {', '.join(assignments)}"
+    )
+
+
+def _upsert_merge(target, stage, columns, keys, set_columns) -> str:
+    """ANSI ``MERGE`` (SQL Server, Oracle, BigQuery, Redshift, ...).
+
+    When every column is a key there is nothing to update, and Redshift
+    rejects a ``MERGE`` without ``WHEN MATCHED`` (Oracle rejects updating the
+    ``ON`` columns), so only the missing rows are inserted with
+    ``INSERT ... WHERE NOT EXISTS``.
     """
-    Execute a SQL statement and return ``(rows_affected, output)``.
+    on = " AND ".join(f"tgt.{key} = src.{key}" for key in keys)
+    if not set_columns:
+        return (
+            f"INSERT INTO {target} ({', '.join(columns)}) "
+            f"SELECT {', '.join(f'src.{col}' for col in columns)} FROM {stage} src "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {target} tgt WHERE {on})"
+        )
+    stmt = (
+        f"MERGE INTO {target} tgt USING {stage} src ON ({on}) "
+        "WHEN MATCHED THEN UPDATE SET "
+        + ", ".join(f"{col} = src.{col}" for col in set_columns)
+    )
+    stmt += (
+        f" WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) "
+        f"VALUES ({', '.join(f'src.{col}' for col in columns)})"
+    )
+    return stmt
+
+
+#: Upsert statement builders by SQLAlchemy dialect name
+#: (:func:`_upsert_merge` for any other dialect).
+_UPSERT_BUILDERS = {
+    "postgresql": _upsert_on_conflict,
+    "sqlite": _upsert_on_conflict,
+    "mysql": _upsert_on_duplicate_key,
+    "mariadb": _upsert_on_duplicate_key,
+}
+
+
+def to_sql_upsert(
+    data, engine, schema, table_name, upsert_keys, dtypes_dict=None, chunksize=1000
+):
+    """
+    Upsert data into a table through a staging table and a single
+    dialect-specific ``MERGE`` / ``ON CONFLICT`` / ``ON DUPLICATE KEY``.
+
+    The frame is bulk-loaded into a uniquely named staging table in
+    ``schema``, merged into the target keyed on ``upsert_keys`` in the same
+    transaction, and the staging table is dropped afterwards. The target
+    must exist with a primary key / unique constraint on ``upsert_keys``
+    (required by ``ON CONFLICT`` and ``ON DUPLICATE KEY``); when it does not
+    exist yet the frame is inserted as-is, creating the table. Rows sharing
+    the same keys are collapsed to the last one first, since ``ON
+    CONFLICT`` and ``MERGE`` refuse to touch a target row twice.
 
     Parameters:
-        sql_stmt (str | sqlalchemy.schema.DDL): Statement to execute.
-        conn_dict (dict): Connection info.
-        mode (str): Connection mode.
-        **kwargs: Extra arguments forwarded to the connection factory.
+        data (pd.DataFrame): Data to upsert.
+        engine (sqlalchemy.engine.Engine): Target engine.
+        schema (str): Target schema.
+        table_name (str): Target table.
+        upsert_keys (list[str]): Columns identifying a row.
+        dtypes_dict (dict | None): SQLAlchemy dtype dict for the staging table.
+        chunksize (int): Rows per staging ``INSERT`` statement.
 
     Returns:
-        tuple[int, Any | None]: Rows affected and fetched output when
-                                available, otherwise ``None``.
+        int: Rows inserted or updated (as reported by the driver).
     """
-    sql_conn = _make_conn(mode, conn_dict, **kwargs)
-
-    logger.info("Executing statement...")
+    # Validate parameters
+    if isinstance(upsert_keys, str):
+        upsert_keys = [upsert_keys]
+    missing = [key for key in upsert_keys or [] if key not in data.columns]
+    if not upsert_keys or missing:
+        raise ValueError(
+            f"upsert_keys must name columns of the uploaded data "
+            f"(got {upsert_keys}, missing {missing})."
+        )
+    duplicated = data.duplicated(subset=upsert_keys, keep="last")
+    if duplicated.any():
+        logger.warning(
+            f"Dropping {int(duplicated.sum())} row(s) with repeated upsert keys "
+            f"{upsert_keys} (last occurrence wins)"
+        )
+        data = data[~duplicated]
+
+    # Plain insert when the target does not exist yet
+    if not sqlalchemy.inspect(engine).has_table(table_name, schema=schema):
+        logger.info(
+            f"Table {schema}.{table_name} does not exist, inserting rows..."
+        )
+        return data.to_sql(
+            table_name, engine, schema=schema, if_exists="append", index=False,
+            chunksize=chunksize, dtype=dtypes_dict,
+        )
+
+    # Build statement
+    preparer = engine.dialect.identifier_preparer
+    stage_name = f"stg_{uuid.uuid4().hex[:12]}"
+    target = preparer.format_table(sqlalchemy.table(table_name, schema=schema))
+    stage = preparer.format_table(sqlalchemy.table(stage_name, schema=schema))
+    columns = [preparer.quote(str(col)) for col in data.columns]
+    keys = [preparer.quote(str(key)) for key in upsert_keys]
+    set_columns = [col for col in columns if col not in keys]
+    builder = _UPSERT_BUILDERS.get(engine.dialect.name, _upsert_merge)
+    sql_stmt = builder(target, stage, columns, keys, set_columns)
+    if engine.dialect.name == "mssql":
+        # SQL Server requires MERGE to be terminated
+        sql_stmt += ";"
+
+    # Stage and merge in one transaction
+    rows, pandas_method = _multi_insert_plan(
+        engine.dialect, data.shape[1], chunksize or data.shape[0]
+    )
+    try:
+        with engine.begin() as conn:
+            logger.info(
+                f"Staging {data.shape[0]} rows in {schema}.{stage_name}..."
+            )
+            data.to_sql(
+                stage_name, conn, schema=schema, if_exists="fail", index=False,
+                chunksize=rows, method=pandas_method, dtype=dtypes_dict,
+            )
+            logger.info(f"Merging {schema}.{stage_name} into {schema}.{table_name}...")
+            result = conn.execute(sqlalchemy.text(sql_stmt))
+            rows_affected = result.rowcount
+    finally:
+        try:
+            with engine.begin() as conn:
+                conn.execute(sqlalchemy.text(f"DROP TABLE {stage}"))
+        except Exception as e:
+            # Nothing to drop when staging was rolled back with the merge
+            logger.debug(f"Staging table {stage} not dropped -> {type(e)} - {e}")
+
+    return rows_affected if rows_affected is not None and rows_affected >= 0 else data.shape[0]
+
+
+#: BigQuery column types by SQLAlchemy type, checked in order (subclasses
+#: first, e.g. ``Float`` before ``Numeric``).
+_BIGQUERY_TYPES: tuple = (
+    (sqlalchemy.Boolean, "BOOL"),
+    (sqlalchemy.Integer, "INT64"),
+    (sqlalchemy.Float, "FLOAT64"),
+    (sqlalchemy.Numeric, "NUMERIC"),
+    (sqlalchemy.DateTime, "DATETIME"),
+    (sqlalchemy.Date, "DATE"),
+    (sqlalchemy.Time, "TIME"),
+    (sqlalchemy.JSON, "JSON"),
+    (sqlalchemy.LargeBinary, "BYTES"),
+    (sqlalchemy.String, "STRING"),
+)
+
+#: BigQuery column types by pandas dtype kind (columns without an explicit
+#: SQLAlchemy dtype).
+_BIGQUERY_KIND_TYPES: dict[str, str] = {
+    "b": "BOOL",
+    "i": "INT64",
+    "u": "INT64",
+    "f": "FLOAT64",
+    "M": "TIMESTAMP",
+}
+
+
+def _bigquery_schema(data, dtypes_dict=None) -> list:
+    """
+    Build a BigQuery load schema for every column of ``data``.
+
+    Columns with an SQLAlchemy dtype (``upload_python_to_sql_dtypes_dict``)
+    are mapped through :data:`_BIGQUERY_TYPES` (timezone-aware ``DateTime``
+    becomes ``TIMESTAMP``, ``Numeric`` with precision above 38
+    ``BIGNUMERIC``); the others follow their pandas dtype, defaulting to
+    ``STRING``.
+
+    Parameters:
+        data (pd.DataFrame): Data to upload.
+        dtypes_dict (dict | None): SQLAlchemy dtype instances by column.
+
+    Returns:
+        list[google.cloud.bigquery.SchemaField]: Load schema.
+    """
+    dtypes_dict = dtypes_dict or {}
+    schema = []
+    for col in data.columns:
+        sa_type = dtypes_dict.get(col)
+        if isinstance(sa_type, type):
+            sa_type = sa_type()
+        bq_type = None
+        if sa_type is not None:
+            bq_type = next(
+                (t for cls, t in _BIGQUERY_TYPES if isinstance(sa_type, cls)), None
+            )
+            if bq_type == "DATETIME" and getattr(sa_type, "timezone", False):
+                bq_type = "TIMESTAMP"
+            elif bq_type == "NUMERIC" and (getattr(sa_type, "precision", 0) or 0) > 38:
+                bq_type = "BIGNUMERIC"
+        if bq_type is None:
+            bq_type = _BIGQUERY_KIND_TYPES.get(data[col].dtype.kind, "STRING")
+        schema.append(bigquery.SchemaField(str(col), bq_type))
+    return schema
+
+
+def to_sql_bigquery_load(data, conn_dict, schema, table_name, dtypes_dict=None):
+    """
+    Upload data to a BigQuery table with one Parquet load job (see
+    :func:`etl_tools.gcp.bigquery_upload_data`) instead of row ``INSERT``
+    statements through the SQLAlchemy dialect.
+
+    Parameters:
+        data (pd.DataFrame): Data to upload.
+        conn_dict (dict): ``bigquery`` connection info.
+        schema (str): Target dataset.
+        table_name (str): Target table.
+        dtypes_dict (dict | None): SQLAlchemy dtypes mapped to the BigQuery
+                                   schema (see :func:`_bigquery_schema`).
+
+    Returns:
+        int: Rows loaded.
+    """
+    return bigquery_upload_data(
+        data,
+        _bigquery_project_id(conn_dict),
+        schema,
+        table_name,
+        schema=_bigquery_schema(data, dtypes_dict),
+        location=conn_dict.get("location"),
+    )
+
+
+#: Methods tried, in order, when an upload method fails in
+#: :func:`parallel_to_sql`. The last method's errors propagate.
+_UPLOAD_FALLBACKS: dict[str, tuple[str, ...]] = {
+    "multi": ("execute_many", "single"),
+    "execute_many": ("single",),
+    "spark": ("single",),
+    "single": (),
+    "copy": ("multi", "single"),
+    "fast_executemany": ("execute_many", "single"),
+    "array_bind": ("execute_many", "single"),
+    "redshift_copy": ("multi", "single"),
+    # A plain INSERT would duplicate existing keys, so upserts never fall back
+    "upsert": (),
+    # Load jobs are atomic, so a failed one can be retried as INSERTs
+    "bigquery_load": ("multi", "single"),
+}
+
+
+#: Methods that already parallelise internally (or must run as a single
+#: statement) and therefore receive the whole frame in
+#: :func:`sql_upload_data` instead of ``n_jobs`` splits.
+_UNSPLIT_METHODS: frozenset[str] = frozenset(
+    {"redshift_copy", "upsert", "bigquery_load"}
+)
+
+
+def to_sql_redshift_copy(
+    data, conn_dict, schema, table_name, part_rows=None, **kwargs
+):
+    """
+    Bulk load data into Redshift through S3 staging and ``COPY ... MANIFEST``.
+
+    The DataFrame is written as compressed parts (Snappy Parquet by default,
+    or gzip CSV) under a unique run prefix of ``conn_dict['s3_staging_path']``
+    together with a manifest listing them. A single ``COPY`` then loads all
+    parts in parallel across the cluster slices, and every staged object is
+    removed afterwards (also on failure).
+
+    Staging settings are read from ``conn_dict``:
+
+    * ``s3_staging_path`` (required): e.g. ``"s3://bucket/staging/"``.
+    * ``iam_role``: IAM role ARN used by ``COPY``; otherwise
+      ``aws_access_key``/``aws_secret_access_key`` are embedded (one of the
+      two is required, checked before anything is staged).
+    * ``aws_access_key``, ``aws_secret_access_key``, ``region_name``: used to
+      write/delete the staged objects (and by ``COPY`` without ``iam_role``).
+    * ``s3_staging_format``: ``"parquet"`` (default) or ``"csv"``.
+
+    .. warning::
+        As with :func:`sql_copy_data`, credentials, role and paths are
+        interpolated into the ``COPY`` statement and must come from trusted
+        configuration.
+
+    Parameters:
+        data (pd.DataFrame): Data to upload (columns in table order).
+        conn_dict (dict): Redshift connection info plus staging settings.
+        schema (str): Schema name.
+        table_name (str): Target table.
+        part_rows (int | None): Rows per staged part (default ``1000000``).
+        **kwargs: Extra arguments forwarded to the connection factory.
+
+    Returns:
+        int: Number of rows loaded.
+
+    Raises:
+        ValueError: If the staging path or format is invalid, or neither
+            ``iam_role`` nor both AWS keys are set.
+    """
+    staging_path = conn_dict.get("s3_staging_path")
+    if not staging_path or not staging_path.startswith("s3://"):
+        raise ValueError(
+            "'redshift_copy' upload method requires conn_dict['s3_staging_path'] "
+            "in the form 's3://bucket/prefix/'."
+        )
+    staging_format = conn_dict.get("s3_staging_format", "parquet").lower()
+    if staging_format not in ("parquet", "csv"):
+        raise ValueError(
+            f"Invalid s3_staging_format '{staging_format}'. "
+            "Allowed values are: 'parquet', 'csv'."
+        )
+    aws_access_key = conn_dict.get("aws_access_key")
+    aws_secret_access_key = conn_dict.get("aws_secret_access_key")
+    if not conn_dict.get("iam_role") and not (
+        aws_access_key and aws_secret_access_key
+    ):
+        raise ValueError(
+            "'redshift_copy' upload method requires conn_dict['iam_role'] or "
+            "both conn_dict['aws_access_key'] and "
+            "conn_dict['aws_secret_access_key'] for the COPY credentials."
+        )
+    region_name = conn_dict.get("region_name", "us-east-1")
+    part_rows = max(1, int(part_rows or 1000000))
+
+    bucket, _, prefix = staging_path[len("s3://"):].partition("/")
+    run_prefix = (
+        f"{prefix.rstrip('/') + '/' if prefix.strip('/') else ''}"
+        f"{schema}.{table_name}/{uuid.uuid4().hex}/"
+    )
+
+    staged_paths = []
+    try:
+        ## Stage compressed parts
+        entries = []
+        for i, start in enumerate(range(0, data.shape[0], part_rows)):
+            part = data.iloc[start:start + part_rows]
+            if staging_format == "parquet":
+                body = part.to_parquet(
+                    index=False,
+                    compression="snappy",
+                    coerce_timestamps="us",
+                    allow_truncated_timestamps=True,
+                )
+                part_path = f"{run_prefix}part-{i:05d}.parquet"
+            else:
+                body = gzip.compress(
+                    part.to_csv(index=False, header=False, na_rep="\\N").encode(
+                        "utf-8"
+                    )
+                )
+                part_path = f"{run_prefix}part-{i:05d}.csv.gz"
+            s3_put_object(
+                body, bucket, part_path, aws_access_key, aws_secret_access_key,
+                region_name=region_name,
+            )
+            staged_paths.append(part_path)
+            entries.append(
+                {
+                    "url": f"s3://{bucket}/{part_path}",
+                    "mandatory": True,
+                    "meta": {"content_length": len(body)},
+                }
+            )
+        logger.info(
+            f"Staged {len(entries)} {staging_format} part(s) under "
+            f"s3://{bucket}/{run_prefix}"
+        )
+
+        ## Stage manifest
+        manifest_path = f"{run_prefix}manifest.json"
+        s3_put_object(
+            json.dumps({"entries": entries}).encode("utf-8"),
+            bucket,
+            manifest_path,
+            aws_access_key,
+            aws_secret_access_key,
+            region_name=region_name,
+        )
+        staged_paths.append(manifest_path)
+
+        ## Load everything with a single COPY
+        if conn_dict.get("iam_role"):
+            credentials = f"IAM_ROLE '{conn_dict['iam_role']}'"
+        else:
+            credentials = (
+                f"ACCESS_KEY_ID '{aws_access_key}' "
+                f"SECRET_ACCESS_KEY '{aws_secret_access_key}'"
+            )
+        if staging_format == "parquet":
+            format_clause = "FORMAT AS PARQUET"
+            columns = ""
+        else:
+            format_clause = "FORMAT AS CSV GZIP NULL AS '\\N'"
+            columns = f" ({','.join(str(col) for col in data.columns)})"
+        sql_stmt = (
+            f"COPY {schema}.{table_name}{columns} "
+            f"FROM 's3://{bucket}/{manifest_path}' {credentials} "
+            f"REGION '{region_name}' {format_clause} MANIFEST;"
+        )
+        sql_exec_stmt(sql_stmt, conn_dict, mode="redshift", **kwargs)
+    finally:
+        if staged_paths:
+            try:
+                s3_delete_objects(
+                    bucket, staged_paths, aws_access_key, aws_secret_access_key,
+                    region_name=region_name,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Error cleaning up staged files under "
+                    f"s3://{bucket}/{run_prefix} -> {type(e)} - {e}"
+                )
+
+    return data.shape[0]
+
+
+#: Maximum bind parameters per statement, by SQLAlchemy dialect name.
+_BIND_PARAM_LIMITS: dict[str, int] = {
+    "mssql": 2100,
+    "sqlite": 999,
+    "oracle": 65535,
+    "postgresql": 65535,
+    "redshift": 32767,
+    "mysql": 65535,
+    "bigquery": 10000,
+}
+
+# Maximum rows per multi-row ``VALUES`` list, where the dialect has one
+# (T-SQL table value constructors take at most 1000 rows)
+_MULTI_ROW_LIMITS: dict[str, int] = {
+    "mssql": 1000,
+}
+
+
+def _rows_per_statement(dialect_name: str, n_columns: int, rows: int) -> int:
+    """Cap ``rows`` so a multi-row ``INSERT`` stays under the dialect's
+    bind-parameter and ``VALUES`` row limits (unknown dialects are left
+    uncapped)."""
+    rows = min(rows, _MULTI_ROW_LIMITS.get(dialect_name, rows))
+    limit = _BIND_PARAM_LIMITS.get(dialect_name)
+    if limit is None:
+        return rows
+    return max(1, min(rows, (limit - 1) // max(1, n_columns)))
+
+
+def _multi_insert_plan(dialect, n_columns: int, rows: int) -> tuple:
+    """
+    Resolve the ``(chunksize, method)`` pandas should use for a ``multi``
+    upload on ``dialect``.
+
+    Rows per statement are capped by the dialect's bind-parameter limit (and
+    row limit, e.g. 1000 on SQL Server) so wide tables stay on the multi-row
+    ``INSERT`` path instead of failing and falling back to slower methods.
+    Dialects without multi-row ``VALUES`` support get ``method=None``
+    (batched ``executemany``).
+
+    Parameters:
+        dialect: SQLAlchemy dialect of the target engine.
+        n_columns (int): Number of columns uploaded.
+        rows (int): Requested rows per statement.
+
+    Returns:
+        tuple: ``(chunksize, method)`` for ``DataFrame.to_sql``.
+    """
+    if not getattr(dialect, "supports_multivalues_insert", True):
+        logger.info(
+            f"Dialect '{dialect.name}' has no multi-row VALUES support, "
+            "using executemany batches..."
+        )
+        return rows, None
+    capped = _rows_per_statement(dialect.name, n_columns, rows)
+    if capped < rows:
+        logger.info(
+            f"Capping multi-row INSERT at {capped} rows per statement "
+            f"({n_columns} columns, '{dialect.name}' statement limits)"
+        )
+    return capped, "multi"
+
+
+def parallel_to_sql(
+    df,
+    table_name,
+    schema,
+    mode,
+    conn_dict,
+    custom_conn_str,
+    connect_args,
+    chunksize,
+    method,
+    dtypes_dict,
+    spark_mode="append",
+    batch_rows=None,
+    upsert_keys=None,
+    **kwargs,
+):
+    """
+    Upload data to a database table using one of several strategies.
+
+    Parameters:
+        df (pd.DataFrame): Data to upload.
+        table_name (str): Target table.
+        schema (str): Schema name.
+        mode (str): Engine mode (see :data:`_ENGINE_FACTORIES`).
+        conn_dict (dict): Connection info.
+        custom_conn_str (str | None): Optional custom connection string.
+        connect_args (dict): Forwarded to the SQLAlchemy engine.
+        chunksize (int): Pandas ``to_sql`` chunksize (for ``'multi'``,
+                         capped per statement by the dialect's
+                         bind-parameter limit; see :func:`_multi_insert_plan`).
+        method (str): ``'multi'``, ``'execute_many'``, ``'spark'``,
+                      ``'single'``, ``'copy'`` (PostgreSQL ``COPY FROM
+                      STDIN``), ``'fast_executemany'`` (SQL Server
+                      ``pyodbc``), ``'array_bind'`` (Oracle
+                      ``oracledb``), ``'redshift_copy'`` (S3-staged
+                      Redshift ``COPY``), ``'upsert'`` (staging table plus
+                      ``MERGE``, see :func:`to_sql_upsert`) or
+                      ``'bigquery_load'`` (Parquet load job). On failure the
+                      methods listed in
+                      :data:`_UPLOAD_FALLBACKS` are tried in order.
+        dtypes_dict (dict): SQLAlchemy dtype dict for ``to_sql``.
+        spark_mode (str): Mode for Spark Redshift writes.
+        batch_rows (int | None): Rows per driver round trip for the bulk
+                                 methods (e.g. ``'fast_executemany'``).
+        upsert_keys (list[str] | None): Key columns for ``'upsert'``.
+        **kwargs: Extra arguments for connection factories.
+
+    Returns:
+        int: Rows affected.
+    """
+    logger.info("Connecting to database...")
+    engine = engine_registry.get(
+        mode, conn_dict, custom_conn_str=custom_conn_str,
+        connect_args=connect_args, **kwargs,
+    )
+
+    logger.info("Uploading data...")
+
+    def _pandas_to_sql(pandas_method=None):
+        rows = chunksize
+        if pandas_method == "multi":
+            rows, pandas_method = _multi_insert_plan(
+                engine.dialect, df.shape[1], chunksize or df.shape[0]
+            )
+        return df.to_sql(
+            table_name,
+            engine,
+            schema=schema,
+            if_exists="append",
+            index=False,
+            chunksize=rows,
+            method=pandas_method,
+            dtype=dtypes_dict,
+        )
+
+    writers = {
+        "multi": lambda: _pandas_to_sql("multi"),
+        "execute_many": lambda: to_sql_executemany(
+            df, conn_dict, schema, table_name, mode,
+            batch_rows=batch_rows, **kwargs,
+        ),
+        "spark": lambda: to_sql_redshift_spark(
+            df, schema, table_name, conn_dict, mode=spark_mode
+        ),
+        "single": lambda: _pandas_to_sql(),
+        "copy": lambda: to_sql_postgres_copy(df, engine, schema, table_name),
+        "fast_executemany": lambda: to_sql_mssql_fast(
+            df, engine, schema, table_name,
+            dtypes_dict=dtypes_dict, batch_rows=batch_rows,
+        ),
+        "array_bind": lambda: to_sql_oracle_array(
+            df, conn_dict, schema, table_name,
+            dtypes_dict=dtypes_dict, batch_rows=batch_rows, **kwargs,
+        ),
+        "redshift_copy": lambda: to_sql_redshift_copy(
+            df, conn_dict, schema, table_name, part_rows=batch_rows, **kwargs,
+        ),
+        "bigquery_load": lambda: to_sql_bigquery_load(
+            df, conn_dict, schema, table_name, dtypes_dict=dtypes_dict,
+        ),
+        "upsert": lambda: to_sql_upsert(
+            df, engine, schema, table_name, upsert_keys,
+            dtypes_dict=dtypes_dict, chunksize=chunksize,
+        ),
+    }
+
+    method_l = method.lower()
+    if method_l not in _UPLOAD_FALLBACKS:
+        logger.error(f"Unknown upload method '{method}'. Aborting...")
+        return 0
+
+    chain = (method_l,) + _UPLOAD_FALLBACKS[method_l]
+    for i, method_i in enumerate(chain):
+        if i == 0:
+            logger.info(f"Trying to upload data with '{method_i}' method...")
+        else:
+            logger.info(
+                f"'{chain[i - 1]}' upload failed. "
+                f"Falling back to '{method_i}' method..."
+            )
+        try:
+            return writers[method_i]()
+        except Exception as e:
+            if i == len(chain) - 1:
+                raise
+            logger.warning(f"{type(e)} - {e}")
+
+
+def sql_exec_stmt(sql_stmt, conn_dict: dict, mode="pyodbc", **kwargs):
+    """
+    Execute a SQL statement and return ``(rows_affected, output)``.
+
+    Parameters:
+        sql_stmt (str | sqlalchemy.schema.DDL): Statement to execute.
+        conn_dict (dict): Connection info.
+        mode (str): Connection mode.
+        **kwargs: Extra arguments forwarded to the connection factory.
+
+    Returns:
+        tuple[int, Any | None]: Rows affected and fetched output when
+                                available, otherwise ``None``.
+    """
+    sql_conn = _make_conn(mode, conn_dict, **kwargs)
+
+    logger.info("Executing statement...")
     response_output = None
     response_rows_affected = 0
     with sql_conn:
@@ -1002,6 +2146,428 @@ def _log_exception(log_file_path: str, log_file_name: str, name: str) -> None:
     mk_err_logs(log_file_path, log_file_name, caller, detailed, mode="detailed")
 
 
+def _adbc_read_postgresql(sql_stmt: str, conn_dict: dict):
+    """Fetch a query as a ``pyarrow.Table`` through the PostgreSQL ADBC
+    driver (binary ``COPY``, no Python row objects)."""
+    if adbc_postgresql is None:
+        return None
+    port = conn_dict.get("port", 5432)
+    uri = (
+        f"postgresql://{quote_plus(conn_dict['username'])}:"
+        f"{quote_plus(conn_dict['password'])}@{conn_dict['server']}:{port}/"
+        f"{conn_dict['database']}"
+    )
+    if "sslmode" in conn_dict:
+        uri += f"?sslmode={conn_dict['sslmode']}"
+    with adbc_postgresql.connect(uri) as conn, conn.cursor() as cursor:
+        cursor.execute(sql_stmt)
+        return cursor.fetch_arrow_table()
+
+
+def _bigquery_project_id(conn_dict: dict) -> str:
+    """Project of a ``bigquery`` connection: ``project_id`` or the first
+    part of ``database`` (``project.dataset`` or ``project/dataset``)."""
+    return conn_dict.get("project_id") or (
+        str(conn_dict.get("database")).split("/")[0].split(".")[0]
+    )
+
+
+def _bigquery_storage_read(sql_stmt: str, conn_dict: dict):
+    """Fetch a query as a ``pyarrow.Table`` through the BigQuery Storage Read
+    API with parallel streams (see :func:`etl_tools.gcp.bigquery_read_data`).
+    Disabled by ``bigquery_storage_api: False`` in the connection dict."""
+    if not conn_dict.get("bigquery_storage_api", True):
+        return None
+    return bigquery_read_data(
+        sql_stmt,
+        _bigquery_project_id(conn_dict),
+        location=conn_dict.get("location"),
+        output="table",
+        max_streams=conn_dict.get("bigquery_max_streams"),
+        preserve_order=conn_dict.get("bigquery_preserve_order"),
+    )
+
+
+#: Arrow-native readers by connection mode. Each returns a ``pyarrow.Table``,
+#: or ``None`` when its driver is not installed (or it is disabled).
+_ARROW_READERS = {
+    "postgresql": _adbc_read_postgresql,
+    "bigquery": _bigquery_storage_read,
+}
+
+#: Modes whose Arrow-native reader also serves plain (``arrow=None``) reads.
+_ARROW_DEFAULT_MODES: frozenset[str] = frozenset({"bigquery"})
+
+#: Modes whose Arrow-native reader falls back on its own once the query ran;
+#: their errors are raised rather than re-running (and re-billing) the query
+#: through pandas.
+_ARROW_BILLED_MODES: frozenset[str] = frozenset({"bigquery"})
+
+#: Values accepted by ``sql_read_data(arrow=...)``.
+_ARROW_OUTPUTS: frozenset[str] = frozenset({"pandas", "table"})
+
+
+def _arrow_output(df_or_table, arrow: str | None):
+    """Convert a DataFrame or a ``pyarrow.Table`` to the requested ``arrow``
+    output (``None`` = NumPy-backed DataFrame)."""
+    if arrow == "table":
+        if isinstance(df_or_table, pa.Table):
+            return df_or_table
+        return pa.Table.from_pandas(df_or_table, preserve_index=False)
+    if isinstance(df_or_table, pa.Table):
+        if arrow is None:
+            return df_or_table.to_pandas()
+        return df_or_table.to_pandas(types_mapper=pd.ArrowDtype)
+    return df_or_table
+
+
+def _read_arrow(sql_stmt, engine_obj, mode: str, conn_dict: dict, arrow):
+    """
+    Read a query into Arrow memory.
+
+    Uses the mode's Arrow-native driver from :data:`_ARROW_READERS` when it
+    is installed (and the statement is a string); otherwise, or if that
+    driver fails, falls back to ``pd.read_sql(dtype_backend="pyarrow")`` on
+    the pooled engine. Failures of :data:`_ARROW_BILLED_MODES` readers are
+    raised instead, since falling back would run the query a second time.
+
+    Parameters:
+        sql_stmt: SQL statement.
+        engine_obj (sqlalchemy.engine.Engine): Pooled engine for the fallback.
+        mode (str): Connection mode.
+        conn_dict (dict): Connection info.
+        arrow (str | None): ``'pandas'`` (Arrow-backed DataFrame),
+                            ``'table'`` (``pyarrow.Table``) or ``None``
+                            (regular DataFrame, for
+                            :data:`_ARROW_DEFAULT_MODES`).
+
+    Returns:
+        pd.DataFrame | pyarrow.Table: Query results.
+    """
+    reader = _ARROW_READERS.get(mode.lower())
+    if reader is not None and isinstance(sql_stmt, str):
+        try:
+            table = reader(sql_stmt, conn_dict)
+            if table is not None:
+                return _arrow_output(table, arrow)
+        except Exception as e:
+            if mode.lower() in _ARROW_BILLED_MODES:
+                raise
+            logger.warning(
+                f"Arrow-native read failed, falling back to pandas -> "
+                f"{type(e).__name__}: {e}"
+            )
+    read_kwargs = {"dtype_backend": "pyarrow"} if arrow else {}
+    df = pd.read_sql(sql_stmt, engine_obj, **read_kwargs)
+    return _arrow_output(df, arrow)
+
+
+def _cache_key(sql_stmt: str, mode: str, conn_dict: dict, kwargs: dict) -> str:
+    """Cache key of a read: hash of the rendered statement and the
+    connection identity (credentials are hashed, never stored)."""
+    conn_key = _normalize_conn_key(mode, conn_dict, kwargs)
+    return hashlib.sha256(f"{conn_key}\n{sql_stmt}".encode("utf-8")).hexdigest()
+
+
+def _bigquery_read_chunks(sql_stmt: str, conn_dict: dict, chunksize: int, arrow):
+    """Yield chunks of ``chunksize`` rows of a BigQuery query, read page by
+    page from parallel Storage Read API streams (see
+    :func:`etl_tools.gcp.bigquery_read_data`)."""
+    batches = bigquery_read_data(
+        sql_stmt,
+        _bigquery_project_id(conn_dict),
+        location=conn_dict.get("location"),
+        output="batches",
+        max_streams=conn_dict.get("bigquery_max_streams"),
+        preserve_order=conn_dict.get("bigquery_preserve_order"),
+    )
+    pending, n_pending = [], 0
+    try:
+        for batch in batches:
+            pending.append(batch)
+            n_pending += batch.num_rows
+            while n_pending >= chunksize:
+                table = pa.Table.from_batches(pending)
+                yield _arrow_output(table.slice(0, chunksize), arrow)
+                rest = table.slice(chunksize)
+                pending, n_pending = rest.to_batches(), rest.num_rows
+        if n_pending:
+            yield _arrow_output(pa.Table.from_batches(pending), arrow)
+    finally:
+        ## Stop the stream readers of an abandoned read
+        close = getattr(batches, "close", None)
+        if close is not None:
+            close()
+
+
+def _sql_read_chunks(
+    sql_stmt,
+    conn_dict,
+    chunksize,
+    custom_conn_str,
+    connect_args,
+    mode,
+    name,
+    max_n_try,
+    log_file_path,
+    arrow=None,
+    **kwargs,
+):
+    """Generator behind ``sql_read_data(chunksize=...)``.
+
+    The statement runs on a pooled connection with ``stream_results=True`` so
+    dialects that support server-side cursors (PostgreSQL, MySQL, Oracle, ...)
+    fetch ``chunksize`` rows at a time instead of buffering the full result.
+    Failures are retried up to ``max_n_try`` times only while no chunk has
+    been yielded yet; once data has been handed to the caller the error is
+    logged and re-raised. With ``arrow`` set, chunks are Arrow-backed
+    DataFrames or ``pyarrow.Table`` objects. BigQuery statements are read
+    through the Storage Read API (see :func:`_bigquery_read_chunks`) unless
+    ``bigquery_storage_api`` is ``False`` in ``conn_dict``.
+    """
+    use_bigquery_streams = (
+        mode.lower() == "bigquery"
+        and isinstance(sql_stmt, str)
+        and conn_dict.get("bigquery_storage_api", True)
+    )
+    t_i = dt.datetime.now()
+    n_rows = 0
+    n_try = 0
+    started = False
+    try:
+        while True:
+            try:
+                if use_bigquery_streams:
+                    for chunk in _bigquery_read_chunks(
+                        sql_stmt, conn_dict, int(chunksize), arrow
+                    ):
+                        started = True
+                        n_rows += chunk.shape[0]
+                        yield chunk
+                    break
+                engine_obj = engine_registry.get(
+                    mode, conn_dict,
+                    custom_conn_str=custom_conn_str,
+                    connect_args=connect_args,
+                    **kwargs,
+                )
+                with engine_obj.connect() as conn:
+                    conn = conn.execution_options(stream_results=True)
+                    read_kwargs = {"dtype_backend": "pyarrow"} if arrow else {}
+                    for chunk in pd.read_sql(
+                        sql_stmt, conn, chunksize=chunksize, **read_kwargs
+                    ):
+                        if arrow:
+                            chunk = _arrow_output(chunk, arrow)
+                        started = True
+                        n_rows += chunk.shape[0]
+                        yield chunk
+                break
+            except Exception as e:
+                _log_exception(log_file_path, "read_data", name or "")
+                logger.error(
+                    f"sql_read_data attempt {n_try + 1}/{max_n_try} failed "
+                    f"(name={name}, rows yielded={n_rows}) -> "
+                    f"{type(e).__name__}: {e}"
+                )
+                n_try += 1
+                if started or n_try >= max_n_try:
+                    raise
+    finally:
+        t_e = dt.datetime.now()
+        logger.info(
+            f"Time elapsed in 'download' process {name} -> {n_rows} rows "
+            f"(streamed) = {t_e - t_i}"
+        )
+        os.makedirs(log_file_path, exist_ok=True)
+        mk_texec_logs(
+            log_file_path,
+            "download_data_texec",
+            "sql_read_data -> " + (name or ""),
+            t_e - t_i,
+            obs=f"Streamed rows = {n_rows} (chunksize = {chunksize})",
+        )
+
+
+def _to_bind_value(value):
+    """Convert pandas/numpy scalars to plain Python values for DB-API binds."""
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _partition_ranges(lower, upper, num_partitions: int) -> list:
+    """Split ``[lower, upper]`` into at most ``num_partitions`` contiguous
+    ``(lo, hi)`` ranges (numbers or datetimes); duplicate edges of narrow
+    ranges are merged.
+
+    Integer and datetime edges use integer arithmetic (float64 rounds bigints
+    above 2**53 and nanosecond timestamps) and the outer edges are the exact
+    bounds (widened to whole microseconds for datetimes), so no row between
+    them can fall outside every range.
+    """
+    if isinstance(lower, (dt.date, np.datetime64)):
+        lower, upper = pd.Timestamp(lower), pd.Timestamp(upper)
+        lo_ns, hi_ns = lower.value, upper.value
+        edges = [
+            pd.Timestamp(
+                lo_ns + (hi_ns - lo_ns) * i // num_partitions, tz=lower.tz
+            ).to_pydatetime(warn=False)
+            for i in range(num_partitions + 1)
+        ]
+        ## Python datetimes stop at microseconds: widen sub-microsecond bounds
+        lower = lower.floor("us").to_pydatetime()
+        upper = upper.ceil("us").to_pydatetime()
+    else:
+        lower, upper = _to_bind_value(lower), _to_bind_value(upper)
+        if isinstance(lower, int) and isinstance(upper, int):
+            edges = [
+                lower + (upper - lower) * i // num_partitions
+                for i in range(num_partitions + 1)
+            ]
+        else:
+            edges = np.linspace(
+                float(lower), float(upper), num_partitions + 1
+            ).tolist()
+    edges[0], edges[-1] = lower, upper
+    edges = sorted(set(edges))
+    if len(edges) == 1:
+        return [(edges[0], edges[0])]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _partition_stmts(sql_stmt: str, partition_column: str, ranges: list) -> list:
+    """Build one range-bounded ``text()`` statement per partition.
+
+    Ranges are half-open except the last one, and ``NULL`` cursor values are
+    read by the first partition, so every row is read exactly once.
+    """
+    # Colons in the user statement are literal (e.g. '10:00'), not binds
+    escaped_stmt = sql_stmt.replace(":", "\\:")
+    base = f"SELECT * FROM ({escaped_stmt}) sub"
+    stmts = []
+    for i, (lo, hi) in enumerate(ranges):
+        upper_op = "<=" if i == len(ranges) - 1 else "<"
+        where = (
+            f"{partition_column} >= :lo AND {partition_column} {upper_op} :hi"
+        )
+        if i == 0:
+            where = f"({where}) OR {partition_column} IS NULL"
+        stmts.append(
+            sqlalchemy.text(f"{base} WHERE {where}").bindparams(lo=lo, hi=hi)
+        )
+    return stmts
+
+
+def _sql_read_partitioned(
+    sql_stmt,
+    conn_dict,
+    partition_column,
+    num_partitions,
+    lower_bound=None,
+    upper_bound=None,
+    chunksize=None,
+    name=None,
+    **read_kwargs,
+):
+    """
+    Read a query as ``num_partitions`` range-bounded queries run concurrently.
+
+    The bounds of ``partition_column`` are discovered with one
+    ``MIN``/``MAX`` query over the statement unless both are given. Each
+    partition is read by :func:`sql_read_data` (retries and logs included)
+    on its own pooled connection.
+
+    Parameters:
+        sql_stmt (str): SQL statement (wrapped as a subquery).
+        conn_dict (dict): Connection info.
+        partition_column (str): Numeric or date/time column to range over.
+        num_partitions (int): Number of partitions (and concurrent reads, up
+                              to the pooled connection count).
+        lower_bound: Lowest partition value (discovered if ``None``).
+        upper_bound: Highest partition value (discovered if ``None``).
+        chunksize (int | None): Stream the partitions, each read in
+                                DataFrames of at most ``chunksize`` rows,
+                                instead of concatenating them. Chunks of
+                                different partitions interleave; at most
+                                about ``2 * num_partitions`` chunks (one
+                                being read per worker, plus as many queued)
+                                are held in memory.
+        name (str | None): Name used for log messages.
+        **read_kwargs: Forwarded to :func:`sql_read_data`.
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: Query results.
+    """
+    # Validate parameters
+    if not isinstance(sql_stmt, str):
+        raise TypeError("Partitioned reads need the SQL statement as a string.")
+
+    # Discover bounds
+    if lower_bound is None or upper_bound is None:
+        bounds_df = sql_read_data(
+            f"SELECT MIN({partition_column}) AS lo, MAX({partition_column}) AS hi "
+            f"FROM ({sql_stmt}) sub",
+            conn_dict,
+            name=f"{name} (bounds)",
+            **{**read_kwargs, "arrow": None},
+        )
+        lo, hi = bounds_df.iloc[0, 0], bounds_df.iloc[0, 1]
+        lower_bound = lo if lower_bound is None else lower_bound
+        upper_bound = hi if upper_bound is None else upper_bound
+    if pd.isna(lower_bound) or pd.isna(upper_bound):
+        logger.info(f"No {partition_column} bounds for {name}, reading unpartitioned...")
+        return sql_read_data(
+            sql_stmt, conn_dict, name=name, chunksize=chunksize, **read_kwargs
+        )
+
+    # Build partitions
+    ranges = _partition_ranges(lower_bound, upper_bound, int(num_partitions))
+    stmts = list(enumerate(_partition_stmts(sql_stmt, partition_column, ranges)))
+    max_workers = min(
+        len(stmts), engine_registry.pool_size + engine_registry.max_overflow
+    )
+    logger.info(
+        f"Reading {name} in {len(stmts)} partition(s) of {partition_column} "
+        f"[{lower_bound}, {upper_bound}] with {max_workers} worker(s)..."
+    )
+
+    def _read_partition(item):
+        i, stmt = item
+        return sql_read_data(
+            stmt, conn_dict, name=f"{name} (partition {i})", **read_kwargs
+        )
+
+    # Read partitions
+    if not chunksize:
+        frames = parallel_execute(
+            _read_partition, stmts, executor_type="thread", max_workers=max_workers
+        )
+        if read_kwargs.get("arrow") == "table":
+            return pa.concat_tables(frames)
+        return pd.concat(frames, ignore_index=True)
+
+    def _read_partition_chunks(item):
+        i, stmt = item
+        return sql_read_data(
+            stmt,
+            conn_dict,
+            name=f"{name} (partition {i})",
+            chunksize=chunksize,
+            **read_kwargs,
+        )
+
+    return iter_from_workers(
+        _read_partition_chunks,
+        stmts,
+        max_workers,
+        max_queue_size=max_workers,
+        name="sql-partition",
+    )
+
+
 def sql_read_data(
     sql_stmt,
     conn_dict,
@@ -1011,6 +2577,14 @@ def sql_read_data(
     name=None,
     max_n_try=3,
     log_file_path="logs",
+    chunksize=None,
+    partition_column=None,
+    num_partitions=None,
+    lower_bound=None,
+    upper_bound=None,
+    arrow=None,
+    cache: QueryResultCache | None = None,
+    cache_ttl: float | None = None,
     **kwargs,
 ):
     """
@@ -1025,13 +2599,117 @@ def sql_read_data(
         name (str | None): Name used for log messages.
         max_n_try (int): Maximum number of retries.
         log_file_path (str): Directory for error/timing logs.
+        chunksize (int | None): When set, stream the result set through a
+                                server-side cursor and return an iterator of
+                                DataFrames with at most ``chunksize`` rows
+                                each, instead of one materialised DataFrame.
+                                The query only runs once the iterator is
+                                consumed.
+        partition_column (str | None): Numeric or date/time column used to
+                                       split the read into range-bounded
+                                       queries run concurrently on pooled
+                                       connections (see
+                                       :func:`_sql_read_partitioned`).
+        num_partitions (int | None): Number of partitions (``> 1`` enables
+                                     partitioned reads).
+        lower_bound: Lowest partition value (discovered if ``None``).
+        upper_bound: Highest partition value (discovered if ``None``).
+        arrow (str | None): Fetch into Arrow memory and return an
+                            Arrow-backed DataFrame (``'pandas'``) or a
+                            ``pyarrow.Table`` (``'table'``). Arrow-native
+                            drivers are used where installed (see
+                            :func:`_read_arrow`), with automatic fallback.
+        cache (QueryResultCache | None): Serve repeated reads of the same
+                                         statement on the same connection
+                                         from this on-disk cache (string
+                                         statements, non-chunked reads).
+        cache_ttl (float | None): Maximum age of a cached result in seconds
+                                  (cache default if ``None``).
         **kwargs: Extra arguments forwarded to the engine factory.
 
     Returns:
-        pd.DataFrame: Query results (empty on failure after retries).
+        pd.DataFrame | pyarrow.Table | Iterator: Query results, or an
+            iterator of result batches when ``chunksize`` is set.
     """
     if connect_args is None:
         connect_args = {}
+    if arrow is not None and arrow not in _ARROW_OUTPUTS:
+        raise ValueError(
+            f"Invalid arrow '{arrow}'. Allowed values are: 'pandas', 'table'."
+        )
+
+    # Serve from / fill the result cache
+    if cache is not None and not chunksize and isinstance(sql_stmt, str):
+        key = _cache_key(
+            sql_stmt, mode, conn_dict,
+            {"custom_conn_str": custom_conn_str, "connect_args": connect_args, **kwargs},
+        )
+        table = cache.get(key, ttl=cache_ttl)
+        if table is not None:
+            logger.info(f"Serving {name} from query cache ({table.num_rows} rows)")
+            return _arrow_output(table, arrow)
+        result = sql_read_data(
+            sql_stmt,
+            conn_dict,
+            custom_conn_str=custom_conn_str,
+            connect_args=connect_args,
+            mode=mode,
+            name=name,
+            max_n_try=max_n_try,
+            log_file_path=log_file_path,
+            partition_column=partition_column,
+            num_partitions=num_partitions,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            arrow=arrow,
+            **kwargs,
+        )
+        try:
+            table = _arrow_output(result, "table")
+            cache.put(key, table)
+        except Exception as e:
+            # A result that cannot be cached is still a valid result
+            logger.warning(
+                f"Could not cache result of {name} -> {type(e).__name__}: {e}"
+            )
+            return result
+        # Hits are rebuilt from the stored Arrow table (pandas metadata
+        # included), so misses are too: both return the same dtypes
+        return _arrow_output(table, arrow)
+
+    if partition_column and num_partitions and int(num_partitions) > 1:
+        return _sql_read_partitioned(
+            sql_stmt,
+            conn_dict,
+            partition_column,
+            num_partitions,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            chunksize=chunksize,
+            name=name,
+            custom_conn_str=custom_conn_str,
+            connect_args=connect_args,
+            mode=mode,
+            max_n_try=max_n_try,
+            log_file_path=log_file_path,
+            arrow=arrow,
+            **kwargs,
+        )
+
+    if chunksize:
+        return _sql_read_chunks(
+            sql_stmt,
+            conn_dict,
+            int(chunksize),
+            custom_conn_str,
+            connect_args,
+            mode,
+            name,
+            max_n_try,
+            log_file_path,
+            arrow=arrow,
+            **kwargs,
+        )
 
     df = pd.DataFrame()
     t_i = dt.datetime.now()
@@ -1040,14 +2718,18 @@ def sql_read_data(
     last_exc: Exception | None = None
     while n_try < max_n_try and not succeeded:
         try:
-            engine_obj = _make_engine(
+            # Engines are pooled by the registry; do not dispose them here so
+            # the next call against the same database reuses the connections
+            engine_obj = engine_registry.get(
                 mode, conn_dict,
                 custom_conn_str=custom_conn_str,
                 connect_args=connect_args,
                 **kwargs,
             )
-            df = pd.read_sql(sql_stmt, engine_obj)
-            engine_obj.dispose()
+            if arrow or mode.lower() in _ARROW_DEFAULT_MODES:
+                df = _read_arrow(sql_stmt, engine_obj, mode, conn_dict, arrow)
+            else:
+                df = pd.read_sql(sql_stmt, engine_obj)
             succeeded = True
         except Exception as e:
             last_exc = e
@@ -1084,6 +2766,223 @@ def sql_read_data(
     return df
 
 
+def _split_frame(df, n_parts: int) -> list:
+    """Split ``df`` into at most ``n_parts`` contiguous ``iloc`` row slices.
+
+    Unlike ``np.array_split`` this does not copy the underlying data, which
+    is all thread workers need since nothing is pickled.
+    """
+    n_parts = max(1, min(int(n_parts), df.shape[0]))
+    bounds = np.linspace(0, df.shape[0], n_parts + 1).astype(int)
+    return [
+        df.iloc[start:stop]
+        for start, stop in zip(bounds[:-1], bounds[1:])
+        if stop > start
+    ]
+
+
+# Adaptive upload limits (see :func:`_adaptive_upload`)
+_ADAPTIVE_PROBE_ROWS = 1000
+_ADAPTIVE_MIN_ROWS = 100
+_ADAPTIVE_MAX_ROWS = 200000
+_ADAPTIVE_MAX_BATCH_BYTES = 64 * 1024 * 1024
+_ADAPTIVE_MIN_GAIN = 0.1
+_ADAPTIVE_MAX_HOLD = 8
+
+
+def _try_upload(df, upload_func, log_file_path="logs", name=None):
+    """Helper: run ``upload_func(df)`` and return ``(rows, None)``, or
+    ``(None, error message)`` so one failed slice does not hide the others."""
+    try:
+        return upload_func(df), None
+    except Exception as e:
+        _log_exception(log_file_path, "upload_data", name or "")
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _upload_parts(
+    upload_func,
+    parts,
+    executor_type="thread",
+    max_workers=None,
+    max_n_try=3,
+    name=None,
+    log_file_path="logs",
+):
+    """
+    Upload independent row slices, retrying only the slices that failed.
+
+    Each slice is committed on its own, so sending one that already
+    succeeded again would duplicate its rows.
+
+    Parameters:
+        upload_func (callable): Uploads one slice, returns rows affected.
+        parts (list[pd.DataFrame]): Row slices to upload.
+        executor_type (str): ``'thread'`` or ``'process'``.
+        max_workers (int | None): Concurrent slices.
+        max_n_try (int): Attempts per slice.
+        name (str | None): Name used for log messages.
+        log_file_path (str): Directory for error logs.
+
+    Returns:
+        int: Rows affected.
+
+    Raises:
+        RuntimeError: If some slices still fail after ``max_n_try`` attempts.
+    """
+    try_upload = functools.partial(
+        _try_upload, upload_func=upload_func, log_file_path=log_file_path, name=name
+    )
+    rows_affected = 0
+    pending = list(parts)
+    for n_try in range(max_n_try):
+        if len(pending) == 1:
+            outcomes = [try_upload(pending[0])]
+        else:
+            outcomes = parallel_execute(
+                try_upload,
+                pending,
+                executor_type=executor_type,
+                max_workers=max_workers,
+            )
+        failed = []
+        for part, (rows, error) in zip(pending, outcomes):
+            if error is None:
+                rows_affected += rows or 0
+            else:
+                logger.error(
+                    f"sql_upload_data attempt {n_try + 1}/{max_n_try} failed for "
+                    f"{part.shape[0]} row(s) (name={name}) -> {error}"
+                )
+                failed.append(part)
+        pending = failed
+        if not pending:
+            return rows_affected
+
+    raise RuntimeError(
+        f"{sum(part.shape[0] for part in pending)} row(s) could not be uploaded "
+        f"after {max_n_try} attempts ({rows_affected} row(s) committed)."
+    )
+
+
+def _adaptive_upload(
+    df, upload_func, max_workers, name=None, max_n_try=3, log_file_path="logs"
+):
+    """
+    Upload ``df`` in waves of concurrent batches, tuning the batch size and
+    worker count from measured throughput.
+
+    The first wave is a single probe batch used to measure rows/sec and
+    bytes per row. Later waves run at the current settings, re-measuring
+    their throughput, or try one neighbouring setting: batch rows doubled or
+    halved, or one worker more or fewer. A neighbour that beats the current
+    throughput by at least :data:`_ADAPTIVE_MIN_GAIN` becomes the current
+    setting (and the same move is tried again), otherwise the next move is
+    tried after a few waves at the current settings (up to
+    :data:`_ADAPTIVE_MAX_HOLD` while nothing pays off). Because the current
+    throughput is re-measured, settings shrink again when the target slows
+    down. Failed batches of a wave are retried on their own (see
+    :func:`_upload_parts`).
+
+    Parameters:
+        df (pd.DataFrame): Data to upload.
+        upload_func (callable): :func:`parallel_to_sql` with everything but
+                                the frame, ``chunksize`` and ``batch_rows``
+                                bound.
+        max_workers (int): Upper bound on concurrent batches.
+        name (str | None): Name used for log messages.
+        max_n_try (int): Attempts per batch.
+        log_file_path (str): Directory for error logs.
+
+    Returns:
+        int: Rows affected.
+    """
+    # Set limits
+    n_rows = df.shape[0]
+    probe = df.iloc[:_ADAPTIVE_PROBE_ROWS]
+    bytes_per_row = max(
+        1.0,
+        probe.memory_usage(index=False, deep=True).sum() / max(1, probe.shape[0]),
+    )
+    max_rows = int(
+        max(
+            _ADAPTIVE_MIN_ROWS,
+            min(_ADAPTIVE_MAX_ROWS, _ADAPTIVE_MAX_BATCH_BYTES // bytes_per_row),
+        )
+    )
+    max_workers = max(1, max_workers)
+    moves = [("rows", 1), ("workers", 1), ("rows", -1), ("workers", -1)]
+
+    def _neighbour(setting, move):
+        (rows, workers), (knob, direction) = setting, move
+        if knob == "rows":
+            rows = rows * 2 if direction > 0 else rows // 2
+            return min(max(rows, _ADAPTIVE_MIN_ROWS), max_rows), workers
+        return rows, min(max(workers + direction, 1), max_workers)
+
+    # Upload in waves
+    current = (min(_ADAPTIVE_PROBE_ROWS, max_rows), 1)
+    current_throughput = 0.0
+    trial = None
+    move = 0
+    misses = 0
+    hold = 0
+    start = 0
+    rows_affected = 0
+    while start < n_rows:
+        ## Run one wave of batches
+        rows, workers = trial or current
+        batches = []
+        while len(batches) < workers and start < n_rows:
+            batches.append(df.iloc[start:start + rows])
+            start += rows
+        t_i = time.perf_counter()
+        rows_affected += _upload_parts(
+            functools.partial(upload_func, chunksize=rows, batch_rows=rows),
+            batches,
+            executor_type="thread",
+            max_workers=max_workers,
+            max_n_try=max_n_try,
+            name=name,
+            log_file_path=log_file_path,
+        )
+        elapsed = max(time.perf_counter() - t_i, 1e-6)
+        throughput = sum(b.shape[0] for b in batches) / elapsed
+        logger.debug(
+            f"Adaptive upload {name}: rows={rows} workers={workers} "
+            f"-> {throughput:,.0f} rows/s ({bytes_per_row:,.0f} B/row)"
+        )
+
+        ## Keep a better neighbour, otherwise stay and try the next move later
+        if trial is None:
+            current_throughput = throughput
+        elif throughput >= current_throughput * (1 + _ADAPTIVE_MIN_GAIN):
+            current, current_throughput = trial, throughput
+            misses = 0
+        else:
+            move = (move + 1) % len(moves)
+            misses += 1
+            hold = min(misses, _ADAPTIVE_MAX_HOLD)
+        trial = None
+        if hold:
+            hold -= 1
+            continue
+        ## Try the next move that changes anything (none at all limits)
+        for _ in moves:
+            candidate = _neighbour(current, moves[move])
+            if candidate != current:
+                trial = candidate
+                break
+            move = (move + 1) % len(moves)
+
+    rows, workers = current
+    logger.info(
+        f"Adaptive upload {name}: finished with rows={rows} workers={workers}"
+    )
+
+    return rows_affected
+
+
 def sql_upload_data(
     df,
     schema,
@@ -1100,6 +2999,10 @@ def sql_upload_data(
     n_jobs=-1,
     spark_mode="append",
     log_file_path="logs",
+    create_schema=True,
+    batch_rows=None,
+    executor="process",
+    upsert_keys=None,
     **kwargs,
 ):
     """
@@ -1114,13 +3017,28 @@ def sql_upload_data(
         mode (str): Engine mode.
         connect_args (dict | None): Forwarded to the SQLAlchemy engine.
         name (str | None): Name used for log messages.
-        chunksize (int): Pandas ``to_sql`` chunksize.
+        chunksize (int | str): Pandas ``to_sql`` chunksize, or ``'auto'``
+                               to tune batch size and worker count from
+                               measured throughput (see
+                               :func:`_adaptive_upload`; runs on threads).
         method (str): Upload strategy (see :func:`parallel_to_sql`).
         max_n_try (int): Maximum number of retries.
         dtypes_dict (dict | None): SQLAlchemy dtype dict for ``to_sql``.
         n_jobs (int): Parallelism (``-1`` = all CPUs).
         spark_mode (str): Spark write mode.
         log_file_path (str): Directory for error/timing logs.
+        create_schema (bool): Issue ``CREATE SCHEMA IF NOT EXISTS`` before
+                              uploading. Chunked callers can disable it after
+                              the first chunk.
+        batch_rows (int | None): Rows per driver round trip for the bulk
+                                 methods (see :func:`parallel_to_sql`).
+        executor (str): How parallel splits are run: ``'process'`` (each
+                        split is pickled to a worker process with its own
+                        engine) or ``'thread'`` (splits are zero-copy row
+                        slices uploaded by threads sharing the pooled engine;
+                        preferred for I/O-bound uploads).
+        upsert_keys (list[str] | None): Key columns matched by
+                                        ``method='upsert'``.
         **kwargs: Extra arguments forwarded to the engine factory.
 
     Returns:
@@ -1133,90 +3051,112 @@ def sql_upload_data(
 
     if n_jobs == -1:
         n_jobs = multiprocessing.cpu_count()
+    executor = executor.lower()
+    if executor not in ("process", "thread"):
+        raise ValueError(
+            f"Invalid executor '{executor}'. Allowed values are: 'process', 'thread'."
+        )
+    if method.lower() == "upsert" and not upsert_keys:
+        raise ValueError("method='upsert' requires upsert_keys.")
+    adaptive = isinstance(chunksize, str) and chunksize.lower() == "auto"
+    if adaptive:
+        chunksize = _ADAPTIVE_PROBE_ROWS
 
     # Create schema if not exists
-    try:
-        rows_affected_schema, _ = sql_exec_stmt(
-            DDL(f"CREATE SCHEMA IF NOT EXISTS {schema}"),
-            conn_dict,
-            mode=mode,
-            **kwargs,
-        )
-        logger.info(f"Schema {schema} created -> {rows_affected_schema}")
-    except Exception as e:
-        logger.warning(f"Error creating schema {schema} -> {type(e)} - {e}")
+    if create_schema:
+        try:
+            rows_affected_schema, _ = sql_exec_stmt(
+                DDL(f"CREATE SCHEMA IF NOT EXISTS {schema}"),
+                conn_dict,
+                mode=mode,
+                **kwargs,
+            )
+            logger.info(f"Schema {schema} created -> {rows_affected_schema}")
+        except Exception as e:
+            logger.warning(f"Error creating schema {schema} -> {type(e)} - {e}")
 
+    # Upload, retrying only the slices that failed (committed slices are
+    # never sent twice)
     response_rows_affected = 0
     t_i = dt.datetime.now()
-    n_try = 0
     succeeded = False
-    while n_try < max_n_try and not succeeded:
-        try:
-            logger.info(f"Shape of query dataframe -> {name} = {df.shape}")
-            if not df.empty:
-                if df.shape[0] / chunksize >= n_jobs:
-                    logger.info("Uploading chunked data in parallel...")
-                    df_split_iter = [
-                        x for x in np.array_split(df, n_jobs) if not x.empty
-                    ]
-                    table_name_iter = [table_name] * len(df_split_iter)
-                    schema_iter = [schema] * len(df_split_iter)
-                    mode_iter = [mode] * len(df_split_iter)
-                    conn_dict_iter = [conn_dict] * len(df_split_iter)
-                    custom_conn_str_iter = [custom_conn_str] * len(df_split_iter)
-                    connect_args_iter = [connect_args] * len(df_split_iter)
-                    chunksize_iter = [chunksize] * len(df_split_iter)
-                    method_iter = [method] * len(df_split_iter)
-                    dtypes_iter = [dtypes_dict] * len(df_split_iter)
-                    spark_mode_iter = [spark_mode] * len(df_split_iter)
-                    kwargs_iter = [kwargs] * len(df_split_iter)
-                    parallel_results = parallel_execute(
-                        parallel_to_sql,
-                        df_split_iter,
-                        table_name_iter,
-                        schema_iter,
-                        mode_iter,
-                        conn_dict_iter,
-                        custom_conn_str_iter,
-                        connect_args_iter,
-                        chunksize_iter,
-                        method_iter,
-                        dtypes_iter,
-                        spark_mode_iter,
-                        kwargs_iter,
+    try:
+        logger.info(f"Shape of query dataframe -> {name} = {df.shape}")
+        if not df.empty:
+            # Shared arguments are bound by keyword so engine kwargs
+            # reach parallel_to_sql's **kwargs (they used to be passed
+            # as an extra positional argument)
+            upload_func = functools.partial(
+                parallel_to_sql,
+                table_name=table_name,
+                schema=schema,
+                mode=mode,
+                conn_dict=conn_dict,
+                custom_conn_str=custom_conn_str,
+                connect_args=connect_args,
+                chunksize=chunksize,
+                method=method,
+                dtypes_dict=dtypes_dict,
+                spark_mode=spark_mode,
+                batch_rows=batch_rows,
+                upsert_keys=upsert_keys,
+                **kwargs,
+            )
+            # Never run more threads than the shared engine can hand
+            # out connections, or workers would time out waiting on
+            # the pool
+            n_threads = min(
+                n_jobs,
+                engine_registry.pool_size + engine_registry.max_overflow,
+            )
+            if adaptive and method.lower() not in _UNSPLIT_METHODS:
+                logger.info("Uploading data with adaptive chunk sizing...")
+                response_rows_affected = _adaptive_upload(
+                    df,
+                    upload_func,
+                    n_threads,
+                    name=name,
+                    max_n_try=max_n_try,
+                    log_file_path=log_file_path,
+                )
+            else:
+                if (
+                    not adaptive
+                    and method.lower() not in _UNSPLIT_METHODS
+                    and df.shape[0] / chunksize >= n_jobs
+                ):
+                    logger.info(
+                        f"Uploading chunked data in parallel ({executor}s)..."
                     )
-                    response_rows_affected = sum(parallel_results or [])
+                    if executor == "thread":
+                        parts = _split_frame(df, n_threads)
+                        max_workers = n_threads
+                    else:
+                        parts = [
+                            x for x in np.array_split(df, n_jobs) if not x.empty
+                        ]
+                        max_workers = n_jobs
                 else:
                     logger.info("Uploading whole data...")
-                    response_rows_affected = parallel_to_sql(
-                        df,
-                        table_name,
-                        schema,
-                        mode,
-                        conn_dict,
-                        custom_conn_str,
-                        connect_args,
-                        chunksize,
-                        method,
-                        dtypes_dict,
-                        spark_mode,
-                        **kwargs,
-                    )
-            else:
-                response_rows_affected = 0
-            logger.info(
-                f"Affected number of rows -> {name} = {response_rows_affected}"
-            )
-            succeeded = True
-        except Exception as e:
-            _log_exception(log_file_path, "upload_data", name or "")
-            logger.error(
-                f"sql_upload_data attempt {n_try + 1}/{max_n_try} failed "
-                f"(name={name}) -> {type(e).__name__}: {e}"
-            )
-            response_rows_affected = 0
-            succeeded = False
-        n_try += 1
+                    parts, max_workers = [df], 1
+                response_rows_affected = _upload_parts(
+                    upload_func,
+                    parts,
+                    executor_type=executor,
+                    max_workers=max_workers,
+                    max_n_try=max_n_try,
+                    name=name,
+                    log_file_path=log_file_path,
+                )
+        logger.info(
+            f"Affected number of rows -> {name} = {response_rows_affected}"
+        )
+        succeeded = True
+    except Exception as e:
+        _log_exception(log_file_path, "upload_data", name or "")
+        logger.error(
+            f"sql_upload_data failed (name={name}) -> {type(e).__name__}: {e}"
+        )
 
     t_e = dt.datetime.now()
     logger.info(
@@ -1285,6 +3225,11 @@ def sql_copy_data(
     Returns:
         int: Rows affected.
     """
+    if not (access_key and secret_access_key):
+        raise ValueError(
+            "sql_copy_data requires both access_key and secret_access_key for "
+            "the COPY credentials."
+        )
     response_rows_affected = 0
     t_i = dt.datetime.now()
     n_try = 0
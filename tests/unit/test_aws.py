@@ -0,0 +1,393 @@
+import functools
+import json
+import pickle
+import threading
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from etl_tools import aws
+
+
+def _typed(item):
+    return {name: TypeSerializer().serialize(value) for name, value in item.items()}
+
+
+def _untyped(item):
+    return {name: TypeDeserializer().deserialize(value) for name, value in item.items()}
+
+
+class _DynamoDBClient:
+    def __init__(self, n_unprocessed=0):
+        self.requests = []
+        self.n_unprocessed = n_unprocessed
+        self.lock = threading.Lock()
+
+    def batch_write_item(self, RequestItems):
+        with self.lock:
+            self.requests.append(RequestItems)
+            if self.n_unprocessed:
+                ## Leave the last item unprocessed once
+                self.n_unprocessed -= 1
+                (table_name, requests), = RequestItems.items()
+                return {"UnprocessedItems": {table_name: requests[-1:]}}
+        return {"UnprocessedItems": {}}
+
+    def written_items(self):
+        return [
+            _untyped(request["PutRequest"]["Item"])
+            for request_items in self.requests
+            for requests in request_items.values()
+            for request in requests
+        ]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = _DynamoDBClient()
+    monkeypatch.setattr(aws, "get_aws_client", lambda *args, **kwargs: client)
+    monkeypatch.setattr(aws.time, "sleep", lambda seconds: None)
+    return client
+
+
+class _S3Client:
+    def __init__(self):
+        self.objects = {}
+        self.configs = []
+
+    def upload_fileobj(self, fileobj, bucket, key, Config=None):
+        self.configs.append(Config)
+        self.objects[(bucket, key)] = fileobj.read()
+
+    def download_fileobj(self, bucket, key, fileobj, Config=None):
+        self.configs.append(Config)
+        fileobj.write(self.objects[(bucket, key)])
+
+    def get_paginator(self, operation_name):
+        assert operation_name == "list_objects_v2"
+        return self
+
+    def paginate(self, Bucket, Prefix, PaginationConfig, Delimiter=None):
+        ## Same grouping as S3: keys below the next delimiter roll up into
+        ## one common prefix
+        contents, prefixes = [], []
+        for bucket, key in sorted(self.objects):
+            if bucket != Bucket or not key.startswith(Prefix):
+                continue
+            rest = key[len(Prefix):]
+            if Delimiter and Delimiter in rest:
+                prefix = Prefix + rest.split(Delimiter)[0] + Delimiter
+                if prefix not in prefixes:
+                    prefixes.append(prefix)
+            else:
+                contents.append({"Key": key, "Size": len(self.objects[bucket, key])})
+        page_size = PaginationConfig["PageSize"]
+        pages = [
+            {"Contents": contents[i:i + page_size]}
+            for i in range(0, len(contents), page_size)
+        ] or [{"KeyCount": 0}]
+        pages[0]["CommonPrefixes"] = [{"Prefix": prefix} for prefix in prefixes]
+        return iter(pages)
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    s3 = _S3Client()
+    monkeypatch.setattr(aws, "get_aws_client", lambda *args, **kwargs: s3)
+    return s3
+
+
+def test_parquet_round_trip_through_temporary_files(s3):
+    data = pd.DataFrame({"id": range(5), "name": list("abcde")})
+    aws.s3_write_parquet(data, "b", "p/data.parquet", "key", "secret")
+
+    with aws._s3_download_tempfile("b", "p/data.parquet", "key", "secret") as tmp:
+        ## Rewound and readable by pyarrow
+        assert tmp.tell() == 0
+        assert pd.read_parquet(tmp).equals(data)
+    assert tmp.closed
+    assert all(
+        config.multipart_threshold == aws.S3_MULTIPART_THRESHOLD
+        for config in s3.configs
+    )
+
+
+def test_json_and_pickle_round_trip(s3):
+    aws.s3_write_json({"a": [1, 2]}, "b", "p/data.json", "key", "secret")
+    assert json.loads(s3.objects[("b", "p/data.json")]) == {"a": [1, 2]}
+    assert aws.s3_read_json("b", "p/data.json", "key", "secret") == {"a": [1, 2]}
+
+    s3.objects[("b", "p/data.pkl")] = pickle.dumps({"x": 1})
+    assert aws.s3_read_pkl("b", "p/data.pkl", "key", "secret") == {"x": 1}
+
+
+class _Session:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def client(self, service_name, config=None):
+        return ("client", service_name, self, config.max_pool_connections)
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    monkeypatch.setattr(aws.boto3, "Session", _Session)
+    aws.clear_aws_clients()
+    yield
+    aws.clear_aws_clients()
+
+
+def test_clients_are_cached_per_configuration(sessions):
+    client = aws.get_aws_client("s3", "key", "secret")
+    assert aws.get_aws_client("s3", "key", "secret") is client
+    assert aws.get_aws_client("s3", "key", "secret", max_pool_connections=99) != client
+    assert aws.get_aws_client("s3", "key", "other") is not client
+    ## Clients of the same credentials share one session
+    assert aws.get_aws_client("dynamodb", "key", "secret")[2] is client[2]
+    assert client[3] == aws.AWS_MAX_POOL_CONNECTIONS
+
+    aws.clear_aws_clients()
+    assert aws.get_aws_client("s3", "key", "secret") is not client
+
+
+def test_sessions_handed_out_are_never_shared(sessions):
+    session = aws.get_aws_session("key", "secret")
+    assert aws.get_aws_session("key", "secret") is not session
+    assert aws.get_aws_client("s3", "key", "secret")[2] is not session
+
+
+def test_fork_reset_drops_parent_clients(sessions):
+    client = aws.get_aws_client("s3", "key", "secret")
+
+    aws._reset_after_fork()
+
+    assert not aws._clients and not aws._sessions
+    assert aws.get_aws_client("s3", "key", "secret") is not client
+
+
+def _put_keys(s3, keys):
+    for key in keys:
+        s3.objects[("b", key)] = b"x"
+
+
+@pytest.mark.parametrize("delimiter", [None, "/"])
+def test_listing_covers_nested_prefixes(s3, monkeypatch, delimiter):
+    keys = ["root/a.csv"] + [
+        f"root/{d}/{sub}/{i}.csv" for d in "xyz" for sub in "pq" for i in range(3)
+    ]
+    _put_keys(s3, keys + ["other/z.csv"])
+    ## Small pages exercise pagination
+    monkeypatch.setattr(
+        aws, "_s3_list_pages", functools.partial(aws._s3_list_pages, page_size=2)
+    )
+
+    listed = aws.s3_list_objects(
+        "b", "root/", "key", "secret", delimiter=delimiter, max_workers=2
+    )
+    assert sorted(listed) == sorted(keys)
+
+    objects = list(
+        aws.s3_iter_objects(
+            "b", "root/", "key", "secret", metadata=True, delimiter=delimiter
+        )
+    )
+    assert sorted(obj["Key"] for obj in objects) == sorted(keys)
+    assert all(obj["Size"] == 1 for obj in objects)
+
+
+@pytest.mark.parametrize("delimiter", [None, "/"])
+def test_listing_empty_prefix(s3, delimiter):
+    _put_keys(s3, ["other/z.csv"])
+    assert aws.s3_list_objects("b", "root/", "key", "secret", delimiter=delimiter) == []
+
+
+def test_sharded_listing_is_lazy(s3):
+    _put_keys(s3, [f"root/{d}/{i}.csv" for d in "xy" for i in range(3)])
+    objects = aws.s3_iter_objects("b", "root/", "key", "secret", delimiter="/")
+    assert next(objects).startswith("root/")
+    objects.close()
+
+
+def test_dynamodb_items_convert_floats_and_nulls():
+    data = pd.DataFrame(
+        {
+            "id": np.array([1, 2, 3], dtype="int64"),
+            "price": [1.5, np.nan, 0.1],
+            "name": ["a", None, "c"],
+        }
+    )
+    items = aws._dynamodb_items(data)
+    assert items == [
+        {"id": 1, "price": Decimal("1.5"), "name": "a"},
+        {"id": 2, "price": None, "name": None},
+        {"id": 3, "price": Decimal("0.1"), "name": "c"},
+    ]
+    assert type(items[0]["id"]) is int
+
+
+def test_dynamodb_items_convert_floats_in_object_columns():
+    data = pd.DataFrame({"value": [1.5, "a", None, np.float64(0.1), np.nan]})
+    items = aws._dynamodb_items(data)
+    assert [item["value"] for item in items] == [
+        Decimal("1.5"), "a", None, Decimal("0.1"), None
+    ]
+    assert type(items[0]["value"]) is Decimal
+
+
+@pytest.mark.parametrize(
+    "values", [[1.5, float("inf")], [-np.inf, 2.0], ["a", float("-inf")]]
+)
+def test_dynamodb_items_reject_infinite_values(values):
+    with pytest.raises(ValueError, match="non-finite"):
+        aws._dynamodb_items(pd.DataFrame({"value": values}))
+
+
+def test_write_batches_keep_duplicates_without_pkeys():
+    items = [{"id": i % 3, "n": i} for i in range(7)]
+    batches = list(aws._iter_dynamodb_write_batches(items, 10, 3))
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+
+
+def test_write_batches_collapse_duplicate_pkeys():
+    items = [{"id": i % 3, "n": i} for i in range(7)]
+    batches = list(aws._iter_dynamodb_write_batches(items, 10, 25, ["id"]))
+    assert batches == [[{"id": 0, "n": 6}, {"id": 1, "n": 4}, {"id": 2, "n": 5}]]
+
+
+def test_write_batches_reject_items_missing_pkeys():
+    with pytest.raises(ValueError):
+        list(aws._iter_dynamodb_write_batches([{"n": 1}], 10, 25, ["id"]))
+
+
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test_upload_writes_every_item(client, n_threads):
+    data = pd.DataFrame({"id": range(60), "value": [i / 2 for i in range(60)]})
+    n_written = aws.dynamodb_upload_data(
+        data, "t", "key", "secret", "us-east-1", n_threads=n_threads, chunksize=7
+    )
+    assert n_written == 60
+    assert all(len(request["t"]) <= 25 for request in client.requests)
+    written = sorted(client.written_items(), key=lambda item: item["id"])
+    assert [item["id"] for item in written] == list(range(60))
+    assert written[3]["value"] == Decimal("1.5")
+
+
+def test_upload_retries_unprocessed_items(client):
+    client.n_unprocessed = 2
+    n_written = aws.dynamodb_upload_data(
+        [{"id": i} for i in range(3)], "t", "key", "secret", "us-east-1"
+    )
+    assert n_written == 3
+    assert [len(request["t"]) for request in client.requests] == [3, 1, 1]
+
+
+class _ScanClient:
+    def __init__(self, n_items, page_size):
+        self.items = [{"id": i} for i in range(n_items)]
+        self.page_size = page_size
+        self.scans = []
+        self.lock = threading.Lock()
+
+    def scan(
+        self, TableName, Segment=0, TotalSegments=1, ExclusiveStartKey=None,
+        **kwargs,
+    ):
+        with self.lock:
+            self.scans.append((Segment, TotalSegments, kwargs))
+        start = int(ExclusiveStartKey["offset"]["N"]) if ExclusiveStartKey else 0
+        segment = [
+            item for item in self.items if item["id"] % TotalSegments == Segment
+        ]
+        page = segment[start:start + self.page_size]
+        response = {"Items": [_typed(item) for item in page]}
+        if start + self.page_size < len(segment):
+            response["LastEvaluatedKey"] = _typed({"offset": start + self.page_size})
+        return response
+
+
+@pytest.fixture
+def scan_table(monkeypatch):
+    table = _ScanClient(100, page_size=7)
+    monkeypatch.setattr(aws, "get_aws_client", lambda *args, **kwargs: table)
+    return table
+
+
+@pytest.mark.parametrize("total_segments", [1, 4])
+@pytest.mark.parametrize(
+    "output, batch_size",
+    [
+        ("list", None),
+        ("pandas", None),
+        ("items", None),
+        ("batches", None),
+        ("batches", 10),
+    ],
+)
+def test_segmented_scan_reads_every_item_once(
+    scan_table, total_segments, output, batch_size
+):
+    data = aws.dynamodb_read_data(
+        "t",
+        "key",
+        "secret",
+        "us-east-1",
+        total_segments=total_segments,
+        output=output,
+        batch_size=batch_size,
+        max_queue_size=2,
+        Limit=7,
+    )
+    if output == "batches":
+        batches = list(data)
+        if batch_size:
+            assert all(len(batch) == batch_size for batch in batches[:-1])
+        data = pd.concat(batches, ignore_index=True)
+    if isinstance(data, pd.DataFrame):
+        ids = data["id"].tolist()
+    else:
+        ids = [item["id"] for item in data]
+    assert sorted(ids) == list(range(100))
+    ## Every segment was scanned with the caller's scan arguments
+    assert {scan[:2] for scan in scan_table.scans} == {
+        (segment, total_segments) for segment in range(total_segments)
+    }
+    assert all(scan[2] == {"Limit": 7} for scan in scan_table.scans)
+
+
+def test_segment_scanners_share_one_cached_client(monkeypatch, sessions):
+    table = _ScanClient(20, page_size=3)
+    created = []
+
+    def _client(session, service_name, config=None):
+        created.append(service_name)
+        return table
+
+    monkeypatch.setattr(_Session, "client", _client)
+
+    for _ in range(2):
+        data = aws.dynamodb_read_data(
+            "t", "key", "secret", "us-east-1", total_segments=4
+        )
+        assert sorted(item["id"] for item in data) == list(range(20))
+    assert created == ["dynamodb"]
+
+
+def test_scan_request_builds_condition_filters():
+    request = aws._dynamodb_scan_request(
+        {
+            "FilterExpression": Attr("price").gt(Decimal("1.5")),
+            "ExclusiveStartKey": {"id": 3},
+            "Limit": 5,
+        }
+    )
+    assert request == {
+        "FilterExpression": "#n0 > :v0",
+        "ExpressionAttributeNames": {"#n0": "price"},
+        "ExpressionAttributeValues": {":v0": {"N": "1.5"}},
+        "ExclusiveStartKey": {"id": {"N": "3"}},
+        "Limit": 5,
+    }
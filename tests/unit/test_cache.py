@@ -0,0 +1,84 @@
+import os
+import time
+
+import pandas as pd
+import pyarrow as pa
+import sqlalchemy
+
+from etl_tools import sql
+from etl_tools.cache import QueryResultCache
+
+
+TABLE = pa.table({"id": [1, 2, 3]})
+
+
+def _age(cache, key, seconds):
+    ## Move an entry's write and read times into the past
+    then = time.time() - seconds
+    os.utime(cache._path(key), (then, then))
+
+
+def test_put_then_get(tmp_path):
+    cache = QueryResultCache(str(tmp_path), ttl=60)
+    assert cache.get("a") is None
+    cache.put("a", TABLE)
+    assert cache.get("a").equals(TABLE)
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = QueryResultCache(str(tmp_path), ttl=60)
+    cache.put("a", TABLE)
+    _age(cache, "a", 30)
+    assert cache.get("a") is not None
+    assert cache.get("a", ttl=10) is None
+    _age(cache, "a", 120)
+    assert cache.get("a") is None
+    assert cache.evict() == 1
+    assert not os.path.exists(cache._path("a"))
+
+
+def test_least_recently_read_entries_are_evicted(tmp_path):
+    cache = QueryResultCache(str(tmp_path), ttl=3600)
+    for key in ("a", "b", "c"):
+        cache.put(key, TABLE)
+    _age(cache, "a", 30)
+    _age(cache, "b", 20)
+    _age(cache, "c", 10)
+    ## Reading "a" makes "b" the least recently read entry
+    assert cache.get("a") is not None
+    cache.max_bytes = 2 * os.path.getsize(cache._path("a"))
+    assert cache.evict() == 1
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_clear_removes_every_entry(tmp_path):
+    cache = QueryResultCache(str(tmp_path))
+    cache.put("a", TABLE)
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_cache_hits_and_misses_return_the_same_dtypes(tmp_path):
+    path = tmp_path / "src.db"
+    engine = sqlalchemy.create_engine(f"sqlite:///{path}")
+    pd.DataFrame(
+        {"id": [1, 2], "name": ["a", None], "amount": [1.5, None]}
+    ).to_sql("t", engine, index=False)
+    engine.dispose()
+    cache = QueryResultCache(str(tmp_path / "cache"))
+
+    def _read():
+        return sql.sql_read_data(
+            "SELECT id, name, amount FROM t",
+            {},
+            custom_conn_str=f"sqlite:///{path}",
+            cache=cache,
+            cache_ttl=60,
+            log_file_path=str(tmp_path / "logs"),
+        )
+
+    miss, hit = _read(), _read()
+    assert len(os.listdir(tmp_path / "cache")) == 1
+    assert miss.dtypes.to_dict() == hit.dtypes.to_dict()
+    pd.testing.assert_frame_equal(miss, hit)
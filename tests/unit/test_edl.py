@@ -0,0 +1,291 @@
+import os
+import threading
+from collections import Counter
+
+import pandas as pd
+import pytest
+import sqlalchemy
+
+from etl.edl import ExtractDeleteAndLoad
+
+
+def _edl(src_path, dst_path, **extra_config):
+    config = {
+        "download_connections_dict": {"items": "sqlalchemy_db"},
+        "download_sql_stmts_dict": {"items": "SELECT id, name FROM src ORDER BY id"},
+        "download_custom_conn_strs_dict": {"items": f"sqlite:///{src_path}"},
+        "upload_connections_dict": {"items": "sqlalchemy_db"},
+        "upload_schemas_dict": {"items": "main"},
+        "upload_tables_dict": {"items": "dst"},
+        "upload_python_to_sql_dtypes_dict": {"items": {"id": "Integer", "name": "String"}},
+        "upload_custom_conn_strs_dict": {"items": f"sqlite:///{dst_path}"},
+        "upload_executors_dict": {"items": "thread"},
+        "n_parallel": 1,
+        "log_file_path": str(dst_path.parent / "logs"),
+    }
+    config.update(extra_config)
+    return ExtractDeleteAndLoad(config, {"sqlalchemy_db": {}})
+
+
+def _seed(db_path, n_rows):
+    engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+    pd.DataFrame(
+        {"id": range(n_rows), "name": [f"n{i}" for i in range(n_rows)]}
+    ).to_sql("src", engine, index=False)
+    return engine
+
+
+def test_chunked_read_data_can_be_uploaded(tmp_path):
+    _seed(tmp_path / "src.db", 25).dispose()
+    edl = _edl(
+        tmp_path / "src.db", tmp_path / "dst.db", download_chunksizes_dict={"items": 10}
+    )
+    edl.read_data()
+    assert not isinstance(edl.raw_data["items"], pd.DataFrame)
+
+    edl.upload_data(edl.raw_data)
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'dst.db'}")
+    uploaded = pd.read_sql("SELECT id, name FROM dst ORDER BY id", engine)
+    assert uploaded["id"].tolist() == list(range(25))
+    engine.dispose()
+
+
+def test_transfer_accepts_create_schema_kwarg(tmp_path):
+    _seed(tmp_path / "src.db", 25).dispose()
+    edl = _edl(tmp_path / "src.db", tmp_path / "dst.db")
+
+    edl.transfer(read_chunksize=10, create_schema=False)
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'dst.db'}")
+    uploaded = pd.read_sql("SELECT id FROM dst ORDER BY id", engine)
+    assert uploaded["id"].tolist() == list(range(25))
+    engine.dispose()
+
+
+# One case per keyword argument ``transfer`` accepts, in every spelling
+# ``_kwargs_or_config`` resolves ("{tmp}" is replaced by the test's temporary
+# directory)
+_TRANSFER_CASES = [
+    {"custom_conn_str": "sqlite:///{tmp}/src.db"},
+    {"custom_conn_strs": "sqlite:///{tmp}/src.db"},
+    {"connect_args": {"timeout": 5}},
+    {"connect_arg": {"timeout": 5}},
+    {"mode": "sqlalchemy"},
+    {"name": "items"},
+    {"max_n_try": 1},
+    {"log_file_path": "{tmp}/other_logs"},
+    {"partition_column": "id", "num_partitions": 2},
+    {"partition_columns": "id", "num_partition": 2},
+    {"partition_column": "id", "num_partitions": 2, "lower_bound": 0,
+     "upper_bound": 24},
+    {"arrow": "pandas"},
+    {"cache_ttl": 60},
+    {"cache_ttls": 60},
+    {"chunksize": 7},
+    {"chunksizes": 7},
+    {"method": "single"},
+    {"methods": "single"},
+    {"batch_rows": 5, "method": "execute_many"},
+    {"batch_row": 5, "method": "execute_many"},
+    {"executor": "thread", "n_jobs": 2},
+    {"executors": "thread", "n_jobs": 2},
+    {"upsert_keys": ["id"], "method": "upsert"},
+    {"upsert_key": ["id"], "methods": "upsert"},
+    {"dtypes_dict": {"id": sqlalchemy.Integer(), "name": sqlalchemy.String()}},
+    {"spark_mode": "append"},
+    {"create_schema": False},
+]
+
+
+def _format_kwargs(kwargs, tmp_path):
+    return {
+        k: v.format(tmp=tmp_path) if isinstance(v, str) else v
+        for k, v in kwargs.items()
+    }
+
+
+def _create_keyed_dst(db_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as conn:
+        conn.execute(
+            sqlalchemy.text("CREATE TABLE dst (id INTEGER PRIMARY KEY, name TEXT)")
+        )
+    engine.dispose()
+
+
+def _uploaded_ids(db_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+    ids = pd.read_sql("SELECT id FROM dst ORDER BY id", engine)["id"].tolist()
+    engine.dispose()
+    return ids
+
+
+@pytest.mark.parametrize("kwargs", _TRANSFER_CASES)
+def test_transfer_routes_kwargs_to_their_side(tmp_path, kwargs):
+    kwargs = _format_kwargs(kwargs, tmp_path)
+    _seed(tmp_path / "src.db", 25).dispose()
+    edl = _edl(
+        tmp_path / "src.db", tmp_path / "dst.db", query_cache_dir=str(tmp_path / "c")
+    )
+    if {"upsert_key", "upsert_keys"} & set(kwargs):
+        _create_keyed_dst(tmp_path / "dst.db")
+
+    assert edl.transfer(read_chunksize=10, **kwargs) == {"items": 25}
+
+    ## A shared connection string points both sides at the source database
+    shared = {"custom_conn_str", "custom_conn_strs"} & set(kwargs)
+    db = "src.db" if shared else "dst.db"
+    assert _uploaded_ids(tmp_path / db) == list(range(25))
+
+
+# Every spelling of the per-key options ``read_data`` resolves itself
+_READ_CASES = [
+    {"custom_conn_str": "sqlite:///{tmp}/src.db"},
+    {"custom_conn_strs": "sqlite:///{tmp}/src.db"},
+    {"connect_args": {"timeout": 5}},
+    {"connect_arg": {"timeout": 5}},
+    {"chunksize": 10},
+    {"chunksizes": 10},
+    {"partition_column": "id", "num_partitions": 2},
+    {"partition_columns": "id", "num_partition": 2},
+    {"cache_ttl": 60},
+    {"cache_ttls": 60},
+]
+
+
+@pytest.mark.parametrize("kwargs", _READ_CASES)
+def test_read_data_resolves_every_kwarg_spelling(tmp_path, kwargs):
+    _seed(tmp_path / "src.db", 25).dispose()
+    edl = _edl(
+        tmp_path / "src.db", tmp_path / "dst.db", query_cache_dir=str(tmp_path / "c")
+    )
+
+    edl.read_data(**_format_kwargs(kwargs, tmp_path))
+
+    data = edl.raw_data["items"]
+    if not isinstance(data, pd.DataFrame):
+        chunks = list(data)
+        assert all(len(chunk) <= 10 for chunk in chunks)
+        data = pd.concat(chunks)
+    assert sorted(data["id"].tolist()) == list(range(25))
+
+
+# Every spelling of the per-key options ``upload_data`` resolves itself
+_UPLOAD_CASES = [
+    {"custom_conn_str": "sqlite:///{tmp}/other.db"},
+    {"custom_conn_strs": "sqlite:///{tmp}/other.db"},
+    {"connect_args": {"timeout": 5}},
+    {"connect_arg": {"timeout": 5}},
+    {"chunksize": 7},
+    {"chunksizes": 7},
+    {"method": "single"},
+    {"methods": "single"},
+    {"batch_rows": 5, "method": "execute_many"},
+    {"batch_row": 5, "method": "execute_many"},
+    {"executor": "thread"},
+    {"executors": "thread"},
+    {"upsert_keys": ["id"], "method": "upsert"},
+    {"upsert_key": ["id"], "method": "upsert"},
+]
+
+
+@pytest.mark.parametrize("kwargs", _UPLOAD_CASES)
+def test_upload_data_resolves_every_kwarg_spelling(tmp_path, kwargs):
+    kwargs = _format_kwargs(kwargs, tmp_path)
+    edl = _edl(tmp_path / "src.db", tmp_path / "dst.db")
+    if {"upsert_key", "upsert_keys"} & set(kwargs):
+        _create_keyed_dst(tmp_path / "dst.db")
+    df = pd.DataFrame({"id": range(25), "name": [f"n{i}" for i in range(25)]})
+
+    edl.upload_data({"items": df}, **kwargs)
+
+    ## A custom connection string redirects the upload to another database
+    other = {"custom_conn_str", "custom_conn_strs"} & set(kwargs)
+    db = "other.db" if other else "dst.db"
+    assert _uploaded_ids(tmp_path / db) == list(range(25))
+
+
+def test_transfer_rejects_unknown_kwargs(tmp_path):
+    _seed(tmp_path / "src.db", 5).dispose()
+    edl = _edl(tmp_path / "src.db", tmp_path / "dst.db")
+
+    with pytest.raises(TypeError, match="bogus"):
+        edl.transfer(bogus=1)
+
+
+def test_map_keys_does_not_block_other_servers():
+    edl = ExtractDeleteAndLoad(
+        {
+            "download_connections_dict": {
+                "a1": "sqlalchemy_a",
+                "a2": "sqlalchemy_a",
+                "b1": "sqlalchemy_b",
+            }
+        },
+        {"sqlalchemy_a": {"server": "a"}, "sqlalchemy_b": {"server": "b"}},
+    )
+    b_ran = threading.Event()
+    running = Counter()
+    peak = Counter()
+    lock = threading.Lock()
+
+    def _work(key):
+        server = key[0]
+        with lock:
+            running[server] += 1
+            peak[server] = max(peak[server], running[server])
+        if key == "b1":
+            b_ran.set()
+            seen_b = True
+        else:
+            ## Key "a2" must not occupy the second worker while "a1" runs
+            seen_b = b_ran.wait(timeout=5)
+        with lock:
+            running[server] -= 1
+        return seen_b
+
+    results = edl._map_keys(
+        "download",
+        ["a1", "a2", "b1"],
+        _work,
+        max_concurrent_keys=2,
+        max_connections_per_server=1,
+    )
+    assert results == {"a1": True, "a2": True, "b1": True}
+    assert peak == {"a": 1, "b": 1}
+
+
+def test_arrow_table_reads_feed_watermarks_and_uploads(tmp_path):
+    _seed(tmp_path / "src.db", 5).dispose()
+    edl = _edl(
+        tmp_path / "src.db",
+        tmp_path / "dst.db",
+        download_sql_stmts_dict={
+            "items": "SELECT id, name FROM src WHERE id > {watermark} ORDER BY id"
+        },
+        download_watermark_columns_dict={"items": "id"},
+        download_watermark_initial_values_dict={"items": -1},
+        watermark_store_path=str(tmp_path / "wm.db"),
+    )
+    edl.read_data(arrow="table")
+    assert isinstance(edl.raw_data["items"], pd.DataFrame)
+
+    edl.upload_data(edl.raw_data)
+
+    assert edl.commit_watermarks() == {"items": "4"}
+
+
+def test_query_cache_needs_an_explicit_directory(tmp_path):
+    _seed(tmp_path / "src.db", 5).dispose()
+    edl = _edl(
+        tmp_path / "src.db",
+        tmp_path / "dst.db",
+        download_cache_ttls_dict={"items": 60},
+    )
+    with pytest.raises(ValueError):
+        edl.read_data()
+
+    edl.configs_dict["query_cache_dir"] = str(tmp_path / "cache")
+    edl.read_data()
+    assert len(os.listdir(tmp_path / "cache")) == 1
@@ -0,0 +1,42 @@
+import pytest
+import sqlalchemy
+
+from etl_tools.sql import EngineRegistry
+
+
+SQLITE = {"custom_conn_str": "sqlite://"}
+
+
+def test_same_configuration_reuses_engine():
+    registry = EngineRegistry()
+    engine = registry.get("sqlalchemy", {}, **SQLITE)
+    assert registry.get("sqlalchemy", {}, **SQLITE) is engine
+    assert len(registry) == 1
+    with engine.connect() as conn:
+        assert conn.execute(sqlalchemy.text("SELECT 1")).scalar() == 1
+    registry.close_all()
+
+
+def test_different_configurations_get_different_engines():
+    registry = EngineRegistry()
+    engine = registry.get("sqlalchemy", {}, **SQLITE)
+    other = registry.get("sqlalchemy", {"database": "other"}, **SQLITE)
+    assert other is not engine
+    assert len(registry) == 2
+    registry.close_all()
+    assert len(registry) == 0
+
+
+def test_idle_engines_are_evicted():
+    registry = EngineRegistry(idle_timeout=None)
+    registry.get("sqlalchemy", {}, **SQLITE)
+    assert registry.evict_idle(idle_timeout=-1) == 1
+    assert len(registry) == 0
+
+
+def test_configure_rejects_unknown_settings():
+    registry = EngineRegistry()
+    registry.configure(pool_size=2)
+    assert registry.pool_size == 2
+    with pytest.raises(ValueError):
+        registry.configure(pool_sise=2)
@@ -0,0 +1,93 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from etl_tools import execution
+from etl_tools.execution import get_executor, iter_from_workers, parallel_execute
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pools():
+    execution.shutdown_executors()
+    yield
+    execution.shutdown_executors()
+
+
+def _square(x):
+    return x * x
+
+
+def _nested_sum(n):
+    ## Runs on the single worker of the outer pool
+    return sum(
+        parallel_execute(_square, range(n), executor_type="thread", max_workers=1)
+    )
+
+
+def test_nested_parallel_execute_uses_separate_pool():
+    results = parallel_execute(
+        _nested_sum, [3, 4], executor_type="thread", max_workers=1
+    )
+    assert results == [5, 14]
+    assert len(execution._executors) == 2
+
+
+def test_executor_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(execution, "EXECUTOR_CACHE_SIZE", 2)
+    first = get_executor("thread", 1)
+    second = get_executor("thread", 2)
+    assert get_executor("thread", 1) is first
+    get_executor("thread", 3)
+    assert len(execution._executors) == 2
+    assert get_executor("thread", 1) is first
+    with pytest.raises(RuntimeError):
+        second.submit(_square, 2)
+
+
+def test_eviction_waits_for_pools_in_use(monkeypatch):
+    monkeypatch.setattr(execution, "EXECUTOR_CACHE_SIZE", 1)
+    acquire = execution._acquire_executor
+    acquired = threading.Event()
+    evicted = threading.Event()
+    leased = []
+
+    def _acquire_then_wait(*args, lease=False, **kwargs):
+        executor = acquire(*args, lease=lease, **kwargs)
+        if lease:
+            ## Let another thread evict the pool before it is used
+            leased.append(executor)
+            acquired.set()
+            evicted.wait(timeout=5)
+        return executor
+
+    monkeypatch.setattr(execution, "_acquire_executor", _acquire_then_wait)
+    with ThreadPoolExecutor(max_workers=1) as caller:
+        future = caller.submit(
+            parallel_execute, _square, range(4), executor_type="thread", max_workers=1
+        )
+        assert acquired.wait(timeout=5)
+        get_executor("thread", 2)
+        assert leased[0] not in execution._executors.values()
+        evicted.set()
+        assert future.result(timeout=5) == [0, 1, 4, 9]
+
+    ## The evicted pool is shut down once its last call returns
+    with pytest.raises(RuntimeError):
+        leased[0].submit(_square, 2)
+    assert not execution._executor_leases
+    assert not execution._retired_executors
+
+
+def test_iter_from_workers_yields_everything():
+    items = iter_from_workers(lambda n: range(n), [1, 2, 3], max_workers=2)
+    assert sorted(items) == [0, 0, 0, 1, 1, 2]
+
+
+def test_iter_from_workers_reraises_errors():
+    def _produce(n):
+        yield n
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        list(iter_from_workers(_produce, [1], max_workers=1))
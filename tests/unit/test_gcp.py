@@ -0,0 +1,215 @@
+import types
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import sqlalchemy
+from google.cloud import bigquery
+
+from etl_tools import gcp, sql
+
+
+TABLE = pa.table({"id": list(range(10))})
+
+
+class _Rows:
+    total_rows = TABLE.num_rows
+
+    def to_arrow(self, create_bqstorage_client=True):
+        return TABLE
+
+
+class _BigQueryClient:
+    def __init__(self):
+        self.n_queries = 0
+
+    def query(self, sql_stmt, location=None):
+        self.n_queries += 1
+        destination = types.SimpleNamespace(
+            project="p", dataset_id="d", table_id="t"
+        )
+        return types.SimpleNamespace(result=_Rows, destination=destination)
+
+
+class _FailingStorageClient:
+    def create_read_session(self, **kwargs):
+        raise RuntimeError("read sessions disabled")
+
+
+def test_read_session_failure_reuses_finished_query():
+    bq_client = _BigQueryClient()
+    table = gcp.bigquery_read_data(
+        "SELECT 1",
+        "p",
+        bq_client=bq_client,
+        bqstorage_client=_FailingStorageClient(),
+    )
+    assert table.equals(TABLE)
+    assert bq_client.n_queries == 1
+
+
+def test_bigquery_chunks_are_rebatched(monkeypatch):
+    batches = pa.table({"id": list(range(25))}).to_batches(max_chunksize=7)
+    monkeypatch.setattr(
+        sql, "bigquery_read_data", lambda *args, **kwargs: iter(batches)
+    )
+    chunks = list(
+        sql._bigquery_read_chunks("SELECT 1", {"database": "p.d"}, 10, "table")
+    )
+    assert [chunk.num_rows for chunk in chunks] == [10, 10, 5]
+    assert pa.concat_tables(chunks).column("id").to_pylist() == list(range(25))
+
+
+class _StreamStorageClient:
+    def read_rows(self, name):
+        pages = [
+            types.SimpleNamespace(to_arrow=lambda b=batch: b)
+            for batch in TABLE.slice(int(name) * 5, 5).to_batches(max_chunksize=2)
+        ]
+        rows = types.SimpleNamespace(pages=pages)
+        return types.SimpleNamespace(rows=lambda read_session: rows)
+
+
+def test_stream_pages_are_read_in_parallel():
+    batches = gcp._iter_bigquery_batches(
+        _StreamStorageClient(), None, ["0", "1"], max_workers=2, max_queue_size=1
+    )
+    ids = sorted(pa.Table.from_batches(list(batches)).column("id").to_pylist())
+    assert ids == list(range(10))
+
+
+class _SessionStorageClient:
+    def __init__(self):
+        self.max_stream_counts = []
+
+    def create_read_session(self, max_stream_count, **kwargs):
+        self.max_stream_counts.append(max_stream_count)
+        streams = [types.SimpleNamespace(name=str(i)) for i in range(2)]
+        return types.SimpleNamespace(streams=streams[:max_stream_count or 2])
+
+    def read_rows(self, name):
+        stream = TABLE.slice(int(name) * 5, 5)
+        return types.SimpleNamespace(to_arrow=lambda read_session: stream)
+
+
+def test_ordered_queries_are_read_through_one_stream():
+    storage_client = _SessionStorageClient()
+    for sql_stmt, preserve_order in [
+        ("SELECT id FROM t ORDER\n BY id DESC", None),
+        ("SELECT id FROM t", True),
+        ("SELECT id FROM t", None),
+    ]:
+        gcp.bigquery_read_data(
+            sql_stmt,
+            "p",
+            max_streams=4,
+            bq_client=_BigQueryClient(),
+            bqstorage_client=storage_client,
+            preserve_order=preserve_order,
+        )
+    assert storage_client.max_stream_counts == [1, 1, 4]
+
+
+@pytest.mark.parametrize(
+    "sa_type, bq_type",
+    [
+        (sqlalchemy.Boolean(), "BOOL"),
+        (sqlalchemy.Integer, "INT64"),
+        (sqlalchemy.BigInteger(), "INT64"),
+        (sqlalchemy.Float(), "FLOAT64"),
+        (sqlalchemy.Numeric(10, 2), "NUMERIC"),
+        (sqlalchemy.Numeric(60, 10), "BIGNUMERIC"),
+        (sqlalchemy.DateTime(), "DATETIME"),
+        (sqlalchemy.DateTime(timezone=True), "TIMESTAMP"),
+        (sqlalchemy.Date(), "DATE"),
+        (sqlalchemy.Time(), "TIME"),
+        (sqlalchemy.JSON(), "JSON"),
+        (sqlalchemy.LargeBinary(), "BYTES"),
+        (sqlalchemy.String(10), "STRING"),
+        (sqlalchemy.Text(), "STRING"),
+    ],
+)
+def test_bigquery_schema_from_sqlalchemy_dtypes(sa_type, bq_type):
+    schema = sql._bigquery_schema(pd.DataFrame({"c": ["x"]}), {"c": sa_type})
+    assert [(field.name, field.field_type) for field in schema] == [("c", bq_type)]
+
+
+def test_bigquery_schema_from_pandas_dtypes():
+    df = pd.DataFrame(
+        {
+            "b": [True],
+            "i": [1],
+            "u": pd.Series([1], dtype="uint8"),
+            "f": [1.5],
+            "t": pd.to_datetime(["2024-01-01"]),
+            "s": ["x"],
+        }
+    )
+    schema = sql._bigquery_schema(df)
+    assert [field.field_type for field in schema] == [
+        "BOOL", "INT64", "INT64", "FLOAT64", "TIMESTAMP", "STRING"
+    ]
+
+
+class _LoadClient:
+    def load_table_from_file(self, file_obj, table_id, job_config, location):
+        self.parquet = pq.read_table(file_obj)
+        self.uploaded = self.parquet.to_pandas()
+        self.table_id, self.job_config, self.location = table_id, job_config, location
+        return types.SimpleNamespace(
+            result=lambda: None, errors=None, output_rows=len(self.uploaded)
+        )
+
+
+def test_bigquery_upload_runs_one_parquet_load_job():
+    client = _LoadClient()
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", None]})
+    schema = sql._bigquery_schema(df)
+
+    rows = gcp.bigquery_upload_data(
+        df, "p", "d", "t", schema=schema, location="EU", bq_client=client
+    )
+
+    assert rows == 2
+    assert client.uploaded.equals(df)
+    assert client.table_id == "p.d.t"
+    assert client.location == "EU"
+    assert client.job_config.source_format == bigquery.SourceFormat.PARQUET
+    assert client.job_config.write_disposition == "WRITE_APPEND"
+    assert client.job_config.schema == schema
+
+
+def test_bigquery_upload_writes_the_declared_parquet_types():
+    client = _LoadClient()
+    df = pd.DataFrame(
+        {
+            "amount": [1 / 3, None],
+            "created": pd.to_datetime(
+                ["2024-01-01 10:00:00.123456789", "2024-06-01 12:00:00.000000000"]
+            ).tz_localize("UTC"),
+            "updated": pd.to_datetime(["2024-01-01", "2024-06-01"]),
+            "n": [1, 2],
+        }
+    )
+    schema = sql._bigquery_schema(
+        df,
+        {
+            "amount": sqlalchemy.Numeric(18, 4),
+            "created": sqlalchemy.DateTime(),
+            "updated": sqlalchemy.DateTime(timezone=True),
+            "n": sqlalchemy.Float(),
+        },
+    )
+
+    gcp.bigquery_upload_data(df, "p", "d", "t", schema=schema, bq_client=client)
+
+    assert client.parquet.schema.field("amount").type == pa.decimal128(38, 9)
+    assert client.parquet.schema.field("created").type == pa.timestamp("us")
+    assert client.parquet.schema.field("updated").type == pa.timestamp(
+        "us", tz="UTC"
+    )
+    assert client.parquet.schema.field("n").type == pa.float64()
+    assert str(client.uploaded["amount"][0]) == "0.333333333"
+    assert client.uploaded["amount"][1] is None
+    assert client.uploaded["created"][0] == pd.Timestamp("2024-01-01 10:00:00.123456")
@@ -0,0 +1,173 @@
+import datetime as dt
+
+import pandas as pd
+import sqlalchemy
+from sqlalchemy.dialects import mssql, postgresql, sqlite
+
+from etl_tools import sql
+
+
+def test_mssql_multi_insert_is_capped_at_1000_rows():
+    assert sql._multi_insert_plan(mssql.dialect(), 1, 5000) == (1000, "multi")
+
+
+def test_multi_insert_respects_bind_parameter_limit():
+    ## 2100 parameters / 10 columns leaves room for 209 rows
+    assert sql._multi_insert_plan(mssql.dialect(), 10, 5000) == (209, "multi")
+    assert sql._multi_insert_plan(sqlite.dialect(), 10, 5000) == (99, "multi")
+
+
+def test_multi_insert_leaves_small_or_unknown_requests_alone():
+    assert sql._multi_insert_plan(postgresql.dialect(), 3, 500) == (500, "multi")
+    assert sql._rows_per_statement("duckdb", 50, 5000) == 5000
+
+
+def test_capped_multi_insert_uploads_every_row():
+    engine = sqlalchemy.create_engine("sqlite://")
+    df = pd.DataFrame({f"c{i}": range(250) for i in range(10)})
+    rows, method = sql._multi_insert_plan(engine.dialect, df.shape[1], 1000)
+    with engine.begin() as conn:
+        df.to_sql("wide", conn, index=False, chunksize=rows, method=method)
+        n_rows = conn.execute(sqlalchemy.text("SELECT COUNT(*) FROM wide")).scalar()
+    assert n_rows == 250
+    engine.dispose()
+
+
+def test_on_conflict_upsert_sql():
+    stmt = sql._upsert_on_conflict("t", "s", ["id", "v"], ["id"], ["v"])
+    assert stmt == (
+        "INSERT INTO t (id, v) SELECT id, v FROM s WHERE true "
+        "ON CONFLICT (id) DO UPDATE SET v = EXCLUDED.v"
+    )
+    assert sql._upsert_on_conflict("t", "s", ["id"], ["id"], []).endswith(
+        "ON CONFLICT (id) DO NOTHING"
+    )
+
+
+def test_on_duplicate_key_upsert_sql():
+    stmt = sql._upsert_on_duplicate_key("t", "s", ["id", "v"], ["id"], ["v"])
+    assert stmt == (
+        "INSERT INTO t (id, v) SELECT id, v FROM s AS src "
+        "ON DUPLICATE KEY UPDATE v = src.v"
+    )
+
+
+def test_merge_upsert_sql():
+    stmt = sql._upsert_merge("t", "s", ["id", "v"], ["id"], ["v"])
+    assert stmt == (
+        "MERGE INTO t tgt USING s src ON (tgt.id = src.id) "
+        "WHEN MATCHED THEN UPDATE SET v = src.v "
+        "WHEN NOT MATCHED THEN INSERT (id, v) VALUES (src.id, src.v)"
+    )
+
+
+def test_merge_upsert_sql_with_only_key_columns():
+    ## Redshift needs WHEN MATCHED in a MERGE, so there is no MERGE at all
+    stmt = sql._upsert_merge("t", "s", ["id", "day"], ["id", "day"], [])
+    assert stmt == (
+        "INSERT INTO t (id, day) SELECT src.id, src.day FROM s src "
+        "WHERE NOT EXISTS (SELECT 1 FROM t tgt "
+        "WHERE tgt.id = src.id AND tgt.day = src.day)"
+    )
+
+
+def test_upsert_builders_by_dialect():
+    assert sql._UPSERT_BUILDERS["sqlite"] is sql._upsert_on_conflict
+    assert sql._UPSERT_BUILDERS["postgresql"] is sql._upsert_on_conflict
+    assert sql._UPSERT_BUILDERS["mysql"] is sql._upsert_on_duplicate_key
+    assert "mssql" not in sql._UPSERT_BUILDERS
+
+
+def test_to_sql_upsert_on_sqlite_updates_and_inserts(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'upsert.db'}")
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)"))
+        conn.execute(sqlalchemy.text("INSERT INTO t VALUES (1, 'old'), (2, 'keep')"))
+    ## Key 3 is repeated: the last row wins
+    data = pd.DataFrame({"id": [1, 3, 3], "v": ["new", "first", "last"]})
+
+    sql.to_sql_upsert(data, engine, "main", "t", ["id"])
+
+    rows = pd.read_sql("SELECT id, v FROM t ORDER BY id", engine)
+    assert rows.values.tolist() == [[1, "new"], [2, "keep"], [3, "last"]]
+    tables = sqlalchemy.inspect(engine).get_table_names()
+    assert tables == ["t"]
+    engine.dispose()
+
+
+def test_partitioned_streaming_reads_every_row_in_chunks(tmp_path):
+    path = tmp_path / "parts.db"
+    engine = sqlalchemy.create_engine(f"sqlite:///{path}")
+    pd.DataFrame({"id": range(100), "v": range(100)}).to_sql(
+        "t", engine, index=False
+    )
+    engine.dispose()
+
+    chunks = list(
+        sql.sql_read_data(
+            "SELECT id, v FROM t",
+            {},
+            custom_conn_str=f"sqlite:///{path}",
+            mode="sqlalchemy",
+            partition_column="id",
+            num_partitions=4,
+            chunksize=10,
+            log_file_path=str(tmp_path / "logs"),
+        )
+    )
+    ## Four partitions of about 25 rows, each read in chunks of at most 10
+    assert max(chunk.shape[0] for chunk in chunks) <= 10
+    assert len(chunks) >= 12
+    ids = sorted(i for chunk in chunks for i in chunk["id"])
+    assert ids == list(range(100))
+
+
+def _read_partitioned(tmp_path, df, column, **kwargs):
+    path = tmp_path / "parts.db"
+    engine = sqlalchemy.create_engine(f"sqlite:///{path}")
+    df.to_sql("t", engine, index=False)
+    engine.dispose()
+    return sql.sql_read_data(
+        f"SELECT {column}, v FROM t",
+        {},
+        custom_conn_str=f"sqlite:///{path}",
+        mode="sqlalchemy",
+        partition_column=column,
+        log_file_path=str(tmp_path / "logs"),
+        **kwargs,
+    )
+
+
+def test_partitioned_read_keeps_bigint_bounds_exact(tmp_path):
+    ## float64 cannot represent these ids, so float edges cut off the ends
+    ids = [2**60 + 3 + 7 * i for i in range(143)]
+    df = pd.DataFrame({"id": ids, "v": range(143)})
+
+    result = _read_partitioned(tmp_path, df, "id", num_partitions=8)
+
+    assert sorted(result["id"].tolist()) == ids
+    ranges = sql._partition_ranges(ids[0], ids[-1], 8)
+    assert ranges[0][0] == ids[0] and ranges[-1][1] == ids[-1]
+
+
+def test_partitioned_read_by_datetime_column(tmp_path):
+    ts = pd.date_range("2024-01-01", periods=50, freq="37min")
+    df = pd.DataFrame({"ts": ts, "v": range(50)})
+
+    result = _read_partitioned(
+        tmp_path, df, "ts", num_partitions=7, lower_bound=ts[0], upper_bound=ts[-1]
+    )
+
+    assert sorted(result["v"].tolist()) == list(range(50))
+
+
+def test_datetime_partition_edges_cover_nanosecond_bounds():
+    lower = pd.Timestamp("2024-01-01 00:00:00.000000999")
+    upper = pd.Timestamp("2024-01-01 00:00:01.000000001")
+
+    ranges = sql._partition_ranges(lower, upper, 3)
+
+    assert ranges[0][0] == dt.datetime(2024, 1, 1)
+    assert ranges[-1][1] == dt.datetime(2024, 1, 1, 0, 0, 1, 1)
+    assert all(lo < hi for lo, hi in ranges)
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
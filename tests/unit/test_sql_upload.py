@@ -0,0 +1,348 @@
+import gzip
+import json
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+import sqlalchemy
+
+from etl_tools import sql
+
+
+def _frame(n_rows):
+    return pd.DataFrame({"id": range(n_rows)})
+
+
+def test_upload_parts_retries_only_failed_slices(tmp_path):
+    calls = []
+
+    def _upload(df):
+        calls.append(df["id"].iloc[0])
+        ## The second slice fails once
+        if df["id"].iloc[0] == 10 and calls.count(10) == 1:
+            raise ConnectionError("lost")
+        return df.shape[0]
+
+    parts = [_frame(30).iloc[i:i + 10] for i in (0, 10, 20)]
+    rows = sql._upload_parts(
+        _upload, parts, max_workers=3, log_file_path=str(tmp_path)
+    )
+    assert rows == 30
+    assert sorted(calls) == [0, 10, 10, 20]
+
+
+def test_upload_parts_gives_up_after_max_n_try(tmp_path):
+    def _upload(df):
+        raise ConnectionError("down")
+
+    with pytest.raises(RuntimeError):
+        sql._upload_parts(
+            _upload, [_frame(5)], max_n_try=2, log_file_path=str(tmp_path)
+        )
+
+
+def test_adaptive_upload_grows_then_shrinks_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(sql, "_ADAPTIVE_PROBE_ROWS", 100)
+    clock = {"now": 0.0}
+    monkeypatch.setattr(sql.time, "perf_counter", lambda: clock["now"])
+    sizes = []
+
+    def _upload(df, chunksize, batch_rows):
+        sizes.append(batch_rows)
+        ## Fixed cost per batch; after 30 batches the target gets slow on
+        ## batches above 200 rows
+        slow = len(sizes) > 30 and batch_rows > 200
+        clock["now"] += 0.05 + df.shape[0] * (0.01 if slow else 0.001)
+        return df.shape[0]
+
+    rows = sql._adaptive_upload(
+        _frame(40000), _upload, max_workers=1, log_file_path=str(tmp_path)
+    )
+    assert rows == 40000
+    assert max(sizes[:30]) > 200
+    assert sizes[-20:].count(200) > 15
+
+
+@pytest.mark.parametrize("size", [-1, 1, 7, 8192, 10**6])
+def test_csv_stream_matches_to_csv(size):
+    df = pd.DataFrame({"id": range(1000), "v": [f"v{i}" for i in range(1000)]})
+    stream = sql._DataFrameCsvStream(df, batch_rows=64)
+
+    pieces = []
+    while True:
+        piece = stream.read(size)
+        if not piece:
+            break
+        assert size < 0 or len(piece) <= size
+        pieces.append(piece)
+    assert "".join(pieces) == df.to_csv(header=False, index=False)
+
+
+def test_postgres_copy_streams_nulls_as_backslash_n():
+    class _Cursor:
+        def copy_expert(self, stmt, stream):
+            self.stmt = stmt
+            self.body = stream.read()
+
+    class _Conn:
+        def __init__(self):
+            self.cursor_ = _Cursor()
+            self.committed = self.closed = False
+
+        def cursor(self):
+            return self.cursor_
+
+        def commit(self):
+            self.committed = True
+
+        def close(self):
+            self.closed = True
+
+    conn = _Conn()
+    engine = sqlalchemy.create_engine("postgresql+psycopg2://")
+    engine.raw_connection = lambda: conn
+    df = pd.DataFrame({"id": [1, 2], "v": ["a", None]})
+
+    assert sql.to_sql_postgres_copy(df, engine, "s", "t", batch_rows=1) == 2
+    assert conn.cursor_.stmt == (
+        "COPY s.t (id, v) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    assert conn.cursor_.body == "1,a\n2,\\N\n"
+    assert conn.committed and conn.closed
+
+
+class _FakeCursor:
+    def __init__(self, batch_errors=()):
+        self.batch_errors = list(batch_errors)
+        self.input_sizes = []
+        self.calls = []
+
+    def setinputsizes(self, *sizes):
+        self.input_sizes.append(sizes)
+
+    def executemany(self, stmt, rows, **kwargs):
+        self.calls.append((stmt, list(rows), kwargs))
+
+    def getbatcherrors(self):
+        errors, self.batch_errors = self.batch_errors, []
+        return errors
+
+
+class _FakeRawConn:
+    def __init__(self, cursor):
+        self.cursor_ = cursor
+        self.committed = self.closed = False
+
+    def cursor(self):
+        return self.cursor_
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def test_mssql_input_sizes_by_dtype():
+    pyodbc = sql.pyodbc
+    dtypes = {
+        "s": sqlalchemy.String(20),
+        "i": sqlalchemy.Integer,
+        "b": sqlalchemy.BigInteger(),
+        "f": sqlalchemy.Float(),
+        "d": sqlalchemy.DateTime(),
+    }
+    assert sql._mssql_input_sizes(dtypes, list(dtypes)) == [
+        (pyodbc.SQL_WVARCHAR, 20, 0),
+        (pyodbc.SQL_INTEGER, 0, 0),
+        (pyodbc.SQL_BIGINT, 0, 0),
+        (pyodbc.SQL_DOUBLE, 0, 0),
+        (pyodbc.SQL_TYPE_TIMESTAMP, 27, 7),
+    ]
+    ## Unbounded strings would be declared as nvarchar(max)
+    assert sql._mssql_input_sizes({"s": sqlalchemy.String()}, ["s"]) is None
+    assert sql._mssql_input_sizes({"i": sqlalchemy.Integer()}, ["i", "x"]) is None
+
+
+def test_mssql_fast_executemany_sets_cursor_flag():
+    cursor = _FakeCursor()
+    conn = _FakeRawConn(cursor)
+    engine = SimpleNamespace(
+        dialect=SimpleNamespace(name="mssql", driver="pyodbc"),
+        raw_connection=lambda: conn,
+    )
+    df = pd.DataFrame({"id": [1, 2, 3], "v": ["a", "b", None]})
+    dtypes = {"id": sqlalchemy.Integer(), "v": sqlalchemy.String(5)}
+
+    rows = sql.to_sql_mssql_fast(df, engine, "dbo", "t", dtypes, batch_rows=2)
+
+    assert rows == 3
+    assert cursor.fast_executemany is True
+    assert cursor.input_sizes == [
+        ([(sql.pyodbc.SQL_INTEGER, 0, 0), (sql.pyodbc.SQL_WVARCHAR, 5, 0)],)
+    ]
+    assert [call[1] for call in cursor.calls] == [
+        [(1, "a"), (2, "b")],
+        [(3, None)],
+    ]
+    assert cursor.calls[0][0] == "INSERT INTO dbo.t (id,v) VALUES (?,?)"
+    assert conn.committed and conn.closed
+
+
+def test_oracle_array_logs_batch_errors_and_commits_the_rest(monkeypatch, caplog):
+    ## The second batch has one rejected row at offset 1
+    cursor = _FakeCursor()
+    batches = [[], [SimpleNamespace(offset=1, message="ORA-00001")]]
+    cursor.getbatcherrors = lambda: batches.pop(0)
+    conn = _FakeRawConn(cursor)
+    monkeypatch.setattr(sql, "create_oracle_conn", lambda conn_dict, **kw: conn)
+    df = pd.DataFrame({"id": [1, 2, 3, 4], "v": ["a", "b", "c", "d"]})
+    dtypes = {"id": sqlalchemy.Integer(), "v": sqlalchemy.String(10)}
+
+    with caplog.at_level("WARNING", logger="etl_tools.sql"):
+        rows = sql.to_sql_oracle_array(df, {}, "s", "t", dtypes, batch_rows=2)
+
+    assert rows == 3
+    assert conn.committed
+    assert cursor.input_sizes == [(sql.oracledb.DB_TYPE_NUMBER, 10)] * 2
+    assert all(call[2] == {"batcherrors": True} for call in cursor.calls)
+    assert cursor.calls[0][0] == "INSERT INTO s.t (id,v) VALUES (:1,:2)"
+    assert "Row 3 rejected by s.t -> ORA-00001" in caplog.text
+    assert "1 of 4 row(s) rejected" in caplog.text
+
+
+class _FakeS3:
+    def __init__(self):
+        self.objects = {}
+        self.deleted = []
+
+    def put(self, body, bucket, path, *args, **kwargs):
+        self.objects[f"s3://{bucket}/{path}"] = body
+
+    def delete(self, bucket, paths, *args, **kwargs):
+        self.deleted.extend(f"s3://{bucket}/{path}" for path in paths)
+        return len(paths)
+
+
+_REDSHIFT_CONN = {
+    "s3_staging_path": "s3://bucket/stage/",
+    "iam_role": "arn:aws:iam::1:role/copy",
+    "s3_staging_format": "csv",
+}
+
+
+def _fake_redshift_copy(monkeypatch, exec_stmt):
+    s3 = _FakeS3()
+    monkeypatch.setattr(sql, "s3_put_object", s3.put)
+    monkeypatch.setattr(sql, "s3_delete_objects", s3.delete)
+    monkeypatch.setattr(sql, "sql_exec_stmt", exec_stmt)
+    return s3
+
+
+def _copy_frame():
+    return pd.DataFrame({"id": [1, 2, 3], "v": ["a", None, "c"]})
+
+
+def test_redshift_copy_stages_manifest_and_cleans_up(monkeypatch):
+    stmts = []
+    s3 = _fake_redshift_copy(
+        monkeypatch, lambda stmt, conn_dict, **kw: stmts.append(stmt)
+    )
+
+    rows = sql.to_sql_redshift_copy(
+        _copy_frame(), _REDSHIFT_CONN, "s", "t", part_rows=2
+    )
+
+    assert rows == 3
+    manifest_url = next(url for url in s3.objects if url.endswith("manifest.json"))
+    run_prefix = manifest_url[: -len("manifest.json")]
+    assert run_prefix.startswith("s3://bucket/stage/s.t/")
+    entries = json.loads(s3.objects[manifest_url])["entries"]
+    assert [entry["url"] for entry in entries] == [
+        f"{run_prefix}part-00000.csv.gz",
+        f"{run_prefix}part-00001.csv.gz",
+    ]
+    for entry in entries:
+        assert entry["mandatory"] is True
+        assert entry["meta"]["content_length"] == len(s3.objects[entry["url"]])
+    assert gzip.decompress(s3.objects[entries[0]["url"]]) == b"1,a\n2,\\N\n"
+    assert stmts == [
+        f"COPY s.t (id,v) FROM '{manifest_url}' "
+        "IAM_ROLE 'arn:aws:iam::1:role/copy' REGION 'us-east-1' "
+        "FORMAT AS CSV GZIP NULL AS '\\N' MANIFEST;"
+    ]
+    assert sorted(s3.deleted) == sorted(s3.objects)
+
+
+def test_redshift_copy_deletes_staged_objects_on_failure(monkeypatch):
+    def _fail(stmt, conn_dict, **kwargs):
+        raise ConnectionError("copy failed")
+
+    s3 = _fake_redshift_copy(monkeypatch, _fail)
+
+    with pytest.raises(ConnectionError):
+        sql.to_sql_redshift_copy(
+            _copy_frame(), _REDSHIFT_CONN, "s", "t", part_rows=2
+        )
+    assert len(s3.objects) == 3
+    assert sorted(s3.deleted) == sorted(s3.objects)
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [{}, {"aws_access_key": "AK"}, {"aws_secret_access_key": "SK"}],
+)
+def test_redshift_copy_requires_credentials_before_staging(monkeypatch, keys):
+    stmts = []
+    s3 = _fake_redshift_copy(
+        monkeypatch, lambda stmt, conn_dict, **kw: stmts.append(stmt)
+    )
+    conn_dict = {k: v for k, v in _REDSHIFT_CONN.items() if k != "iam_role"}
+
+    with pytest.raises(ValueError, match="iam_role"):
+        sql.to_sql_redshift_copy(_copy_frame(), {**conn_dict, **keys}, "s", "t")
+    assert s3.objects == {} and stmts == []
+
+    sql.to_sql_redshift_copy(
+        _copy_frame(),
+        {**conn_dict, "aws_access_key": "AK", "aws_secret_access_key": "SK"},
+        "s",
+        "t",
+    )
+    assert "ACCESS_KEY_ID 'AK' SECRET_ACCESS_KEY 'SK'" in stmts[0]
+
+
+def test_row_batches_convert_missing_values_and_numpy_scalars():
+    df = pd.DataFrame(
+        {
+            "i": [1, 2, 3, 4, 5],
+            "f": [0.5, float("nan"), 1.5, None, 2.5],
+            "s": ["a", None, "c", float("nan"), "e"],
+            "b": [True, False, True, False, True],
+        }
+    )
+
+    batches = list(sql._iter_row_batches(df, 2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    rows = [row for batch in batches for row in batch]
+    assert rows == [
+        (1, 0.5, "a", True),
+        (2, None, None, False),
+        (3, 1.5, "c", True),
+        (4, None, None, False),
+        (5, 2.5, "e", True),
+    ]
+    ## Drivers reject numpy scalars, so every value is a plain Python object
+    assert {type(value) for row in rows for value in row} == {
+        int, float, str, bool, type(None)
+    }
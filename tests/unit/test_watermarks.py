@@ -0,0 +1,57 @@
+import contextlib
+import datetime as dt
+import sqlite3
+
+from etl.watermarks import WatermarkStore
+
+
+def test_set_get_and_delete(tmp_path):
+    store = WatermarkStore(str(tmp_path / "state" / "wm.db"))
+    assert store.get("orders") is None
+
+    assert store.set("orders", "updated_at", dt.datetime(2024, 1, 2, 3, 4, 5)) == (
+        "2024-01-02 03:04:05"
+    )
+    assert store.get("orders") == "2024-01-02 03:04:05"
+    store.set("orders", "updated_at", dt.datetime(2024, 2, 1))
+    assert store.get("orders") == "2024-02-01 00:00:00"
+
+    store.delete("orders")
+    assert store.get("orders") is None
+
+
+def test_values_are_rendered_by_type(tmp_path):
+    store = WatermarkStore(str(tmp_path / "wm.db"))
+    assert store.set("a", "id", 42) == "42"
+    assert store.set("b", "day", dt.date(2024, 5, 6)) == "2024-05-06"
+    assert store.set("c", "code", "X-1") == "X-1"
+
+
+def test_namespaces_are_isolated(tmp_path):
+    path = str(tmp_path / "wm.db")
+    WatermarkStore(path, namespace="one").set("orders", "id", 1)
+    assert WatermarkStore(path, namespace="two").get("orders") is None
+    assert WatermarkStore(path, namespace="one").get("orders") == "1"
+
+
+def test_writes_are_committed_and_connections_closed(tmp_path, monkeypatch):
+    path = str(tmp_path / "wm.db")
+    opened = []
+    connect = sqlite3.connect
+
+    def _connect(*args, **kwargs):
+        opened.append(connect(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(sqlite3, "connect", _connect)
+    WatermarkStore(path).set("orders", "id", 7)
+    monkeypatch.undo()
+
+    with contextlib.closing(sqlite3.connect(path)) as conn:
+        assert conn.execute("SELECT value FROM watermarks").fetchall() == [("7",)]
+    for conn in opened:
+        try:
+            conn.execute("SELECT 1")
+        except sqlite3.ProgrammingError:
+            continue
+        raise AssertionError("connection left open")